@@ -8,23 +8,30 @@ import importlib.metadata
 import uuid
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import anyio.to_thread
 import structlog
 from fastapi import Depends, FastAPI, Header, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from devops_control_tower import __version__
 
 from .auth import verify_api_key
 from .config import get_settings
 from .core.enhanced_orchestrator import EnhancedOrchestrator
+from .cwom import rebuild_models as rebuild_cwom_models
+from .cwom.primitives import request_now
 from .cwom.routes import router as cwom_router
 from .cwom.task_adapter import task_to_cwom
 from .data.models.events import Event, EventPriority, EventTypes
 from .db.audit_service import AuditService
+from .db.audit_writer import close_audit_writer
 from .db.base import get_db, init_database
 from .db.services import (
     ArtifactService,
@@ -54,6 +61,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Starting DevOps Control Tower")
 
     try:
+        # Build deferred CWOM schemas before serving traffic
+        rebuild_cwom_models(
+            strip_descriptions=not settings.cwom_schema_descriptions
+        )
+
+        # Size the threadpool that runs sync DB-bound route handlers
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            settings.api_threadpool_size
+        )
+
         # Initialize database
         await init_database()
         logger.info("Database initialized")
@@ -79,6 +96,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info("Shutting down DevOps Control Tower")
     if orchestrator:
         await orchestrator.stop()
+    await anyio.to_thread.run_sync(close_audit_writer)
     logger.info("Shutdown complete")
 
 
@@ -87,6 +105,7 @@ app = FastAPI(
     description="Centralized command center for AI-powered development operations",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -100,6 +119,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+class RequestClockMiddleware:
+    """Evaluate the clock once per HTTP request for CWOM timestamp defaults.
+
+    The pin covers every write in the request, not just creates: all CWOM
+    objects created or updated by one request share the same created_at and
+    updated_at (audit entries keep their own clock). Keyset pagination breaks
+    such ties by id; code that needs distinct times within a request must
+    not take them from utc_now().
+
+    MCP is skipped: its SSE connection is long-lived and tool calls run
+    inside it, so a pinned timestamp would go stale.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith("/mcp"):
+            await self.app(scope, receive, send)
+            return
+        token = request_now.set(datetime.now(timezone.utc))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_now.reset(token)
+
+
+app.add_middleware(RequestClockMiddleware)
+
 # Include CWOM routes
 app.include_router(cwom_router)
 
@@ -395,6 +395,23 @@ Define your workflows in the `workflows/` directory.
     console.print("4. devops-tower start")
 
 
+@app.command()
+def audit_partitions(
+    months_ahead: int = typer.Option(3, help="Months to provision past this one"),
+):
+    """Create upcoming monthly audit_log partitions (PostgreSQL only)."""
+    from ..db.audit_partitions import ensure_audit_partitions
+    from ..db.base import get_engine
+
+    with get_engine().begin() as conn:
+        created = ensure_audit_partitions(conn, months_ahead=months_ahead)
+
+    if created:
+        console.print(f"✅ Created partitions: {', '.join(created)}")
+    else:
+        console.print("Nothing to do: partitions exist or audit_log is not partitioned")
+
+
 @app.command()
 def version():
     """Show version information."""
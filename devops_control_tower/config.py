@@ -20,11 +20,20 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", validation_alias="API_HOST")
     api_port: int = Field(default=8000, validation_alias="API_PORT")
     api_workers: int = Field(default=1, validation_alias="API_WORKERS")
+    api_threadpool_size: int = Field(
+        default=50,
+        validation_alias="API_THREADPOOL_SIZE",
+        description="Worker threads for sync (DB-bound) route handlers.",
+    )
 
     # Database
     database_url: str = Field(
         default="sqlite:///./devops_control_tower.db", validation_alias="DATABASE_URL"
     )
+    db_pool_size: int = Field(default=20, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=30, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: int = Field(default=30, validation_alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=3600, validation_alias="DB_POOL_RECYCLE")
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0", validation_alias="REDIS_URL")
@@ -108,6 +117,29 @@ class Settings(BaseSettings):
         description="Comma-separated verdicts that qualify for auto-approval.",
     )
 
+    # CWOM Schema Configuration
+    cwom_schema_descriptions: bool = Field(
+        default=True,
+        validation_alias="CWOM_SCHEMA_DESCRIPTIONS",
+        description="Keep field descriptions on CWOM models (used by OpenAPI docs).",
+    )
+    cwom_list_cache_ttl: int = Field(
+        default=0,
+        validation_alias="CWOM_LIST_CACHE_TTL",
+        description="Seconds to cache CWOM list responses in Redis (0 = off).",
+    )
+
+    # Audit log
+    audit_async: bool = Field(
+        default=False,
+        validation_alias="AUDIT_ASYNC",
+        description="Write audit entries from a background batch writer.",
+    )
+    audit_batch_size: int = Field(default=100, validation_alias="AUDIT_BATCH_SIZE")
+    audit_flush_interval: float = Field(
+        default=5.0, validation_alias="AUDIT_FLUSH_INTERVAL"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
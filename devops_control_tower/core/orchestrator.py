@@ -29,9 +29,15 @@ class Orchestrator:
     - Resource allocation and optimization
     """
 
+    # Most events taken off the queue per wake-up of the event loop
+    EVENT_BATCH_SIZE = 500
+
     def __init__(self) -> None:
         self.agents: Dict[str, BaseAgent] = {}
         self.workflows: Dict[str, Workflow] = {}
+        # event type -> {workflow name: workflow}, built at registration so an
+        # event only visits the workflows it can trigger
+        self._workflows_by_event: Dict[str, Dict[str, Workflow]] = {}
         self.running_tasks: Dict[str, asyncio.Task[Any]] = {}
         self.event_queue: asyncio.Queue[Event] = asyncio.Queue()
         self.is_running = False
@@ -82,7 +88,13 @@ class Orchestrator:
 
     def register_workflow(self, name: str, workflow: Workflow) -> None:
         """Register a workflow with the orchestrator."""
+        previous = self.workflows.get(name)
+        if previous is not None:
+            for event_type in previous.trigger_events:
+                self._workflows_by_event.get(event_type, {}).pop(name, None)
         self.workflows[name] = workflow
+        for event_type in workflow.trigger_events:
+            self._workflows_by_event.setdefault(event_type, {})[name] = workflow
         logger.info(f"Registered workflow: {name}")
 
     async def emit_event(self, event: Event) -> None:
@@ -116,15 +128,25 @@ class Orchestrator:
             try:
                 # Wait for an event with timeout
                 event = await asyncio.wait_for(self.event_queue.get(), timeout=1.0)
-
-                # Process the event
-                await self._handle_event(event)
-
             except asyncio.TimeoutError:
                 # No events to process, continue loop
                 continue
-            except Exception as e:
-                logger.error(f"Error processing event: {e}")
+
+            # Drain whatever else is already queued (up to a batch) without
+            # another wait_for, which wraps each get() in its own task
+            batch = [event]
+            while len(batch) < self.EVENT_BATCH_SIZE:
+                try:
+                    batch.append(self.event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            # Process the events in arrival order
+            for event in batch:
+                try:
+                    await self._handle_event(event)
+                except Exception as e:
+                    logger.error(f"Error processing event: {e}")
 
     async def _handle_event(self, event: Event) -> None:
         """Handle a single event by routing it to appropriate agents/workflows."""
@@ -139,7 +161,8 @@ class Orchestrator:
                     logger.error(f"Agent {agent_name} failed to handle event: {e}")
 
         # Check if any workflows should be triggered by this event
-        for workflow_name, workflow in self.workflows.items():
+        candidates = self._workflows_by_event.get(event.type, {})
+        for workflow_name, workflow in candidates.items():
             if workflow.is_triggered_by(event):
                 try:
                     # Execute workflow in background
@@ -19,6 +19,8 @@ Causality Chain:
 Spec: docs/cwom/cwom-spec-v0.1.md
 """
 
+from pydantic import BaseModel
+
 from .artifact import Artifact, ArtifactCreate
 from .constraint_snapshot import ConstraintSnapshot, ConstraintSnapshotCreate
 from .context_packet import ContextPacket, ContextPacketCreate
@@ -27,24 +29,35 @@ from .doctrine_ref import DoctrineRef, DoctrineRefCreate
 # Enums
 from .enums import (
     ActorKind,
+    ActorKindValue,
     ArtifactType,
+    ArtifactTypeValue,
     CheckStatus,
     Connectivity,
     ConstraintScope,
     CriterionStatus,
+    CriterionStatusValue,
     DoctrinePriority,
+    DoctrinePriorityValue,
     DoctrineType,
+    DoctrineTypeValue,
     FailureCategory,
     IssueType,
+    IssueTypeValue,
     ObjectKind,
     Priority,
+    PriorityValue,
     ReviewDecisionStatus,
+    ReviewDecisionStatusValue,
     RiskTolerance,
     RunMode,
     Status,
+    StatusValue,
     Verdict,
+    VerdictValue,
     VerificationStatus,
     Visibility,
+    VisibilityValue,
 )
 from .evidence_pack import (
     CriterionResult,
@@ -94,6 +107,31 @@ from .run import Run, RunCreate, RunUpdate
 
 __version__ = "0.1"
 
+
+def rebuild_models(strip_descriptions: bool = False) -> None:
+    """Build the core schemas of all CWOM models.
+
+    CWOM models are declared with ``defer_build=True`` so importing the
+    package stays cheap. Call this once at application startup so the first
+    request does not pay the schema build cost.
+
+    Args:
+        strip_descriptions: Drop ``Field(description=...)`` metadata before
+            building. Saves memory in deployments that never serve OpenAPI
+            docs; the generated JSON schemas lose their field descriptions.
+    """
+    for name in __all__:
+        obj = globals()[name]
+        if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+            continue
+        if strip_descriptions:
+            for field in obj.model_fields.values():
+                field.description = None
+            obj.model_rebuild(force=True)
+        else:
+            obj.model_rebuild()
+
+
 __all__ = [
     # Version
     "__version__",
@@ -114,6 +152,17 @@ __all__ = [
     "RiskTolerance",
     "FailureCategory",
     "CheckStatus",
+    "StatusValue",
+    "IssueTypeValue",
+    "PriorityValue",
+    "ArtifactTypeValue",
+    "DoctrineTypeValue",
+    "DoctrinePriorityValue",
+    "VisibilityValue",
+    "ActorKindValue",
+    "VerdictValue",
+    "CriterionStatusValue",
+    "ReviewDecisionStatusValue",
     # Primitives
     "Actor",
     "Source",
@@ -144,6 +193,7 @@ __all__ = [
     "RunInputs",
     "generate_ulid",
     "utc_now",
+    "rebuild_models",
     # Object types
     "Repo",
     "RepoCreate",
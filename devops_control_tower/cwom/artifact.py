@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import ArtifactType
+from .enums import ArtifactTypeValue
 from .primitives import Ref, Verification, generate_ulid, utc_now
 
 
@@ -23,7 +23,7 @@ class Artifact(BaseModel):
     - Artifact SHOULD be retrievable by uri and/or verifiable by digest.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["Artifact"] = Field(
@@ -38,7 +38,7 @@ class Artifact(BaseModel):
     for_issue: Ref = Field(..., description="Reference to the Issue this is for")
 
     # Content
-    type: ArtifactType = Field(..., description="Type of artifact")
+    type: ArtifactTypeValue = Field(..., description="Type of artifact")
     title: constr(min_length=1, max_length=512) = Field(
         ..., description="Artifact title"
     )
@@ -82,11 +82,14 @@ class Artifact(BaseModel):
 class ArtifactCreate(BaseModel):
     """Schema for creating a new Artifact."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     produced_by: Ref
     for_issue: Ref
-    type: ArtifactType
+    type: ArtifactTypeValue
     title: constr(min_length=1, max_length=512)
     uri: constr(min_length=1, max_length=2000)
     digest: Optional[constr(min_length=1, max_length=128)] = None
@@ -23,7 +23,7 @@ class ConstraintSnapshot(BaseModel):
     - To update constraints, create a new snapshot.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["ConstraintSnapshot"] = Field(
@@ -58,8 +58,11 @@ class ConstraintSnapshot(BaseModel):
 class ConstraintSnapshotCreate(BaseModel):
     """Schema for creating a new ConstraintSnapshot."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     scope: ConstraintScope
     owner: Actor
     constraints: Constraints = Field(default_factory=Constraints)
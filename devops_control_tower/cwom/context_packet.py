@@ -22,7 +22,7 @@ class ContextPacket(BaseModel):
     - New info requires creating a new ContextPacket with a new version.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["ContextPacket"] = Field(
@@ -87,8 +87,11 @@ class ContextPacket(BaseModel):
 class ContextPacketCreate(BaseModel):
     """Schema for creating a new ContextPacket."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     for_issue: Ref
     version: constr(min_length=1, max_length=64)
     summary: constr(min_length=1, max_length=4000)
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import DoctrinePriority, DoctrineType
+from .enums import DoctrinePriority, DoctrinePriorityValue, DoctrineTypeValue
 from .primitives import DoctrineApplicability, generate_ulid, utc_now
 
 
@@ -23,7 +23,7 @@ class DoctrineRef(BaseModel):
     - Consumers MUST reference a specific version when reproducibility matters.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["DoctrineRef"] = Field(
@@ -41,9 +41,9 @@ class DoctrineRef(BaseModel):
     version: constr(min_length=1, max_length=64) = Field(
         ..., description="Version string"
     )
-    type: DoctrineType = Field(..., description="Type of doctrine")
-    priority: DoctrinePriority = Field(
-        DoctrinePriority.SHOULD, description="How binding this doctrine is"
+    type: DoctrineTypeValue = Field(..., description="Type of doctrine")
+    priority: DoctrinePriorityValue = Field(
+        DoctrinePriority.SHOULD.value, description="How binding this doctrine is"
     )
 
     # Content
@@ -84,13 +84,16 @@ class DoctrineRef(BaseModel):
 class DoctrineRefCreate(BaseModel):
     """Schema for creating a new DoctrineRef."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     namespace: constr(min_length=1, max_length=128)
     name: constr(min_length=1, max_length=256)
     version: constr(min_length=1, max_length=64)
-    type: DoctrineType
-    priority: DoctrinePriority = DoctrinePriority.SHOULD
+    type: DoctrineTypeValue
+    priority: DoctrinePriorityValue = DoctrinePriority.SHOULD.value
     statement: constr(min_length=1, max_length=4000)
     rationale: Optional[constr(max_length=4000)] = None
     links: List[str] = Field(default_factory=list)
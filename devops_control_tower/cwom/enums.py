@@ -6,6 +6,7 @@ Adapters MUST map tool-specific values into these canonical sets.
 """
 
 from enum import Enum
+from typing import Literal
 
 
 class ObjectKind(str, Enum):
@@ -194,3 +195,48 @@ class ReviewDecisionStatus(str, Enum):
     APPROVED = "approved"
     REJECTED = "rejected"
     NEEDS_CHANGES = "needs_changes"
+
+
+# =============================================================================
+# Literal value sets
+# =============================================================================
+# Hot model fields are typed with these Literals instead of the Enum classes:
+# pydantic validates a Literal with a direct lookup against the allowed
+# strings, which is cheaper than Enum coercion. The Enum classes above remain
+# the named constants (``Status.PLANNED == "planned"``) and must stay in sync.
+
+StatusValue = Literal[
+    "planned",
+    "ready",
+    "running",
+    "blocked",
+    "done",
+    "failed",
+    "canceled",
+    "under_review",
+]
+IssueTypeValue = Literal[
+    "feature", "bug", "chore", "research", "ops", "doc", "incident"
+]
+PriorityValue = Literal["P0", "P1", "P2", "P3", "P4"]
+ArtifactTypeValue = Literal[
+    "code_patch",
+    "commit",
+    "pr",
+    "build",
+    "container_image",
+    "doc",
+    "report",
+    "dataset",
+    "log",
+    "trace",
+    "binary",
+    "link",
+]
+DoctrineTypeValue = Literal["principle", "policy", "procedure", "heuristic", "pattern"]
+DoctrinePriorityValue = Literal["must", "should", "may"]
+VisibilityValue = Literal["public", "private", "internal"]
+ActorKindValue = Literal["human", "agent", "system"]
+VerdictValue = Literal["pass", "fail", "partial", "pending"]
+CriterionStatusValue = Literal["satisfied", "not_satisfied", "unverified", "skipped"]
+ReviewDecisionStatusValue = Literal["approved", "rejected", "needs_changes"]
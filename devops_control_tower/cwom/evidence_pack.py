@@ -12,21 +12,21 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import CriterionStatus, Verdict
+from .enums import CriterionStatusValue, VerdictValue
 from .primitives import Actor, Ref, generate_ulid, utc_now
 
 
 class CriterionResult(BaseModel):
     """Result of evaluating a single acceptance criterion."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # The criterion text (from task's acceptance_criteria)
     criterion: str = Field(..., description="The acceptance criterion being evaluated")
     index: int = Field(..., ge=0, description="Index in the original criteria list")
 
     # Evaluation result
-    status: CriterionStatus = Field(
+    status: CriterionStatusValue = Field(
         ..., description="Whether this criterion was satisfied"
     )
     reason: Optional[str] = Field(
@@ -43,7 +43,7 @@ class CriterionResult(BaseModel):
 class EvidenceItem(BaseModel):
     """An item of evidence collected to prove work completion."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # What was required
     requirement: str = Field(
@@ -74,7 +74,7 @@ class EvidencePack(BaseModel):
     v1+: LLM-based evaluation of acceptance criteria
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["EvidencePack"] = Field(
@@ -89,7 +89,7 @@ class EvidencePack(BaseModel):
     for_issue: Ref = Field(..., description="Reference to the Issue")
 
     # Verdict
-    verdict: Verdict = Field(..., description="Overall proof outcome")
+    verdict: VerdictValue = Field(..., description="Overall proof outcome")
     verdict_reason: str = Field(..., description="Explanation of the verdict")
 
     # Evaluation details
@@ -148,11 +148,11 @@ class EvidencePack(BaseModel):
 class EvidencePackCreate(BaseModel):
     """Schema for creating a new EvidencePack."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     for_run: Ref
     for_issue: Ref
-    verdict: Verdict
+    verdict: VerdictValue
     verdict_reason: str
     evaluated_by: Actor
     criteria_results: List[CriterionResult] = Field(default_factory=list)
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import IssueType, Priority, Status
+from .enums import IssueTypeValue, Priority, PriorityValue, Status, StatusValue
 from .primitives import (
     Acceptance,
     Actor,
@@ -30,7 +30,7 @@ class Issue(BaseModel):
     - Runs SHOULD link back to Issue; Issue MAY store Run refs for convenience.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["Issue"] = Field(
@@ -48,9 +48,9 @@ class Issue(BaseModel):
     description: constr(max_length=16000) = Field(
         "", description="Detailed description"
     )
-    type: IssueType = Field(..., description="Issue type")
-    priority: Priority = Field(Priority.P2, description="Priority level")
-    status: Status = Field(Status.PLANNED, description="Current status")
+    type: IssueTypeValue = Field(..., description="Issue type")
+    priority: PriorityValue = Field(Priority.P2.value, description="Priority level")
+    status: StatusValue = Field(Status.PLANNED.value, description="Current status")
 
     # People
     assignees: List[Actor] = Field(default_factory=list, description="Assigned actors")
@@ -101,14 +101,17 @@ class Issue(BaseModel):
 class IssueCreate(BaseModel):
     """Schema for creating a new Issue."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     repo: Ref
     title: constr(min_length=1, max_length=512)
     description: constr(max_length=16000) = ""
-    type: IssueType
-    priority: Priority = Priority.P2
-    status: Status = Status.PLANNED
+    type: IssueTypeValue
+    priority: PriorityValue = Priority.P2.value
+    status: StatusValue = Status.PLANNED.value
     assignees: List[Actor] = Field(default_factory=list)
     watchers: List[Actor] = Field(default_factory=list)
     doctrine_refs: List[Ref] = Field(default_factory=list)
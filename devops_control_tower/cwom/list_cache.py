@@ -0,0 +1,120 @@
+"""
+Redis-backed cache for CWOM list responses.
+
+Dashboards poll the Repo/Issue/Run/DoctrineRef list endpoints far more often
+than those objects change. Each response is cached as encoded JSON under a key
+derived from the entity and its query parameters, and every key is recorded in
+a per-entity tag set so a mutation can drop all cached pages for that entity.
+Sessions invalidate the entities they wrote when they commit (see the
+listeners at the end of ``db.cwom_models``), whichever code path did the write.
+
+Disabled unless CWOM_LIST_CACHE_TTL is positive. Redis errors are logged and
+treated as a miss, so an unavailable Redis only costs the cache.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "cwom:list"
+
+
+class ListCache:
+    """Cache of encoded list payloads with tag-set invalidation per entity."""
+
+    __slots__ = ("redis_url", "ttl", "_client")
+
+    def __init__(self, redis_url: str, ttl: int) -> None:
+        self.redis_url = redis_url
+        self.ttl = ttl
+        self._client: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _redis(self) -> Any:
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.redis_url)
+        return self._client
+
+    @staticmethod
+    def _key(entity: str, params: Dict[str, Any]) -> str:
+        digest = hashlib.sha1(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        return f"{_KEY_PREFIX}:{entity}:{digest}"
+
+    def get(
+        self, entity: str, params: Dict[str, Any]
+    ) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return the cached ``(body, next_cursor)`` for a page, or None."""
+        if not self.enabled:
+            return None
+        try:
+            value: Optional[bytes] = self._redis().get(self._key(entity, params))
+        except Exception as exc:
+            logger.warning("CWOM list cache read failed: %s", exc)
+            return None
+        if value is None:
+            return None
+        # Stored as b"<cursor>\n<body>"; cursors are base64 and never contain \n
+        cursor, _, body = value.partition(b"\n")
+        return body, cursor.decode() or None
+
+    def put(
+        self,
+        entity: str,
+        params: Dict[str, Any],
+        payload: List[Dict[str, Any]],
+        next_cursor: Optional[str] = None,
+    ) -> bytes:
+        """Encode ``payload``, cache it when enabled, and return the bytes."""
+        body = orjson.dumps(payload)
+        if not self.enabled:
+            return body
+        key = self._key(entity, params)
+        tag = f"{_KEY_PREFIX}:{entity}:keys"
+        value = (next_cursor or "").encode() + b"\n" + body
+        try:
+            pipe = self._redis().pipeline()
+            pipe.set(key, value, ex=self.ttl)
+            pipe.sadd(tag, key)
+            pipe.expire(tag, self.ttl)
+            pipe.execute()
+        except Exception as exc:
+            logger.warning("CWOM list cache write failed: %s", exc)
+        return body
+
+    def invalidate(self, *entities: str) -> None:
+        """Drop every cached page for the given entities."""
+        if not self.enabled:
+            return
+        try:
+            client = self._redis()
+            for entity in entities:
+                tag = f"{_KEY_PREFIX}:{entity}:keys"
+                keys = client.smembers(tag)
+                client.delete(tag, *keys)
+        except Exception as exc:
+            logger.warning("CWOM list cache invalidation failed: %s", exc)
+
+
+_list_cache: Optional[ListCache] = None
+
+
+def get_list_cache() -> ListCache:
+    """Return the process-wide ListCache, built from settings on first use."""
+    global _list_cache
+    if _list_cache is None:
+        from ..config import get_settings
+
+        settings = get_settings()
+        _list_cache = ListCache(settings.redis_url, settings.cwom_list_cache_ttl)
+    return _list_cache
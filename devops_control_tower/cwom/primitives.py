@@ -6,33 +6,45 @@ These are the building blocks used across all CWOM object types.
 
 from __future__ import annotations
 
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import ActorKind, ObjectKind
+from .enums import ActorKindValue, ObjectKind
+
+try:
+    from ulid import ULID as _new_id
+except ImportError:  # pragma: no cover - python-ulid is a declared dependency
+    from uuid import uuid4 as _new_id
 
 
 def generate_ulid() -> str:
     """Generate a ULID for object IDs.
 
     ULIDs are lexicographically sortable and globally unique.
-    Falls back to UUID4 if ulid package is not available.
+    Falls back to UUID4 if ulid package is not available. The generator is
+    resolved once at import so the per-call cost is just the constructor.
     """
-    try:
-        from ulid import ULID
+    return str(_new_id())
+
 
-        return str(ULID())
-    except ImportError:
-        import uuid
+_UTC = timezone.utc
 
-        return str(uuid.uuid4())
+# Set per HTTP request by the API's RequestClockMiddleware.
+request_now: ContextVar[Optional[datetime]] = ContextVar(
+    "cwom_request_now", default=None
+)
 
 
 def utc_now() -> datetime:
-    """Return current UTC time as timezone-aware datetime."""
-    return datetime.now(timezone.utc)
+    """Return current UTC time as timezone-aware datetime.
+
+    Inside an API request this is the request's start time, so every object
+    created or updated by one request shares a single timestamp.
+    """
+    return request_now.get() or datetime.now(_UTC)
 
 
 class Actor(BaseModel):
@@ -41,9 +53,9 @@ class Actor(BaseModel):
     Used for audit trails and attribution across CWOM objects.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
-    actor_kind: ActorKind = Field(
+    actor_kind: ActorKindValue = Field(
         ..., description="Type of actor: human, agent, or system"
     )
     actor_id: constr(min_length=1, max_length=128) = Field(
@@ -60,7 +72,7 @@ class Source(BaseModel):
     Used to track where objects originated or are synchronized with.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     system: constr(min_length=1, max_length=64) = Field(
         ..., description="External system name (e.g., 'github', 'linear', 'jira')"
@@ -81,7 +93,7 @@ class Ref(BaseModel):
     - role is optional semantic labeling (e.g., 'primary_context', 'governing_doctrine')
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     kind: ObjectKind = Field(..., description="The type of object being referenced")
     id: constr(min_length=1, max_length=128) = Field(
@@ -95,7 +107,7 @@ class Ref(BaseModel):
 class Document(BaseModel):
     """A document reference within a ContextPacket."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     title: constr(min_length=1, max_length=256) = Field(
         ..., description="Document title"
@@ -114,7 +126,7 @@ class Document(BaseModel):
 class DataBlob(BaseModel):
     """A data blob within a ContextPacket."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     name: constr(min_length=1, max_length=256) = Field(..., description="Blob name")
     media_type: constr(min_length=1, max_length=128) = Field(
@@ -134,7 +146,7 @@ class DataBlob(BaseModel):
 class VerificationCheck(BaseModel):
     """An individual verification check result."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     name: constr(min_length=1, max_length=128) = Field(..., description="Check name")
     status: Literal["passed", "failed", "unverified"] = Field(
@@ -148,7 +160,7 @@ class VerificationCheck(BaseModel):
 class TimeConstraint(BaseModel):
     """Time-related constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     available_minutes: Optional[int] = Field(
         None, ge=0, description="Minutes available for work"
@@ -159,7 +171,7 @@ class TimeConstraint(BaseModel):
 class EnergyConstraint(BaseModel):
     """Energy/capacity constraints (for human actors)."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     score_0_5: Optional[int] = Field(None, ge=0, le=5, description="Energy level 0-5")
     notes: Optional[constr(max_length=500)] = Field(
@@ -170,7 +182,7 @@ class EnergyConstraint(BaseModel):
 class HealthConstraint(BaseModel):
     """Health-related constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     flags: List[str] = Field(default_factory=list, description="Health flags")
     notes: Optional[constr(max_length=500)] = Field(
@@ -181,7 +193,7 @@ class HealthConstraint(BaseModel):
 class BudgetConstraint(BaseModel):
     """Budget constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     usd_available: Optional[float] = Field(
         None, ge=0, description="Available budget in USD"
@@ -194,7 +206,7 @@ class BudgetConstraint(BaseModel):
 class ToolsConstraint(BaseModel):
     """Tool availability constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     allowed: List[str] = Field(default_factory=list, description="Allowed tools")
     blocked: List[str] = Field(default_factory=list, description="Blocked tools")
@@ -203,7 +215,7 @@ class ToolsConstraint(BaseModel):
 class EnvironmentConstraint(BaseModel):
     """Environment constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     location: Optional[constr(max_length=128)] = Field(
         None, description="Physical/logical location"
@@ -219,7 +231,7 @@ class EnvironmentConstraint(BaseModel):
 class RiskConstraint(BaseModel):
     """Risk tolerance constraints."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     tolerance: Literal["low", "medium", "high"] = Field(
         "medium", description="Risk tolerance level"
@@ -230,7 +242,7 @@ class RiskConstraint(BaseModel):
 class Constraints(BaseModel):
     """Full constraint set for a ConstraintSnapshot."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     time: Optional[TimeConstraint] = Field(None, description="Time constraints")
     energy: Optional[EnergyConstraint] = Field(None, description="Energy constraints")
@@ -246,7 +258,7 @@ class Constraints(BaseModel):
 class Acceptance(BaseModel):
     """Acceptance criteria for an Issue."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     criteria: List[str] = Field(
         default_factory=list, description="Acceptance criteria statements"
@@ -259,7 +271,7 @@ class Acceptance(BaseModel):
 class IssueRelationships(BaseModel):
     """Relationships between Issues."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     parent: Optional[Ref] = Field(None, description="Parent issue")
     blocks: List[Ref] = Field(default_factory=list, description="Issues this blocks")
@@ -272,7 +284,7 @@ class IssueRelationships(BaseModel):
 class Executor(BaseModel):
     """Information about who/what is executing a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     actor: Actor = Field(..., description="The actor performing the run")
     runtime: constr(min_length=1, max_length=64) = Field(
@@ -286,7 +298,7 @@ class Executor(BaseModel):
 class RunPlan(BaseModel):
     """Execution plan for a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     steps: List[str] = Field(default_factory=list, description="Planned steps")
     risk_notes: List[str] = Field(
@@ -297,7 +309,7 @@ class RunPlan(BaseModel):
 class Telemetry(BaseModel):
     """Execution telemetry for a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     started_at: Optional[datetime] = Field(None, description="Run start time (UTC)")
     ended_at: Optional[datetime] = Field(None, description="Run end time (UTC)")
@@ -307,7 +319,7 @@ class Telemetry(BaseModel):
 class Cost(BaseModel):
     """Cost tracking for a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     usd: Optional[float] = Field(None, ge=0, description="Cost in USD")
     tokens: Optional[int] = Field(None, ge=0, description="Tokens consumed")
@@ -317,7 +329,7 @@ class Cost(BaseModel):
 class RunOutputs(BaseModel):
     """Outputs from a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     artifacts: List[Ref] = Field(
         default_factory=list, description="References to produced artifacts"
@@ -333,7 +345,7 @@ class RunOutputs(BaseModel):
 class Failure(BaseModel):
     """Failure information for a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     category: Literal[
         "policy", "build", "test", "runtime", "dependency", "unknown"
@@ -346,7 +358,7 @@ class Failure(BaseModel):
 class Verification(BaseModel):
     """Verification status for an Artifact."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     status: Literal["unverified", "passed", "failed"] = Field(
         "unverified", description="Overall verification status"
@@ -359,7 +371,7 @@ class Verification(BaseModel):
 class RepoPolicy(BaseModel):
     """Policy settings for a Repo."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     allowed_tools: List[str] = Field(
         default_factory=list, description="Tools allowed in this repo"
@@ -372,7 +384,7 @@ class RepoPolicy(BaseModel):
 class DoctrineApplicability(BaseModel):
     """Defines where a DoctrineRef applies."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     repo_refs: List[Ref] = Field(
         default_factory=list, description="Repos where this applies"
@@ -386,7 +398,7 @@ class DoctrineApplicability(BaseModel):
 class ContextInputs(BaseModel):
     """Input documents and data for a ContextPacket."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     documents: List[Document] = Field(
         default_factory=list, description="Reference documents"
@@ -398,7 +410,7 @@ class ContextInputs(BaseModel):
 class RunInputs(BaseModel):
     """Inputs to a Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     context_packets: List[Ref] = Field(
         default_factory=list, description="Context packets consumed"
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import Visibility
+from .enums import Visibility, VisibilityValue
 from .primitives import Actor, Ref, RepoPolicy, Source, generate_ulid, utc_now
 
 
@@ -22,7 +22,7 @@ class Repo(BaseModel):
     - slug MUST remain stable even if name changes.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["Repo"] = Field(default="Repo", description="Object type identifier")
@@ -41,8 +41,8 @@ class Repo(BaseModel):
     default_branch: constr(min_length=1, max_length=128) = Field(
         "main", description="Default branch name"
     )
-    visibility: Visibility = Field(
-        Visibility.PRIVATE, description="Repository visibility"
+    visibility: VisibilityValue = Field(
+        Visibility.PRIVATE.value, description="Repository visibility"
     )
 
     # Ownership (simplified for v0.1)
@@ -71,13 +71,16 @@ class Repo(BaseModel):
 class RepoCreate(BaseModel):
     """Schema for creating a new Repo."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     name: constr(min_length=1, max_length=256)
     slug: constr(min_length=1, max_length=256)
     source: Source
     default_branch: constr(min_length=1, max_length=128) = "main"
-    visibility: Visibility = Visibility.PRIVATE
+    visibility: VisibilityValue = Visibility.PRIVATE.value
     owners: List[Actor] = Field(default_factory=list)
     policy: Optional[RepoPolicy] = None
     links: List[str] = Field(default_factory=list)
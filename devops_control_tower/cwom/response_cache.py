@@ -0,0 +1,72 @@
+"""
+In-process cache for serialized CWOM GET-by-id responses.
+
+ContextPackets and ConstraintSnapshots are immutable once created, and Repos
+and DoctrineRefs have no update path through the API, so their GET-by-id
+payloads can be served from memory. Entries hold the encoded JSON bytes so a
+hit skips both the query and re-serialization.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+class ResponseCache:
+    """Bounded LRU cache of JSON-encoded payloads with an optional TTL.
+
+    Thread-safe: sync route handlers run concurrently in the threadpool.
+    A ``ttl`` of ``None`` keeps entries until they are evicted by size.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached bytes for ``key``, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if self.ttl is not None and expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return body
+
+    def put(self, key: str, payload: Dict[str, Any]) -> bytes:
+        """Encode ``payload``, store it under ``key`` and return the bytes."""
+        body = orjson.dumps(payload)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return body
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Immutable objects: no TTL, evicted only by size.
+context_packet_cache = ResponseCache()
+constraint_snapshot_cache = ResponseCache()
+
+# No update endpoint, but rows can still change out-of-band; keep a TTL.
+repo_cache = ResponseCache(ttl=300)
+doctrine_ref_cache = ResponseCache(ttl=300)
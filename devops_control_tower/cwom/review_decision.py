@@ -15,22 +15,22 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import CriterionStatus, ReviewDecisionStatus
+from .enums import CriterionStatusValue, ReviewDecisionStatusValue
 from .primitives import Actor, Ref, generate_ulid, utc_now
 
 
 class CriterionOverride(BaseModel):
     """Override for a specific acceptance criterion evaluation."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     criterion_index: int = Field(
         ..., ge=0, description="Index of criterion being overridden"
     )
-    original_status: CriterionStatus = Field(
+    original_status: CriterionStatusValue = Field(
         ..., description="Original automated status from EvidencePack"
     )
-    override_status: CriterionStatus = Field(
+    override_status: CriterionStatusValue = Field(
         ..., description="Reviewer's override status"
     )
     reason: str = Field(..., description="Why this override was necessary")
@@ -43,7 +43,7 @@ class ReviewDecision(BaseModel):
     the work meets quality/policy standards before marking as done.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["ReviewDecision"] = Field(
@@ -62,7 +62,7 @@ class ReviewDecision(BaseModel):
 
     # Decision
     reviewer: Actor = Field(..., description="Who performed the review")
-    decision: ReviewDecisionStatus = Field(..., description="Approval decision")
+    decision: ReviewDecisionStatusValue = Field(..., description="Approval decision")
     decision_reason: str = Field(..., description="Explanation of decision")
     reviewed_at: datetime = Field(
         default_factory=utc_now, description="When review was performed"
@@ -93,13 +93,13 @@ class ReviewDecision(BaseModel):
 class ReviewDecisionCreate(BaseModel):
     """Schema for creating a new ReviewDecision."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     for_evidence_pack: Ref
     for_run: Ref
     for_issue: Ref
     reviewer: Actor
-    decision: ReviewDecisionStatus
+    decision: ReviewDecisionStatusValue
     decision_reason: str
     criteria_overrides: List[CriterionOverride] = Field(default_factory=list)
     tags: List[str] = Field(default_factory=list)
@@ -5,10 +5,21 @@ REST endpoints for CWOM object CRUD operations.
 All endpoints are prefixed with /cwom.
 """
 
-from typing import Any, Dict, List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple
+from urllib.parse import urlsplit
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
+from starlette.routing import Match
 
 from ..db.base import get_db
 from .artifact import ArtifactCreate
@@ -16,23 +27,173 @@ from .constraint_snapshot import ConstraintSnapshotCreate
 from .context_packet import ContextPacketCreate
 from .doctrine_ref import DoctrineRefCreate
 from .issue import IssueCreate
+from .list_cache import get_list_cache
 from .repo import RepoCreate
+from .response_cache import (
+    constraint_snapshot_cache,
+    context_packet_cache,
+    doctrine_ref_cache,
+    repo_cache,
+)
 from .review_decision import ReviewDecisionCreate
 from .run import RunCreate, RunUpdate
 from .services import (
-    ArtifactService,
-    ConstraintSnapshotService,
-    ContextPacketService,
-    DoctrineRefService,
-    EvidencePackService,
+    IdConflictError,
     ImmutabilityError,
-    IssueService,
-    RepoService,
-    ReviewDecisionService,
-    RunService,
+    InvalidCursorError,
+    Services,
+    find_missing_ref,
+    next_cursor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _ORJSONRequest(Request):
+    """Request whose JSON body is decoded by orjson instead of stdlib json."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+            # FastAPI still turns malformed bodies into a 422.
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class _ORJSONRoute(APIRoute):
+    """APIRoute that hands FastAPI an _ORJSONRequest for body parsing.
+
+    Body models are still validated by the TypeAdapter FastAPI compiles once
+    per route; this only swaps the JSON decode that precedes it. The handler
+    is built once and reused, so in-process dispatch (see /cwom/batch)
+    doesn't rebuild it per call.
+    """
+
+    _handler: Optional[Callable[[Request], Any]] = None
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        if self._handler is not None:
+            return self._handler
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(_ORJSONRequest(request.scope, request.receive))
+
+        self._handler = orjson_route_handler
+        return orjson_route_handler
+
+
+router = APIRouter(prefix="/cwom", tags=["CWOM"], route_class=_ORJSONRoute)
+
+
+def get_services(db: Session = Depends(get_db)) -> Services:
+    """Provide the request's CWOM service container."""
+    return Services(db)
+
+
+# Keyset pagination: pass this header's value back as ?after= for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+_AFTER_QUERY = Query(
+    None, description=f"Keyset cursor from a previous page's {NEXT_CURSOR_HEADER}"
 )
 
-router = APIRouter(prefix="/cwom", tags=["CWOM"])
+
+def _fetch_page(build: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Run a list query, mapping a malformed ``after`` cursor to 422."""
+    try:
+        return build()
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _page_response(body: bytes, cursor: Optional[str]) -> Response:
+    """Wrap an encoded list page, advertising the next cursor if any."""
+    headers = {NEXT_CURSOR_HEADER: cursor} if cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _without_none(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop top-level None fields from list items (GET-by-id keeps them)."""
+    return [{k: v for k, v in item.items() if v is not None} for item in items]
+
+
+# Pages longer than this are encoded and streamed in chunks of this many items,
+# so the full JSON body never sits in memory next to the rows it came from.
+_STREAM_CHUNK = 200
+
+
+def _iter_json_array(items: List[Dict[str, Any]]) -> Iterator[bytes]:
+    yield b"["
+    for start in range(0, len(items), _STREAM_CHUNK):
+        body = orjson.dumps(items[start : start + _STREAM_CHUNK])[1:-1]
+        yield b"," + body if start else body
+    yield b"]"
+
+
+def _list_response(
+    items: List[Dict[str, Any]], cursor: Optional[str] = None
+) -> Response:
+    """Encode a list page, streaming it in chunks when it is large."""
+    items = _without_none(items)
+    if len(items) <= _STREAM_CHUNK:
+        return _page_response(orjson.dumps(items), cursor)
+    headers = {NEXT_CURSOR_HEADER: cursor} if cursor else None
+    return StreamingResponse(
+        _iter_json_array(items), media_type="application/json", headers=headers
+    )
+
+
+def _cached_list(
+    entity: str,
+    params: Dict[str, Any],
+    build: Callable[[], List[Dict[str, Any]]],
+) -> Response:
+    """Serve a list page from the list cache, building it on a miss."""
+    cache = get_list_cache()
+    hit = cache.get(entity, params)
+    if hit is None:
+        items = _fetch_page(build)
+        cursor = next_cursor(items, params["limit"])
+        body = cache.put(entity, params, _without_none(items), cursor)
+    else:
+        body, cursor = hit
+    return _page_response(body, cursor)
+
+
+def _immutability_prefix(message: str) -> bytes:
+    """Encode a 405 body up to (not including) its object_id field."""
+    body = {"detail": {"error": "IMMUTABILITY_VIOLATION", "message": message}}
+    return orjson.dumps(body)[:-2]
+
+
+def _immutability_response(prefix: bytes, object_id: str) -> Response:
+    """Finish a precomputed 405 body; same shape as HTTPException(detail=...)."""
+    return Response(
+        content=prefix + b',"object_id":' + orjson.dumps(object_id) + b"}}",
+        status_code=405,
+        media_type="application/json",
+    )
+
+
+def _require_refs(db: Session, *refs: Tuple[str, str]) -> None:
+    """Raise 422 for the first ``(kind, id)`` reference that does not exist."""
+    missing = find_missing_ref(db, *refs)
+    if missing:
+        kind, ref_id = missing
+        raise HTTPException(
+            status_code=422,
+            detail=f"Referenced {kind} '{ref_id}' does not exist",
+        )
+
+
+@contextmanager
+def _id_conflict_as_409() -> Iterator[None]:
+    """Answer a create whose client-supplied id names another object with 409."""
+    try:
+        yield
+    except IdConflictError as e:
+        raise HTTPException(status_code=409, detail=e.message)
 
 
 # =============================================================================
@@ -41,54 +202,64 @@ router = APIRouter(prefix="/cwom", tags=["CWOM"])
 
 
 @router.post("/repos", status_code=201)
-async def create_repo(
+def create_repo(
     repo: RepoCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new Repo."""
-    service = RepoService(db)
+    service = services.repos
 
-    # Check if slug already exists
-    existing = service.get_by_slug(repo.slug)
-    if existing:
+    # Single INSERT ... ON CONFLICT; None means the slug already exists
+    with _id_conflict_as_409():
+        db_repo = service.create_if_absent(repo)
+    if db_repo is None:
         raise HTTPException(
             status_code=409,
             detail=f"Repo with slug '{repo.slug}' already exists",
         )
 
-    db_repo = service.create(repo)
     return {
         "status": "success",
         "repo": db_repo.to_dict(),
     }
 
 
-@router.get("/repos/{repo_id}")
-async def get_repo(
+@router.get("/repos/{repo_id}", response_model=Dict[str, Any])
+def get_repo(
     repo_id: str,
-    db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+    services: Services = Depends(get_services),
+) -> Response:
     """Get a Repo by ID."""
-    service = RepoService(db)
-    repo = service.get(repo_id)
+    body = repo_cache.get(repo_id)
+    if body is None:
+        service = services.repos
+        repo = service.get(repo_id)
+
+        if not repo:
+            raise HTTPException(status_code=404, detail="Repo not found")
 
-    if not repo:
-        raise HTTPException(status_code=404, detail="Repo not found")
+        body = repo_cache.put(repo_id, repo.to_dict())
 
-    return repo.to_dict()
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/repos")
-async def list_repos(
+@router.get("/repos", response_model=List[Dict[str, Any]])
+def list_repos(
     visibility: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List Repos with optional filtering."""
-    service = RepoService(db)
-    repos = service.list(visibility=visibility, limit=limit, offset=offset)
-    return [r.to_dict() for r in repos]
+    service = services.repos
+    params: Dict[str, Any] = {
+        "visibility": visibility,
+        "limit": limit,
+        "offset": offset,
+        "after": after,
+    }
+    return _cached_list("repos", params, lambda: service.list_dicts(**params))
 
 
 # =============================================================================
@@ -97,22 +268,16 @@ async def list_repos(
 
 
 @router.post("/issues", status_code=201)
-async def create_issue(
+def create_issue(
     issue: IssueCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new Issue."""
-    # Verify repo exists
-    repo_service = RepoService(db)
-    repo = repo_service.get(issue.repo.id)
-    if not repo:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Repo '{issue.repo.id}' does not exist",
-        )
+    _require_refs(services.db, ("Repo", issue.repo.id))
 
-    service = IssueService(db)
-    db_issue = service.create(issue)
+    service = services.issues
+    with _id_conflict_as_409():
+        db_issue = service.create(issue)
     return {
         "status": "success",
         "issue": db_issue.to_dict(),
@@ -120,12 +285,12 @@ async def create_issue(
 
 
 @router.get("/issues/{issue_id}")
-async def get_issue(
+def get_issue(
     issue_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get an Issue by ID with related objects."""
-    service = IssueService(db)
+    service = services.issues
     issue = service.get(issue_id)
 
     if not issue:
@@ -134,37 +299,41 @@ async def get_issue(
     return issue.to_dict()
 
 
-@router.get("/issues")
-async def list_issues(
+@router.get("/issues", response_model=List[Dict[str, Any]])
+def list_issues(
     repo_id: Optional[str] = None,
     status: Optional[str] = None,
     issue_type: Optional[str] = Query(None, alias="type"),
     priority: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List Issues with optional filtering."""
-    service = IssueService(db)
-    issues = service.list(
-        repo_id=repo_id,
-        status=status,
-        issue_type=issue_type,
-        priority=priority,
-        limit=limit,
-        offset=offset,
+    service = services.issues
+    params: Dict[str, Any] = {
+        "repo_id": repo_id,
+        "status": status,
+        "issue_type": issue_type,
+        "priority": priority,
+        "limit": limit,
+        "offset": offset,
+        "after": after,
+    }
+    return _cached_list(
+        "issues", params, lambda: [i.to_dict() for i in service.list(**params)]
     )
-    return [i.to_dict() for i in issues]
 
 
 @router.patch("/issues/{issue_id}/status")
-async def update_issue_status(
+def update_issue_status(
     issue_id: str,
     status: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Update Issue status."""
-    service = IssueService(db)
+    service = services.issues
     issue = service.update_status(issue_id, status)
 
     if not issue:
@@ -182,25 +351,20 @@ async def update_issue_status(
 
 
 @router.post("/context-packets", status_code=201)
-async def create_context_packet(
+def create_context_packet(
     packet: ContextPacketCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new ContextPacket.
 
     Note: ContextPackets are immutable. Once created, they cannot be modified.
     """
-    # Verify issue exists
-    issue_service = IssueService(db)
-    issue = issue_service.get(packet.for_issue.id)
-    if not issue:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Issue '{packet.for_issue.id}' does not exist",
-        )
+    _require_refs(services.db, ("Issue", packet.for_issue.id))
+    issue_service = services.issues
 
-    service = ContextPacketService(db)
-    db_packet = service.create(packet)
+    service = services.context_packets
+    with _id_conflict_as_409():
+        db_packet = service.create(packet)
 
     # Auto-link to the issue
     issue_service.link_context_packet(packet.for_issue.id, db_packet.id)
@@ -211,49 +375,61 @@ async def create_context_packet(
     }
 
 
-@router.get("/context-packets/{packet_id}")
-async def get_context_packet(
+@router.get("/context-packets/{packet_id}", response_model=Dict[str, Any])
+def get_context_packet(
     packet_id: str,
-    db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+    services: Services = Depends(get_services),
+) -> Response:
     """Get a ContextPacket by ID."""
-    service = ContextPacketService(db)
-    packet = service.get(packet_id)
+    body = context_packet_cache.get(packet_id)
+    if body is None:
+        service = services.context_packets
+        packet = service.get(packet_id)
 
-    if not packet:
-        raise HTTPException(status_code=404, detail="ContextPacket not found")
+        if not packet:
+            raise HTTPException(status_code=404, detail="ContextPacket not found")
 
-    return packet.to_dict()
+        body = context_packet_cache.put(packet_id, packet.to_dict())
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/issues/{issue_id}/context-packets")
-async def list_context_packets_for_issue(
+def list_context_packets_for_issue(
     issue_id: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List ContextPackets for an Issue."""
-    service = ContextPacketService(db)
-    packets = service.list_for_issue(issue_id, limit=limit, offset=offset)
-    return [p.to_dict() for p in packets]
+    service = services.context_packets
+    items = _fetch_page(
+        lambda: [
+            p.to_dict()
+            for p in service.list_for_issue(
+                issue_id, limit=limit, offset=offset, after=after
+            )
+        ]
+    )
+    return _list_response(items, next_cursor(items, limit))
+
+
+_PACKET_IMMUTABLE = _immutability_prefix(
+    "ContextPackets are immutable. Create a new ContextPacket with an incremented version instead."
+)
 
 
+# No DB or other blocking work, so unlike the handlers above these stay async:
+# the 405 is answered on the event loop without a threadpool hop.
 @router.put("/context-packets/{packet_id}")
 @router.patch("/context-packets/{packet_id}")
-async def update_context_packet_blocked(packet_id: str) -> None:
+async def update_context_packet_blocked(packet_id: str) -> Response:
     """ContextPackets are immutable and cannot be modified.
 
     To update context, create a new ContextPacket with an incremented version.
     """
-    raise HTTPException(
-        status_code=405,
-        detail={
-            "error": "IMMUTABILITY_VIOLATION",
-            "message": "ContextPackets are immutable. Create a new ContextPacket with an incremented version instead.",
-            "object_id": packet_id,
-        },
-    )
+    return _immutability_response(_PACKET_IMMUTABLE, packet_id)
 
 
 # =============================================================================
@@ -262,71 +438,78 @@ async def update_context_packet_blocked(packet_id: str) -> None:
 
 
 @router.post("/constraint-snapshots", status_code=201)
-async def create_constraint_snapshot(
+def create_constraint_snapshot(
     snapshot: ConstraintSnapshotCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new ConstraintSnapshot.
 
     Note: ConstraintSnapshots are immutable. Once created, they cannot be modified.
     """
-    service = ConstraintSnapshotService(db)
-    db_snapshot = service.create(snapshot)
+    service = services.constraint_snapshots
+    with _id_conflict_as_409():
+        db_snapshot = service.create(snapshot)
     return {
         "status": "success",
         "constraint_snapshot": db_snapshot.to_dict(),
     }
 
 
-@router.get("/constraint-snapshots/{snapshot_id}")
-async def get_constraint_snapshot(
+@router.get("/constraint-snapshots/{snapshot_id}", response_model=Dict[str, Any])
+def get_constraint_snapshot(
     snapshot_id: str,
-    db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+    services: Services = Depends(get_services),
+) -> Response:
     """Get a ConstraintSnapshot by ID."""
-    service = ConstraintSnapshotService(db)
-    snapshot = service.get(snapshot_id)
+    body = constraint_snapshot_cache.get(snapshot_id)
+    if body is None:
+        service = services.constraint_snapshots
+        snapshot = service.get(snapshot_id)
 
-    if not snapshot:
-        raise HTTPException(status_code=404, detail="ConstraintSnapshot not found")
+        if not snapshot:
+            raise HTTPException(status_code=404, detail="ConstraintSnapshot not found")
 
-    return snapshot.to_dict()
+        body = constraint_snapshot_cache.put(snapshot_id, snapshot.to_dict())
+
+    return Response(content=body, media_type="application/json")
+
+
+_SNAPSHOT_IMMUTABLE = _immutability_prefix(
+    "ConstraintSnapshots are immutable. Create a new ConstraintSnapshot instead."
+)
 
 
 @router.put("/constraint-snapshots/{snapshot_id}")
 @router.patch("/constraint-snapshots/{snapshot_id}")
-async def update_constraint_snapshot_blocked(snapshot_id: str) -> None:
+async def update_constraint_snapshot_blocked(snapshot_id: str) -> Response:
     """ConstraintSnapshots are immutable and cannot be modified.
 
     To update constraints, create a new ConstraintSnapshot.
     """
-    raise HTTPException(
-        status_code=405,
-        detail={
-            "error": "IMMUTABILITY_VIOLATION",
-            "message": "ConstraintSnapshots are immutable. Create a new ConstraintSnapshot instead.",
-            "object_id": snapshot_id,
-        },
-    )
+    return _immutability_response(_SNAPSHOT_IMMUTABLE, snapshot_id)
 
 
-@router.get("/constraint-snapshots")
-async def list_constraint_snapshots(
+@router.get("/constraint-snapshots", response_model=List[Dict[str, Any]])
+def list_constraint_snapshots(
     scope: Optional[str] = None,
     owner_id: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List ConstraintSnapshots with optional filtering."""
-    service = ConstraintSnapshotService(db)
-    snapshots = service.list(
-        scope=scope,
-        owner_id=owner_id,
-        limit=limit,
-        offset=offset,
+    service = services.constraint_snapshots
+    items = _fetch_page(
+        lambda: service.list_dicts(
+            scope=scope,
+            owner_id=owner_id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [s.to_dict() for s in snapshots]
+    return _list_response(items, next_cursor(items, limit, "captured_at"))
 
 
 # =============================================================================
@@ -335,62 +518,66 @@ async def list_constraint_snapshots(
 
 
 @router.post("/doctrine-refs", status_code=201)
-async def create_doctrine_ref(
+def create_doctrine_ref(
     doctrine: DoctrineRefCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new DoctrineRef."""
-    service = DoctrineRefService(db)
+    service = services.doctrine_refs
 
-    # Check for existing doctrine with same namespace/name/version
-    existing = service.get_by_name(doctrine.namespace, doctrine.name, doctrine.version)
-    if existing:
+    # Single INSERT ... ON CONFLICT on namespace/name/version
+    with _id_conflict_as_409():
+        db_doctrine = service.create_if_absent(doctrine)
+    if db_doctrine is None:
         raise HTTPException(
             status_code=409,
             detail=f"DoctrineRef '{doctrine.namespace}/{doctrine.name}@{doctrine.version}' already exists",
         )
 
-    db_doctrine = service.create(doctrine)
     return {
         "status": "success",
         "doctrine_ref": db_doctrine.to_dict(),
     }
 
 
-@router.get("/doctrine-refs/{doctrine_id}")
-async def get_doctrine_ref(
+@router.get("/doctrine-refs/{doctrine_id}", response_model=Dict[str, Any])
+def get_doctrine_ref(
     doctrine_id: str,
-    db: Session = Depends(get_db),
-) -> Dict[str, Any]:
+    services: Services = Depends(get_services),
+) -> Response:
     """Get a DoctrineRef by ID."""
-    service = DoctrineRefService(db)
-    doctrine = service.get(doctrine_id)
+    body = doctrine_ref_cache.get(doctrine_id)
+    if body is None:
+        service = services.doctrine_refs
+        doctrine = service.get(doctrine_id)
+
+        if not doctrine:
+            raise HTTPException(status_code=404, detail="DoctrineRef not found")
 
-    if not doctrine:
-        raise HTTPException(status_code=404, detail="DoctrineRef not found")
+        body = doctrine_ref_cache.put(doctrine_id, doctrine.to_dict())
 
-    return doctrine.to_dict()
+    return Response(content=body, media_type="application/json")
 
 
-@router.get("/doctrine-refs")
-async def list_doctrine_refs(
+@router.get("/doctrine-refs", response_model=List[Dict[str, Any]])
+def list_doctrine_refs(
     namespace: Optional[str] = None,
     doctrine_type: Optional[str] = Query(None, alias="type"),
     priority: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    services: Services = Depends(get_services),
+) -> Response:
     """List DoctrineRefs with optional filtering."""
-    service = DoctrineRefService(db)
-    doctrines = service.list(
-        namespace=namespace,
-        doctrine_type=doctrine_type,
-        priority=priority,
-        limit=limit,
-        offset=offset,
-    )
-    return [d.to_dict() for d in doctrines]
+    service = services.doctrine_refs
+    params: Dict[str, Any] = {
+        "namespace": namespace,
+        "doctrine_type": doctrine_type,
+        "priority": priority,
+        "limit": limit,
+        "offset": offset,
+    }
+    return _cached_list("doctrine_refs", params, lambda: service.list_dicts(**params))
 
 
 # =============================================================================
@@ -399,31 +586,16 @@ async def list_doctrine_refs(
 
 
 @router.post("/runs", status_code=201)
-async def create_run(
+def create_run(
     run: RunCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new Run."""
-    # Verify issue exists
-    issue_service = IssueService(db)
-    issue = issue_service.get(run.for_issue.id)
-    if not issue:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Issue '{run.for_issue.id}' does not exist",
-        )
-
-    # Verify repo exists
-    repo_service = RepoService(db)
-    repo = repo_service.get(run.repo.id)
-    if not repo:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Repo '{run.repo.id}' does not exist",
-        )
+    _require_refs(services.db, ("Issue", run.for_issue.id), ("Repo", run.repo.id))
 
-    service = RunService(db)
-    db_run = service.create(run)
+    service = services.runs
+    with _id_conflict_as_409():
+        db_run = service.create(run)
     return {
         "status": "success",
         "run": db_run.to_dict(),
@@ -431,51 +603,53 @@ async def create_run(
 
 
 @router.get("/runs/{run_id}")
-async def get_run(
+def get_run(
     run_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get a Run by ID."""
-    service = RunService(db)
+    service = services.runs
     run = service.get(run_id)
 
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    return run.to_dict()
+    return run.cached_json or run.to_dict()
 
 
-@router.get("/runs")
-async def list_runs(
+@router.get("/runs", response_model=List[Dict[str, Any]])
+def list_runs(
     issue_id: Optional[str] = None,
     repo_id: Optional[str] = None,
     status: Optional[str] = None,
     mode: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List Runs with optional filtering."""
-    service = RunService(db)
-    runs = service.list(
-        issue_id=issue_id,
-        repo_id=repo_id,
-        status=status,
-        mode=mode,
-        limit=limit,
-        offset=offset,
-    )
-    return [r.to_dict() for r in runs]
+    service = services.runs
+    params: Dict[str, Any] = {
+        "issue_id": issue_id,
+        "repo_id": repo_id,
+        "status": status,
+        "mode": mode,
+        "limit": limit,
+        "offset": offset,
+        "after": after,
+    }
+    return _cached_list("runs", params, lambda: service.list_dicts(**params))
 
 
 @router.patch("/runs/{run_id}")
-async def update_run(
+def update_run(
     run_id: str,
     update: RunUpdate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Update a Run's mutable fields (status, outputs, telemetry, etc.)."""
-    service = RunService(db)
+    service = services.runs
     run = service.update(run_id, update)
 
     if not run:
@@ -493,31 +667,18 @@ async def update_run(
 
 
 @router.post("/artifacts", status_code=201)
-async def create_artifact(
+def create_artifact(
     artifact: ArtifactCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Create a new Artifact."""
-    # Verify run exists
-    run_service = RunService(db)
-    run = run_service.get(artifact.produced_by.id)
-    if not run:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Run '{artifact.produced_by.id}' does not exist",
-        )
-
-    # Verify issue exists
-    issue_service = IssueService(db)
-    issue = issue_service.get(artifact.for_issue.id)
-    if not issue:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Referenced Issue '{artifact.for_issue.id}' does not exist",
-        )
+    _require_refs(
+        services.db, ("Run", artifact.produced_by.id), ("Issue", artifact.for_issue.id)
+    )
 
-    service = ArtifactService(db)
-    db_artifact = service.create(artifact)
+    service = services.artifacts
+    with _id_conflict_as_409():
+        db_artifact = service.create(artifact)
     return {
         "status": "success",
         "artifact": db_artifact.to_dict(),
@@ -525,12 +686,12 @@ async def create_artifact(
 
 
 @router.get("/artifacts/{artifact_id}")
-async def get_artifact(
+def get_artifact(
     artifact_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get an Artifact by ID."""
-    service = ArtifactService(db)
+    service = services.artifacts
     artifact = service.get(artifact_id)
 
     if not artifact:
@@ -539,42 +700,50 @@ async def get_artifact(
     return artifact.to_dict()
 
 
-@router.get("/runs/{run_id}/artifacts")
-async def list_artifacts_for_run(
+@router.get("/runs/{run_id}/artifacts", response_model=List[Dict[str, Any]])
+def list_artifacts_for_run(
     run_id: str,
     artifact_type: Optional[str] = Query(None, alias="type"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List Artifacts produced by a Run."""
-    service = ArtifactService(db)
-    artifacts = service.list_for_run(
-        run_id,
-        artifact_type=artifact_type,
-        limit=limit,
-        offset=offset,
+    service = services.artifacts
+    items = _fetch_page(
+        lambda: service.list_for_run_dicts(
+            run_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [a.to_dict() for a in artifacts]
+    return _list_response(items, next_cursor(items, limit))
 
 
-@router.get("/issues/{issue_id}/artifacts")
-async def list_artifacts_for_issue(
+@router.get("/issues/{issue_id}/artifacts", response_model=List[Dict[str, Any]])
+def list_artifacts_for_issue(
     issue_id: str,
     artifact_type: Optional[str] = Query(None, alias="type"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List Artifacts for an Issue."""
-    service = ArtifactService(db)
-    artifacts = service.list_for_issue(
-        issue_id,
-        artifact_type=artifact_type,
-        limit=limit,
-        offset=offset,
+    service = services.artifacts
+    items = _fetch_page(
+        lambda: service.list_for_issue_dicts(
+            issue_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [a.to_dict() for a in artifacts]
+    return _list_response(items, next_cursor(items, limit))
 
 
 # =============================================================================
@@ -583,12 +752,12 @@ async def list_artifacts_for_issue(
 
 
 @router.get("/evidence-packs/{evidence_pack_id}")
-async def get_evidence_pack(
+def get_evidence_pack(
     evidence_pack_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get an EvidencePack by ID."""
-    service = EvidencePackService(db)
+    service = services.evidence_packs
     evidence_pack = service.get(evidence_pack_id)
 
     if not evidence_pack:
@@ -597,40 +766,44 @@ async def get_evidence_pack(
     return evidence_pack.to_dict()
 
 
-@router.get("/evidence-packs")
-async def list_evidence_packs(
+@router.get("/evidence-packs", response_model=List[Dict[str, Any]])
+def list_evidence_packs(
     run_id: Optional[str] = None,
     issue_id: Optional[str] = None,
     verdict: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List EvidencePacks with optional filtering."""
-    service = EvidencePackService(db)
-    evidence_packs = service.list(
-        run_id=run_id,
-        issue_id=issue_id,
-        verdict=verdict,
-        limit=limit,
-        offset=offset,
+    service = services.evidence_packs
+    items = _fetch_page(
+        lambda: service.list_dicts(
+            run_id=run_id,
+            issue_id=issue_id,
+            verdict=verdict,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [ep.to_dict() for ep in evidence_packs]
+    return _list_response(items, next_cursor(items, limit))
 
 
 @router.get("/runs/{run_id}/evidence-pack")
-async def get_evidence_pack_for_run(
+def get_evidence_pack_for_run(
     run_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get the EvidencePack for a Run."""
     # Verify run exists
-    run_service = RunService(db)
+    run_service = services.runs
     run = run_service.get(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    service = EvidencePackService(db)
+    service = services.evidence_packs
     evidence_pack = service.get_for_run(run_id)
 
     if not evidence_pack:
@@ -641,23 +814,27 @@ async def get_evidence_pack_for_run(
     return evidence_pack.to_dict()
 
 
-@router.get("/issues/{issue_id}/evidence-packs")
-async def list_evidence_packs_for_issue(
+@router.get("/issues/{issue_id}/evidence-packs", response_model=List[Dict[str, Any]])
+def list_evidence_packs_for_issue(
     issue_id: str,
     verdict: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List EvidencePacks for an Issue."""
-    service = EvidencePackService(db)
-    evidence_packs = service.list_for_issue(
-        issue_id,
-        verdict=verdict,
-        limit=limit,
-        offset=offset,
+    service = services.evidence_packs
+    items = _fetch_page(
+        lambda: service.list_for_issue_dicts(
+            issue_id,
+            verdict=verdict,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [ep.to_dict() for ep in evidence_packs]
+    return _list_response(items, next_cursor(items, limit))
 
 
 # =============================================================================
@@ -666,9 +843,9 @@ async def list_evidence_packs_for_issue(
 
 
 @router.post("/reviews", status_code=201)
-async def create_review(
+def create_review(
     review: ReviewDecisionCreate,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Submit a review decision for an EvidencePack.
 
@@ -676,14 +853,12 @@ async def create_review(
     - approved -> Issue/Run status = done
     - rejected/needs_changes -> Issue/Run status = failed
     """
-    service = ReviewDecisionService(db)
+    service = services.reviews
 
     try:
         db_review = service.create(
             review_data=review.model_dump(),
-            actor_kind=review.reviewer.actor_kind.value
-            if hasattr(review.reviewer.actor_kind, "value")
-            else str(review.reviewer.actor_kind),
+            actor_kind=review.reviewer.actor_kind,
             actor_id=review.reviewer.actor_id,
         )
         return {
@@ -695,12 +870,12 @@ async def create_review(
 
 
 @router.get("/reviews/{review_id}")
-async def get_review(
+def get_review(
     review_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get a ReviewDecision by ID."""
-    service = ReviewDecisionService(db)
+    service = services.reviews
     review = service.get(review_id)
 
     if not review:
@@ -709,34 +884,38 @@ async def get_review(
     return review.to_dict()
 
 
-@router.get("/reviews")
-async def list_reviews(
+@router.get("/reviews", response_model=List[Dict[str, Any]])
+def list_reviews(
     evidence_pack_id: Optional[str] = None,
     issue_id: Optional[str] = None,
     decision: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List ReviewDecisions with optional filtering."""
-    service = ReviewDecisionService(db)
-    reviews = service.list(
-        evidence_pack_id=evidence_pack_id,
-        issue_id=issue_id,
-        decision=decision,
-        limit=limit,
-        offset=offset,
+    service = services.reviews
+    items = _fetch_page(
+        lambda: service.list_dicts(
+            evidence_pack_id=evidence_pack_id,
+            issue_id=issue_id,
+            decision=decision,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [r.to_dict() for r in reviews]
+    return _list_response(items, next_cursor(items, limit))
 
 
 @router.get("/evidence-packs/{evidence_pack_id}/review")
-async def get_review_for_evidence_pack(
+def get_review_for_evidence_pack(
     evidence_pack_id: str,
-    db: Session = Depends(get_db),
+    services: Services = Depends(get_services),
 ) -> Dict[str, Any]:
     """Get the ReviewDecision for an EvidencePack."""
-    service = ReviewDecisionService(db)
+    service = services.reviews
     review = service.get_for_evidence_pack(evidence_pack_id)
 
     if not review:
@@ -748,20 +927,130 @@ async def get_review_for_evidence_pack(
     return review.to_dict()
 
 
-@router.get("/issues/{issue_id}/reviews")
-async def list_reviews_for_issue(
+@router.get("/issues/{issue_id}/reviews", response_model=List[Dict[str, Any]])
+def list_reviews_for_issue(
     issue_id: str,
     decision: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-) -> List[Dict[str, Any]]:
+    after: Optional[str] = _AFTER_QUERY,
+    services: Services = Depends(get_services),
+) -> Response:
     """List ReviewDecisions for an Issue."""
-    service = ReviewDecisionService(db)
-    reviews = service.list_for_issue(
-        issue_id,
-        decision=decision,
-        limit=limit,
-        offset=offset,
+    service = services.reviews
+    items = _fetch_page(
+        lambda: service.list_for_issue_dicts(
+            issue_id,
+            decision=decision,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
     )
-    return [r.to_dict() for r in reviews]
+    return _list_response(items, next_cursor(items, limit))
+
+
+# =============================================================================
+# Batch Endpoint
+# =============================================================================
+
+
+class BatchOp(BaseModel):
+    """One sub-request in a batch: a CWOM GET path, optionally with a query."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    method: Literal["GET"] = "GET"
+    path: str = Field(..., description="Path under /cwom, e.g. /cwom/issues/{id}")
+
+
+class BatchRequest(BaseModel):
+    """A page's worth of CWOM reads to serve in one HTTP round trip."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    ops: List[BatchOp] = Field(..., min_length=1, max_length=50)
+
+
+# Ops of one batch run at most this many at a time; each holds its own DB
+# session, so an unbounded gather could take most of the connection pool.
+_BATCH_CONCURRENCY = 4
+
+
+async def _response_body(response: Response) -> bytes:
+    """Return a response's body, draining it if the response is streamed."""
+    if isinstance(response, StreamingResponse):
+        return b"".join(
+            [
+                chunk if isinstance(chunk, bytes) else chunk.encode(response.charset)
+                async for chunk in response.body_iterator
+            ]
+        )
+    return response.body
+
+
+async def _dispatch_batch_op(request: Request, op: BatchOp) -> Dict[str, Any]:
+    """Run one GET through the matching CWOM route handler, in-process."""
+    parts = urlsplit(op.path)
+    scope = {
+        "type": "http",
+        "method": op.method,
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "headers": [],
+        "app": request.app,
+        "root_path": "",
+    }
+
+    for route in request.app.router.routes:
+        if not isinstance(route, APIRoute) or not route.path.startswith(
+            router.prefix + "/"
+        ):
+            continue
+        match, child_scope = route.matches(scope)
+        if match is Match.FULL:
+            break
+    else:
+        return {"status": 404, "body": {"detail": "Not Found"}}
+
+    sub_request = Request({**scope, **child_scope})
+    try:
+        response = await route.get_route_handler()(sub_request)
+        body = await _response_body(response)
+    except HTTPException as e:
+        return {"status": e.status_code, "body": {"detail": e.detail}}
+    except RequestValidationError as e:
+        return {"status": 422, "body": {"detail": jsonable_encoder(e.errors())}}
+    except Exception:
+        # Fail this op only; letting it escape gather would 500 the whole batch
+        logger.exception("Batch op %s %s failed", op.method, op.path)
+        return {"status": 500, "body": {"detail": "Internal Server Error"}}
+
+    return {
+        "status": response.status_code,
+        "body": orjson.loads(body),
+        "next_cursor": response.headers.get(NEXT_CURSOR_HEADER),
+    }
+
+
+@router.post("/batch")
+async def batch(batch_request: BatchRequest, request: Request) -> Dict[str, Any]:
+    """Serve several CWOM GETs in one round trip.
+
+    Each op is dispatched to its route handler in-process, with the same
+    validation, caching and error responses as the standalone endpoint.
+    Results are returned in op order as ``{"status", "body"}`` pairs;
+    successful ones also carry ``next_cursor``, the value a standalone list
+    request would have sent in its X-Next-Cursor header (None on the last
+    page and for non-list ops). An op that fails unexpectedly gets a 500
+    result without affecting the others.
+    """
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def dispatch(op: BatchOp) -> Dict[str, Any]:
+        async with semaphore:
+            return await _dispatch_batch_op(request, op)
+
+    results = await asyncio.gather(*(dispatch(op) for op in batch_request.ops))
+    return {"results": list(results)}
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, constr
 
-from .enums import RunMode, Status
+from .enums import RunMode, Status, StatusValue
 from .primitives import (
     Cost,
     Executor,
@@ -36,7 +36,7 @@ class Run(BaseModel):
     - Run inputs/outputs SHOULD be treated as append-only; supersede by creating a new Run.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     # Object identity
     kind: Literal["Run"] = Field(default="Run", description="Object type identifier")
@@ -49,7 +49,7 @@ class Run(BaseModel):
     repo: Ref = Field(..., description="Reference to the Repo")
 
     # Status
-    status: Status = Field(Status.PLANNED, description="Current run status")
+    status: StatusValue = Field(Status.PLANNED.value, description="Current run status")
     mode: RunMode = Field(..., description="How this run is being executed")
 
     # Executor
@@ -98,8 +98,11 @@ class Run(BaseModel):
 class RunCreate(BaseModel):
     """Schema for creating a new Run."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
+    id: Optional[constr(min_length=1, max_length=128)] = Field(
+        None, description="Client-chosen ID; generated when omitted"
+    )
     for_issue: Ref
     repo: Ref
     mode: RunMode
@@ -113,9 +116,9 @@ class RunCreate(BaseModel):
 class RunUpdate(BaseModel):
     """Schema for updating a Run (status, outputs, telemetry)."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
-    status: Optional[Status] = None
+    status: Optional[StatusValue] = None
     telemetry: Optional[Telemetry] = None
     cost: Optional[Cost] = None
     outputs: Optional[RunOutputs] = None
@@ -7,11 +7,26 @@ Each service class handles CRUD operations for a specific CWOM object type.
 Audit logging is integrated into all state-changing operations.
 """
 
+import base64
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import desc
-from sqlalchemy.orm import Session
+from enum import Enum
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, bindparam, desc, exists
+from sqlalchemy import insert as sql_insert
+from sqlalchemy import select, tuple_
+from sqlalchemy import update as sql_update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    joinedload,
+    load_only,
+    raiseload,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import set_committed_value
 
 from ..db.audit_service import AuditService
 from ..db.cwom_models import (
@@ -41,6 +56,350 @@ from .repo import RepoCreate
 from .run import RunCreate, RunUpdate
 
 
+def _link_all(
+    db: Session,
+    table: Table,
+    owner_column: str,
+    owner_id: str,
+    target_column: str,
+    target_model: Any,
+    target_ids: List[str],
+) -> None:
+    """Link ``owner_id`` to every existing target in one INSERT ... SELECT.
+
+    Ids with no target row are skipped by the SELECT and links that already
+    exist by ON CONFLICT DO NOTHING, so a bad or repeated ref is dropped
+    without a per-row round trip. Does not commit.
+    """
+    if not target_ids:
+        return
+    stmt = _link_statement(
+        db.get_bind().dialect.name, table, owner_column, target_column, target_model
+    )
+    db.execute(stmt, {"owner_id": owner_id, "target_ids": list(set(target_ids))})
+
+
+@lru_cache(maxsize=None)
+def _link_statement(
+    dialect: str, table: Table, owner_column: str, target_column: str, target_model: Any
+) -> Any:
+    """Build the INSERT ... SELECT used by ``_link_all`` once per table."""
+    insert = _upsert_insert_for(dialect)
+    source = select(
+        bindparam("owner_id", type_=table.c[owner_column].type), target_model.id
+    ).where(target_model.id.in_(bindparam("target_ids", expanding=True)))
+    stmt = (insert or sql_insert)(table).from_select(
+        [owner_column, target_column], source
+    )
+    if insert is not None:
+        stmt = stmt.on_conflict_do_nothing()
+    return stmt
+
+
+def _insert_link(db: Session, table: Table, values: Dict[str, str]) -> bool:
+    """Insert one association row, returning False if it was already there.
+
+    An existing link is skipped by ON CONFLICT DO NOTHING and reported
+    through the rowcount, so no exception is raised for it; any other
+    ``IntegrityError``, such as a link to a missing target, propagates.
+    Dialects without ON CONFLICT can only report the duplicate as an
+    ``IntegrityError``, which rolls back the session. Does not commit.
+    """
+    dialect = db.get_bind().dialect.name
+    stmt = _link_insert(dialect, table)
+    if _upsert_insert_for(dialect) is not None:
+        return db.execute(stmt, values).rowcount == 1
+    try:
+        db.execute(stmt, values)
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _link_insert(dialect: str, table: Table) -> Any:
+    """Build the single-row INSERT used by ``_insert_link`` once per table."""
+    insert = _upsert_insert_for(dialect)
+    if insert is None:
+        return table.insert()
+    return insert(table).on_conflict_do_nothing()
+
+
+# Rows fetched per round trip by the stream_* methods
+_STREAM_BATCH = 50
+
+
+def _enum_value(value: Any) -> str:
+    """Return an enum member's value, or ``str(value)`` for anything else."""
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+def _project_dicts(model: Any, query: Query) -> List[Dict[str, Any]]:
+    """Serialize a list query as dicts without hydrating ORM instances.
+
+    Selects only the table columns and passes each row through the model's
+    ``to_dict``, which reads nothing but column attributes for the models
+    this is used with. Skips identity-map and instance-state bookkeeping.
+    """
+    rows = query.with_entities(*model.__table__.columns).all()
+    return [model.to_dict(row) for row in rows]
+
+
+def _bulk_insert(
+    db: Session,
+    audit: AuditService,
+    model: Any,
+    rows: List[Dict[str, Any]],
+    actor_kind: str,
+    actor_id: str,
+    trace_id: Optional[str],
+    note: Optional[str] = None,
+) -> List[str]:
+    """Insert ``rows`` and stage a create audit entry for each, without committing.
+
+    The rows go through one Core executemany, which SQLAlchemy sends as
+    multi-row INSERT batches (insertmanyvalues) instead of a statement per
+    row; the staged audit entries are batched the same way when flushed.
+    Returns the new ids in input order.
+    """
+    if not rows:
+        return []
+    afters = [model(**row).to_dict() for row in rows]
+    if "cached_json" in model.__table__.c:
+        # Core inserts skip the ORM before_insert hook that fills this
+        for row, after in zip(rows, afters):
+            row["cached_json"] = after
+    db.execute(model.__table__.insert(), rows)
+    for row, after in zip(rows, afters):
+        audit.stage_create(
+            entity_kind=row["kind"],
+            entity_id=row["id"],
+            after=after,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            trace_id=trace_id,
+            note=note,
+        )
+    return [row["id"] for row in rows]
+
+
+def _only_fields(query: Query, model: Any, fields: Optional[Sequence[str]]) -> Query:
+    """Load only the named columns (plus the primary key) when ``fields`` is set.
+
+    The other columns, typically the large JSON ones, are deferred and load
+    on first access, so callers should read only what they asked for;
+    ``to_dict`` reads every column. Unknown names raise ``ValueError``.
+    """
+    if not fields:
+        return query
+    unknown = set(fields).difference(model.__table__.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown {model.__name__} fields: {sorted(unknown)}")
+    return query.options(load_only(*(getattr(model, name) for name in fields)))
+
+
+def _upsert_insert(db: Session) -> Optional[Any]:
+    """Return the dialect's ``insert`` construct if it supports ON CONFLICT."""
+    return _upsert_insert_for(db.get_bind().dialect.name)
+
+
+def _upsert_insert_for(dialect: str) -> Optional[Any]:
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+
+        return insert
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+
+        return insert
+    return None
+
+
+def _insert_unless_exists(
+    db: Session,
+    model: Any,
+    values: Dict[str, Any],
+    conflict_columns: List[str],
+    client_id: Optional[str] = None,
+) -> Optional[Any]:
+    """Insert a row in one statement, returning None if it hits ``conflict_columns``.
+
+    Uses ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` on PostgreSQL and
+    SQLite, so existence is decided by the unique index rather than a racy
+    pre-check. With a ``client_id`` a taken id also counts as a conflict.
+    A conflict there is not an error: the transaction, and anything the
+    caller already staged in it, is left as is. Other dialects fall back to
+    a plain insert and treat an ``IntegrityError`` on flush as the conflict,
+    which does roll the session back. On success the row is left
+    uncommitted so the caller can commit it with its audit entry.
+    """
+    insert = _upsert_insert(db)
+    if insert is None:
+        obj = model(**values)
+        db.add(obj)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()
+            return None
+        return obj
+
+    stmt = (
+        insert(model)
+        .values(**values)
+        # No conflict target: the id and the unique columns can both collide
+        .on_conflict_do_nothing(
+            index_elements=conflict_columns if client_id is None else None
+        )
+        .returning(model)
+    )
+    return db.scalars(stmt).one_or_none()
+
+
+def _insert_new(
+    db: Session, model: Any, values: Dict[str, Any], client_id: Optional[str]
+) -> Optional[Any]:
+    """Insert the row for a ``create``, returning None if ``client_id`` is taken.
+
+    Server-generated ids cannot collide, so those rows are simply added and
+    flushed. A client-supplied id is inserted with ``ON CONFLICT (id) DO
+    NOTHING RETURNING``, turning a retried create into a no-op the caller
+    answers with the stored row; nothing is rolled back. Dialects without
+    ON CONFLICT raise ``IntegrityError`` on the duplicate. Does not commit.
+    """
+    insert = _upsert_insert(db) if client_id is not None else None
+    if insert is None:
+        obj = model(**values)
+        db.add(obj)
+        db.flush()
+        return obj
+    if "cached_json" in model.__table__.c:
+        # Skipped by this insert, like in _bulk_insert
+        values["cached_json"] = model(**values).to_dict()
+    stmt = (
+        insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(model)
+    )
+    return db.scalars(stmt).one_or_none()
+
+
+# Columns a replayed create may legitimately disagree on: stamped per request,
+# derived, or changed by later updates to the object
+_RETRY_IGNORED_COLUMNS = frozenset(
+    {
+        "trace_id",
+        "created_at",
+        "updated_at",
+        "cached_json",
+        "status",
+        "runs",
+        "constraint_snapshot_id",
+        "telemetry",
+        "cost",
+        "outputs",
+        "failure",
+    }
+)
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _stored_for_retry(db: Session, model: Any, values: Dict[str, Any]) -> Any:
+    """Return the stored row whose id a create's client-supplied id collided with.
+
+    The row is returned only when it holds the same object, i.e. the create
+    is a retry; a different object under that id raises ``IdConflictError``.
+    """
+    obj = db.get(model, values["id"])
+    if obj is None:
+        raise IdConflictError(values["kind"], values["id"])
+    for key, value in values.items():
+        if key in _RETRY_IGNORED_COLUMNS:
+            continue
+        stored = getattr(obj, key)
+        if isinstance(value, datetime) and isinstance(stored, datetime):
+            value, stored = _as_naive_utc(value), _as_naive_utc(stored)
+        if stored != value:
+            raise IdConflictError(values["kind"], values["id"])
+    return obj
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(created_at: str, obj_id: str) -> str:
+    """Build an opaque keyset cursor from a row's ``created_at`` and ``id``."""
+    return base64.urlsafe_b64encode(f"{created_at}|{obj_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor from ``encode_cursor``."""
+    try:
+        created_at, obj_id = base64.urlsafe_b64decode(cursor).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), obj_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
+def next_cursor(
+    items: List[Dict[str, Any]], limit: int, key: str = "created_at"
+) -> Optional[str]:
+    """Cursor for the page after ``items``, or None if this was the last page.
+
+    ``key`` names the timestamp field the page was ordered by.
+    """
+    if len(items) < limit or not items:
+        return None
+    last = items[-1]
+    return encode_cursor(last[key], last["id"])
+
+
+def _newest_first(
+    query: Query, model: Any, after: Optional[str], column: Any = None
+) -> Query:
+    """Order newest-first by (created_at, id), seeking past ``after`` if given.
+
+    The keyset predicate lets the database range-scan the created_at index
+    instead of reading and discarding ``offset`` rows. Pass ``column`` for
+    models ordered by another timestamp.
+    """
+    if column is None:
+        column = model.created_at
+    if after:
+        created_at, obj_id = decode_cursor(after)
+        query = query.filter(tuple_(column, model.id) < tuple_(created_at, obj_id))
+    return query.order_by(desc(column), desc(model.id))
+
+
+_REF_MODELS: Dict[str, Any] = {
+    "Repo": CWOMRepoModel,
+    "Issue": CWOMIssueModel,
+    "Run": CWOMRunModel,
+}
+
+
+def find_missing_ref(db: Session, *refs: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+    """Return the first ``(kind, id)`` reference that does not exist, or None.
+
+    All references are checked in a single ``SELECT EXISTS(...), ...`` round
+    trip, without loading the referenced rows.
+    """
+    checks = [exists().where(_REF_MODELS[kind].id == ref_id) for kind, ref_id in refs]
+    found = db.execute(select(*checks)).one()
+    for ref, ok in zip(refs, found):
+        if not ok:
+            return ref
+    return None
+
+
 class ImmutabilityError(Exception):
     """Raised when attempting to modify an immutable object."""
 
@@ -61,9 +420,23 @@ class ImmutabilityError(Exception):
         }
 
 
+class IdConflictError(Exception):
+    """Raised when a create's client-supplied id belongs to a different object."""
+
+    def __init__(self, object_type: str, object_id: str):
+        self.object_type = object_type
+        self.object_id = object_id
+        self.message = (
+            f"{object_type} '{object_id}' already exists with different content."
+        )
+        super().__init__(self.message)
+
+
 class RepoService:
     """Service for managing CWOM Repo objects."""
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -76,31 +449,69 @@ class RepoService:
         trace_id: Optional[str] = None,
     ) -> CWOMRepoModel:
         """Create a new Repo."""
-        now = datetime.now(timezone.utc)
-        db_repo = CWOMRepoModel(
-            id=generate_ulid(),
-            kind="Repo",
+        db_repo = self.stage_create(repo, actor_kind, actor_id, trace_id)
+        if db_repo is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMRepoModel, self._row_values(repo, trace_id)
+            )
+        self.db.commit()
+
+        return db_repo
+
+    def stage_create(
+        self,
+        repo: RepoCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMRepoModel]:
+        """Insert a new Repo and stage its audit entry without committing.
+
+        Returns None if a client-supplied id already exists.
+        """
+        db_repo = _insert_new(
+            self.db, CWOMRepoModel, self._row_values(repo, trace_id), repo.id
+        )
+        if db_repo is None:
+            return None
+
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
+            entity_kind="Repo",
+            entity_id=db_repo.id,
+            after=db_repo.to_dict(),
+            actor_kind=actor_kind,
+            actor_id=actor_id,
             trace_id=trace_id,
-            name=repo.name,
-            slug=repo.slug,
-            source=repo.source.model_dump(),
-            default_branch=repo.default_branch,
-            visibility=repo.visibility.value,
-            owners=[o.model_dump() for o in repo.owners],
-            policy=repo.policy.model_dump() if repo.policy else None,
-            links=repo.links,
-            tags=repo.tags,
-            meta=repo.meta,
-            created_at=now,
-            updated_at=now,
         )
+        return db_repo
 
-        self.db.add(db_repo)
-        self.db.commit()
-        self.db.refresh(db_repo)
+    def create_if_absent(
+        self,
+        repo: RepoCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMRepoModel]:
+        """Create a new Repo, or return None if the slug is already taken."""
+        db_repo = _insert_unless_exists(
+            self.db,
+            CWOMRepoModel,
+            self._row_values(repo, trace_id),
+            ["slug"],
+            repo.id,
+        )
+        if db_repo is None:
+            if repo.id is None or self.get(repo.id) is None:
+                return None
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMRepoModel, self._row_values(repo, trace_id)
+            )
 
-        # Audit log
-        self.audit.log_create(
+        # Audit log, committed together with the inserted row
+        self.audit.stage_create(
             entity_kind="Repo",
             entity_id=db_repo.id,
             after=db_repo.to_dict(),
@@ -108,12 +519,58 @@ class RepoService:
             actor_id=actor_id,
             trace_id=trace_id,
         )
+        self.db.commit()
 
         return db_repo
 
+    def bulk_create(
+        self,
+        repos: Sequence[RepoCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many Repos with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMRepoModel,
+            [self._row_values(repo, trace_id) for repo in repos],
+            actor_kind,
+            actor_id,
+            trace_id,
+        )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(repo: RepoCreate, trace_id: Optional[str]) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": repo.id or generate_ulid(),
+            "kind": "Repo",
+            "trace_id": trace_id,
+            "name": repo.name,
+            "slug": repo.slug,
+            "source": repo.source.model_dump(),
+            "default_branch": repo.default_branch,
+            "visibility": repo.visibility,
+            "owners": [o.model_dump() for o in repo.owners],
+            "policy": repo.policy.model_dump() if repo.policy else None,
+            "links": repo.links,
+            "tags": repo.tags,
+            "meta": repo.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def get(self, repo_id: str) -> Optional[CWOMRepoModel]:
         """Get a Repo by ID."""
-        return self.db.query(CWOMRepoModel).filter(CWOMRepoModel.id == repo_id).first()
+        return self.db.get(CWOMRepoModel, repo_id)
 
     def get_by_slug(self, slug: str) -> Optional[CWOMRepoModel]:
         """Get a Repo by slug."""
@@ -124,24 +581,54 @@ class RepoService:
         visibility: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMRepoModel]:
         """List Repos with optional filtering."""
+        return self._list_query(
+            visibility=visibility,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_dicts(
+        self,
+        visibility: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List Repos as dicts using a column projection."""
+        return _project_dicts(
+            CWOMRepoModel,
+            self._list_query(
+                visibility=visibility,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_query(
+        self,
+        visibility: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMRepoModel)
 
         if visibility:
             query = query.filter(CWOMRepoModel.visibility == visibility)
 
-        return (
-            query.order_by(desc(CWOMRepoModel.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        return _newest_first(query, CWOMRepoModel, after).offset(offset).limit(limit)
 
 
 class IssueService:
     """Service for managing CWOM Issue objects."""
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -154,40 +641,35 @@ class IssueService:
         trace_id: Optional[str] = None,
     ) -> CWOMIssueModel:
         """Create a new Issue."""
-        now = datetime.now(timezone.utc)
-        db_issue = CWOMIssueModel(
-            id=generate_ulid(),
-            kind="Issue",
-            trace_id=trace_id,
-            repo_id=issue.repo.id,
-            repo_kind=issue.repo.kind.value
-            if hasattr(issue.repo.kind, "value")
-            else str(issue.repo.kind),
-            repo_role=issue.repo.role,
-            title=issue.title,
-            description=issue.description,
-            type=issue.type.value,
-            priority=issue.priority.value,
-            status=issue.status.value,
-            assignees=[a.model_dump() for a in issue.assignees],
-            watchers=[w.model_dump() for w in issue.watchers],
-            acceptance=issue.acceptance.model_dump() if issue.acceptance else {},
-            relationships=issue.relationships.model_dump()
-            if issue.relationships
-            else {},
-            runs=[],
-            tags=issue.tags,
-            meta=issue.meta,
-            created_at=now,
-            updated_at=now,
-        )
-
-        self.db.add(db_issue)
+        db_issue = self.stage_create(issue, actor_kind, actor_id, trace_id)
+        if db_issue is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMIssueModel, self._row_values(issue, trace_id)
+            )
         self.db.commit()
-        self.db.refresh(db_issue)
 
-        # Audit log
-        self.audit.log_create(
+        return db_issue
+
+    def stage_create(
+        self,
+        issue: IssueCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMIssueModel]:
+        """Insert a new Issue and stage its audit entry without committing.
+
+        Returns None if a client-supplied id already exists.
+        """
+        db_issue = _insert_new(
+            self.db, CWOMIssueModel, self._row_values(issue, trace_id), issue.id
+        )
+        if db_issue is None:
+            return None
+
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
             entity_kind="Issue",
             entity_id=db_issue.id,
             after=db_issue.to_dict(),
@@ -195,14 +677,108 @@ class IssueService:
             actor_id=actor_id,
             trace_id=trace_id,
         )
-
         return db_issue
 
-    def get(self, issue_id: str) -> Optional[CWOMIssueModel]:
-        """Get an Issue by ID with related objects."""
-        return (
-            self.db.query(CWOMIssueModel).filter(CWOMIssueModel.id == issue_id).first()
+    def bulk_create(
+        self,
+        issues: Sequence[IssueCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many Issues with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMIssueModel,
+            [self._row_values(issue, trace_id) for issue in issues],
+            actor_kind,
+            actor_id,
+            trace_id,
+        )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(issue: IssueCreate, trace_id: Optional[str]) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": issue.id or generate_ulid(),
+            "kind": "Issue",
+            "trace_id": trace_id,
+            "repo_id": issue.repo.id,
+            "repo_kind": _enum_value(issue.repo.kind),
+            "repo_role": issue.repo.role,
+            "title": issue.title,
+            "description": issue.description,
+            "type": issue.type,
+            "priority": issue.priority,
+            "status": issue.status,
+            "assignees": [a.model_dump() for a in issue.assignees],
+            "watchers": [w.model_dump() for w in issue.watchers],
+            "acceptance": issue.acceptance.model_dump() if issue.acceptance else {},
+            "relationships": issue.relationships.model_dump()
+            if issue.relationships
+            else {},
+            "runs": [],
+            "tags": issue.tags,
+            "meta": issue.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def get(
+        self, issue_id: str, include_related: bool = False
+    ) -> Optional[CWOMIssueModel]:
+        """Get an Issue by ID with related objects.
+
+        The collections read by ``to_dict`` are selectin-loaded up front so
+        serializing the Issue costs a fixed number of queries.
+        ``include_related`` also loads ``runs_rel`` and ``repo_obj`` for
+        callers that walk them.
+        """
+        options = [
+            selectinload(CWOMIssueModel.doctrine_refs_rel),
+            selectinload(CWOMIssueModel.constraint_snapshots),
+            selectinload(CWOMIssueModel.context_packets),
+        ]
+        if include_related:
+            options += [
+                selectinload(CWOMIssueModel.runs_rel),
+                selectinload(CWOMIssueModel.repo_obj),
+            ]
+        return self.db.get(CWOMIssueModel, issue_id, options=options)
+
+    def list_for_task_view(self, issue_ids: Sequence[str]) -> List[CWOMIssueModel]:
+        """Load Issues with everything ``issue_to_task`` reads from them.
+
+        The repo is joined in and the context packets and constraint
+        snapshots are selectin-loaded, so converting any number of Issues
+        costs three queries. Every other relationship is set to raise on
+        access, which turns an accidental lazy load into an error.
+        """
+        if not issue_ids:
+            return []
+        stmt = (
+            select(CWOMIssueModel)
+            .where(CWOMIssueModel.id.in_(issue_ids))
+            .options(
+                joinedload(CWOMIssueModel.repo_obj),
+                selectinload(CWOMIssueModel.context_packets),
+                selectinload(CWOMIssueModel.constraint_snapshots),
+                raiseload("*"),
+            )
         )
+        return list(self.db.scalars(stmt).unique())
+
+    def get_for_task_view(self, issue_id: str) -> Optional[CWOMIssueModel]:
+        """Load one Issue as ``list_for_task_view`` does."""
+        issues = self.list_for_task_view([issue_id])
+        return issues[0] if issues else None
 
     def list(
         self,
@@ -212,9 +788,14 @@ class IssueService:
         priority: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[CWOMIssueModel]:
-        """List Issues with optional filtering."""
-        query = self.db.query(CWOMIssueModel)
+        """List Issues with optional filtering.
+
+        ``fields`` restricts the columns loaded; see ``_only_fields``.
+        """
+        query = _only_fields(self.db.query(CWOMIssueModel), CWOMIssueModel, fields)
 
         if repo_id:
             query = query.filter(CWOMIssueModel.repo_id == repo_id)
@@ -226,7 +807,7 @@ class IssueService:
             query = query.filter(CWOMIssueModel.priority == priority)
 
         return (
-            query.order_by(desc(CWOMIssueModel.created_at))
+            _newest_first(query, CWOMIssueModel, after)
             .offset(offset)
             .limit(limit)
             .all()
@@ -240,19 +821,45 @@ class IssueService:
         actor_id: str = "cwom-service",
         trace_id: Optional[str] = None,
     ) -> Optional[CWOMIssueModel]:
-        """Update Issue status."""
-        issue = self.get(issue_id)
-        if not issue:
-            return None
-
-        old_status = issue.status
-        issue.status = status
-        issue.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
-        self.db.refresh(issue)
-
-        # Audit log
-        self.audit.log_status_change(
+        """Update Issue status.
+
+        On PostgreSQL this is a single ``UPDATE ... FROM ... RETURNING``: the
+        FROM subquery reads the row as it was before the update, so the old
+        status for the audit entry comes back with the new row. The subquery
+        locks the row (``FOR UPDATE``) so a concurrent status change is waited
+        for and its result read, rather than a snapshot from before it ran.
+        SQLite cannot return FROM-clause columns, so there the Issue is loaded
+        first.
+        """
+        now = utc_now()
+        if self.db.get_bind().dialect.name == "postgresql":
+            old = (
+                select(CWOMIssueModel.id, CWOMIssueModel.status)
+                .where(CWOMIssueModel.id == issue_id)
+                .with_for_update()
+                .subquery("old")
+            )
+            stmt = (
+                sql_update(CWOMIssueModel)
+                .where(CWOMIssueModel.id == old.c.id)
+                .values(status=status, updated_at=now)
+                .returning(CWOMIssueModel, old.c.status)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            row = self.db.execute(stmt).one_or_none()
+            if row is None:
+                return None
+            issue, old_status = row
+        else:
+            issue = self.get(issue_id)
+            if not issue:
+                return None
+            old_status = issue.status
+            issue.status = status
+            issue.updated_at = now
+
+        # Audit log, committed with the status change
+        self.audit.stage_status_change(
             entity_kind="Issue",
             entity_id=issue.id,
             old_status=old_status,
@@ -261,9 +868,46 @@ class IssueService:
             actor_id=actor_id,
             trace_id=trace_id or issue.trace_id,
         )
+        self.db.commit()
 
         return issue
 
+    # Association table and target column for each kind stage_link accepts
+    _LINK_TABLES = {
+        "ContextPacket": (issue_context_packets, "context_packet_id"),
+        "DoctrineRef": (issue_doctrine_refs, "doctrine_ref_id"),
+        "ConstraintSnapshot": (issue_constraint_snapshots, "constraint_snapshot_id"),
+    }
+
+    def stage_link(
+        self,
+        issue_id: str,
+        linked_kind: str,
+        linked_id: str,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> bool:
+        """Link an object to an Issue and stage the audit entry without committing.
+
+        ``linked_kind`` is ContextPacket, DoctrineRef or ConstraintSnapshot.
+        Returns False, with nothing staged, if the link already exists.
+        """
+        table, column = self._LINK_TABLES[linked_kind]
+        if not _insert_link(self.db, table, {"issue_id": issue_id, column: linked_id}):
+            return False
+
+        self.audit.stage_link(
+            entity_kind="Issue",
+            entity_id=issue_id,
+            linked_kind=linked_kind,
+            linked_id=linked_id,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            trace_id=trace_id,
+        )
+        return True
+
     def link_context_packet(
         self,
         issue_id: str,
@@ -273,29 +917,12 @@ class IssueService:
         trace_id: Optional[str] = None,
     ) -> bool:
         """Link a ContextPacket to an Issue."""
-        stmt = issue_context_packets.insert().values(
-            issue_id=issue_id,
-            context_packet_id=context_packet_id,
+        linked = self.stage_link(
+            issue_id, "ContextPacket", context_packet_id, actor_kind, actor_id, trace_id
         )
-        try:
-            self.db.execute(stmt)
+        if linked:
             self.db.commit()
-
-            # Audit log
-            self.audit.log_link(
-                entity_kind="Issue",
-                entity_id=issue_id,
-                linked_kind="ContextPacket",
-                linked_id=context_packet_id,
-                actor_kind=actor_kind,
-                actor_id=actor_id,
-                trace_id=trace_id,
-            )
-
-            return True
-        except Exception:
-            self.db.rollback()
-            return False
+        return linked
 
     def link_doctrine_ref(
         self,
@@ -306,29 +933,12 @@ class IssueService:
         trace_id: Optional[str] = None,
     ) -> bool:
         """Link a DoctrineRef to an Issue."""
-        stmt = issue_doctrine_refs.insert().values(
-            issue_id=issue_id,
-            doctrine_ref_id=doctrine_ref_id,
+        linked = self.stage_link(
+            issue_id, "DoctrineRef", doctrine_ref_id, actor_kind, actor_id, trace_id
         )
-        try:
-            self.db.execute(stmt)
+        if linked:
             self.db.commit()
-
-            # Audit log
-            self.audit.log_link(
-                entity_kind="Issue",
-                entity_id=issue_id,
-                linked_kind="DoctrineRef",
-                linked_id=doctrine_ref_id,
-                actor_kind=actor_kind,
-                actor_id=actor_id,
-                trace_id=trace_id,
-            )
-
-            return True
-        except Exception:
-            self.db.rollback()
-            return False
+        return linked
 
     def link_constraint_snapshot(
         self,
@@ -339,29 +949,17 @@ class IssueService:
         trace_id: Optional[str] = None,
     ) -> bool:
         """Link a ConstraintSnapshot to an Issue."""
-        stmt = issue_constraint_snapshots.insert().values(
-            issue_id=issue_id,
-            constraint_snapshot_id=constraint_snapshot_id,
+        linked = self.stage_link(
+            issue_id,
+            "ConstraintSnapshot",
+            constraint_snapshot_id,
+            actor_kind,
+            actor_id,
+            trace_id,
         )
-        try:
-            self.db.execute(stmt)
+        if linked:
             self.db.commit()
-
-            # Audit log
-            self.audit.log_link(
-                entity_kind="Issue",
-                entity_id=issue_id,
-                linked_kind="ConstraintSnapshot",
-                linked_id=constraint_snapshot_id,
-                actor_kind=actor_kind,
-                actor_id=actor_id,
-                trace_id=trace_id,
-            )
-
-            return True
-        except Exception:
-            self.db.rollback()
-            return False
+        return linked
 
 
 class ContextPacketService:
@@ -371,6 +969,8 @@ class ContextPacketService:
     To update context, create a new ContextPacket with an incremented version.
     """
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -383,50 +983,49 @@ class ContextPacketService:
         trace_id: Optional[str] = None,
     ) -> CWOMContextPacketModel:
         """Create a new ContextPacket."""
-        now = datetime.now(timezone.utc)
-        db_packet = CWOMContextPacketModel(
-            id=generate_ulid(),
-            kind="ContextPacket",
-            trace_id=trace_id,
-            for_issue_id=packet.for_issue.id,
-            for_issue_kind=packet.for_issue.kind.value
-            if hasattr(packet.for_issue.kind, "value")
-            else str(packet.for_issue.kind),
-            for_issue_role=packet.for_issue.role,
-            version=packet.version,
-            summary=packet.summary,
-            inputs=packet.inputs.model_dump() if packet.inputs else {},
-            assumptions=packet.assumptions,
-            open_questions=packet.open_questions,
-            instructions=packet.instructions,
-            constraint_snapshot_id=packet.constraint_snapshot.id
-            if packet.constraint_snapshot
-            else None,
-            tags=packet.tags,
-            meta=packet.meta,
-            created_at=now,
-            updated_at=now,
+        db_packet = self.stage_create(packet, actor_kind, actor_id, trace_id)
+        if db_packet is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMContextPacketModel, self._row_values(packet, trace_id)
+            )
+        self.db.commit()
+
+        return db_packet
+
+    def stage_create(
+        self,
+        packet: ContextPacketCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMContextPacketModel]:
+        """Insert a new ContextPacket and stage its audit entry without committing.
+
+        Returns None if a client-supplied id already exists.
+        """
+        db_packet = _insert_new(
+            self.db,
+            CWOMContextPacketModel,
+            self._row_values(packet, trace_id),
+            packet.id,
         )
+        if db_packet is None:
+            return None
 
-        self.db.add(db_packet)
-        self.db.commit()
-        self.db.refresh(db_packet)
-
-        # Link doctrine refs if provided
-        if packet.doctrine_refs:
-            for ref in packet.doctrine_refs:
-                stmt = context_packet_doctrine_refs.insert().values(
-                    context_packet_id=db_packet.id,
-                    doctrine_ref_id=ref.id,
-                )
-                try:
-                    self.db.execute(stmt)
-                except Exception:
-                    pass  # Ignore duplicate links
-            self.db.commit()
+        # Link doctrine refs if provided; committed with the packet
+        _link_all(
+            self.db,
+            context_packet_doctrine_refs,
+            "context_packet_id",
+            db_packet.id,
+            "doctrine_ref_id",
+            CWOMDoctrineRefModel,
+            [ref.id for ref in packet.doctrine_refs or ()],
+        )
 
-        # Audit log
-        self.audit.log_create(
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
             entity_kind="ContextPacket",
             entity_id=db_packet.id,
             after=db_packet.to_dict(),
@@ -435,15 +1034,78 @@ class ContextPacketService:
             trace_id=trace_id,
             note="Immutable object created",
         )
-
         return db_packet
 
+    def bulk_create(
+        self,
+        packets: Sequence[ContextPacketCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many ContextPackets with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMContextPacketModel,
+            [self._row_values(packet, trace_id) for packet in packets],
+            actor_kind,
+            actor_id,
+            trace_id,
+            note="Immutable object created",
+        )
+
+        # Link doctrine refs per packet; committed with the packets
+        for packet, packet_id in zip(packets, ids):
+            _link_all(
+                self.db,
+                context_packet_doctrine_refs,
+                "context_packet_id",
+                packet_id,
+                "doctrine_ref_id",
+                CWOMDoctrineRefModel,
+                [ref.id for ref in packet.doctrine_refs or ()],
+            )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(
+        packet: ContextPacketCreate, trace_id: Optional[str]
+    ) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": packet.id or generate_ulid(),
+            "kind": "ContextPacket",
+            "trace_id": trace_id,
+            "for_issue_id": packet.for_issue.id,
+            "for_issue_kind": _enum_value(packet.for_issue.kind),
+            "for_issue_role": packet.for_issue.role,
+            "version": packet.version,
+            "summary": packet.summary,
+            "inputs": packet.inputs.model_dump() if packet.inputs else {},
+            "assumptions": packet.assumptions,
+            "open_questions": packet.open_questions,
+            "instructions": packet.instructions,
+            "constraint_snapshot_id": packet.constraint_snapshot.id
+            if packet.constraint_snapshot
+            else None,
+            "tags": packet.tags,
+            "meta": packet.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def get(self, packet_id: str) -> Optional[CWOMContextPacketModel]:
-        """Get a ContextPacket by ID."""
-        return (
-            self.db.query(CWOMContextPacketModel)
-            .filter(CWOMContextPacketModel.id == packet_id)
-            .first()
+        """Get a ContextPacket by ID with its DoctrineRefs loaded."""
+        return self.db.get(
+            CWOMContextPacketModel,
+            packet_id,
+            options=[selectinload(CWOMContextPacketModel.doctrine_refs_rel)],
         )
 
     def list_for_issue(
@@ -451,25 +1113,52 @@ class ContextPacketService:
         issue_id: str,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMContextPacketModel]:
         """List ContextPackets for an Issue."""
+        return self._list_for_issue_query(issue_id, limit, offset, after).all()
+
+    def stream_for_issue(
+        self,
+        issue_id: str,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[CWOMContextPacketModel]:
+        """Yield an Issue's ContextPackets, newest first, in batches.
+
+        Rows are fetched ``_STREAM_BATCH`` at a time (through a server-side
+        cursor where the driver has one), so large ``inputs`` payloads are
+        not all held in memory at once. Unbounded unless ``limit`` is given.
+        """
+        return self._list_for_issue_query(issue_id, limit, 0, after).yield_per(
+            _STREAM_BATCH
+        )
+
+    def _list_for_issue_query(
+        self,
+        issue_id: str,
+        limit: Optional[int],
+        offset: int,
+        after: Optional[str],
+    ) -> Query:
+        query = self.db.query(CWOMContextPacketModel).filter(
+            CWOMContextPacketModel.for_issue_id == issue_id
+        )
         return (
-            self.db.query(CWOMContextPacketModel)
-            .filter(CWOMContextPacketModel.for_issue_id == issue_id)
-            .order_by(desc(CWOMContextPacketModel.created_at))
+            _newest_first(query, CWOMContextPacketModel, after)
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
     def get_latest_for_issue(self, issue_id: str) -> Optional[CWOMContextPacketModel]:
         """Get the latest ContextPacket for an Issue."""
-        return (
-            self.db.query(CWOMContextPacketModel)
-            .filter(CWOMContextPacketModel.for_issue_id == issue_id)
+        stmt = (
+            select(CWOMContextPacketModel)
+            .where(CWOMContextPacketModel.for_issue_id == issue_id)
             .order_by(desc(CWOMContextPacketModel.created_at))
-            .first()
+            .limit(1)
         )
+        return self.db.scalars(stmt).first()
 
 
 class ConstraintSnapshotService:
@@ -479,6 +1168,8 @@ class ConstraintSnapshotService:
     To update constraints, create a new ConstraintSnapshot.
     """
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -491,31 +1182,40 @@ class ConstraintSnapshotService:
         trace_id: Optional[str] = None,
     ) -> CWOMConstraintSnapshotModel:
         """Create a new ConstraintSnapshot."""
-        now = datetime.now(timezone.utc)
-        db_snapshot = CWOMConstraintSnapshotModel(
-            id=generate_ulid(),
-            kind="ConstraintSnapshot",
-            trace_id=trace_id,
-            scope=snapshot.scope.value,
-            captured_at=now,  # Always captured at creation time
-            owner_kind=snapshot.owner.actor_kind.value
-            if hasattr(snapshot.owner.actor_kind, "value")
-            else str(snapshot.owner.actor_kind),
-            owner_id=snapshot.owner.actor_id,
-            owner_display=snapshot.owner.display,
-            constraints=snapshot.constraints.model_dump()
-            if snapshot.constraints
-            else {},
-            tags=snapshot.tags,
-            meta=snapshot.meta,
-        )
-
-        self.db.add(db_snapshot)
+        db_snapshot = self.stage_create(snapshot, actor_kind, actor_id, trace_id)
+        if db_snapshot is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db,
+                CWOMConstraintSnapshotModel,
+                self._row_values(snapshot, trace_id),
+            )
         self.db.commit()
-        self.db.refresh(db_snapshot)
 
-        # Audit log
-        self.audit.log_create(
+        return db_snapshot
+
+    def stage_create(
+        self,
+        snapshot: ConstraintSnapshotCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMConstraintSnapshotModel]:
+        """Insert a new ConstraintSnapshot and stage its audit entry without committing.
+
+        Returns None if a client-supplied id already exists.
+        """
+        db_snapshot = _insert_new(
+            self.db,
+            CWOMConstraintSnapshotModel,
+            self._row_values(snapshot, trace_id),
+            snapshot.id,
+        )
+        if db_snapshot is None:
+            return None
+
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
             entity_kind="ConstraintSnapshot",
             entity_id=db_snapshot.id,
             after=db_snapshot.to_dict(),
@@ -524,16 +1224,57 @@ class ConstraintSnapshotService:
             trace_id=trace_id,
             note="Immutable object created",
         )
-
         return db_snapshot
 
+    def bulk_create(
+        self,
+        snapshots: Sequence[ConstraintSnapshotCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many ConstraintSnapshots with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMConstraintSnapshotModel,
+            [self._row_values(snapshot, trace_id) for snapshot in snapshots],
+            actor_kind,
+            actor_id,
+            trace_id,
+            note="Immutable object created",
+        )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(
+        snapshot: ConstraintSnapshotCreate, trace_id: Optional[str]
+    ) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": snapshot.id or generate_ulid(),
+            "kind": "ConstraintSnapshot",
+            "trace_id": trace_id,
+            "scope": snapshot.scope.value,
+            "captured_at": now,  # Always captured at creation time
+            "owner_kind": snapshot.owner.actor_kind,
+            "owner_id": snapshot.owner.actor_id,
+            "owner_display": snapshot.owner.display,
+            "constraints": snapshot.constraints.model_dump()
+            if snapshot.constraints
+            else {},
+            "tags": snapshot.tags,
+            "meta": snapshot.meta,
+        }
+
     def get(self, snapshot_id: str) -> Optional[CWOMConstraintSnapshotModel]:
         """Get a ConstraintSnapshot by ID."""
-        return (
-            self.db.query(CWOMConstraintSnapshotModel)
-            .filter(CWOMConstraintSnapshotModel.id == snapshot_id)
-            .first()
-        )
+        return self.db.get(CWOMConstraintSnapshotModel, snapshot_id)
 
     def list(
         self,
@@ -541,8 +1282,45 @@ class ConstraintSnapshotService:
         owner_id: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMConstraintSnapshotModel]:
         """List ConstraintSnapshots with optional filtering."""
+        return self._list_query(
+            scope=scope,
+            owner_id=owner_id,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_dicts(
+        self,
+        scope: Optional[str] = None,
+        owner_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List ConstraintSnapshots as dicts using a column projection."""
+        return _project_dicts(
+            CWOMConstraintSnapshotModel,
+            self._list_query(
+                scope=scope,
+                owner_id=owner_id,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_query(
+        self,
+        scope: Optional[str] = None,
+        owner_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMConstraintSnapshotModel)
 
         if scope:
@@ -551,16 +1329,22 @@ class ConstraintSnapshotService:
             query = query.filter(CWOMConstraintSnapshotModel.owner_id == owner_id)
 
         return (
-            query.order_by(desc(CWOMConstraintSnapshotModel.captured_at))
+            _newest_first(
+                query,
+                CWOMConstraintSnapshotModel,
+                after,
+                CWOMConstraintSnapshotModel.captured_at,
+            )
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
 
 class DoctrineRefService:
     """Service for managing CWOM DoctrineRef objects."""
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -573,34 +1357,56 @@ class DoctrineRefService:
         trace_id: Optional[str] = None,
     ) -> CWOMDoctrineRefModel:
         """Create a new DoctrineRef."""
-        now = datetime.now(timezone.utc)
-        db_doctrine = CWOMDoctrineRefModel(
-            id=generate_ulid(),
-            kind="DoctrineRef",
-            trace_id=trace_id,
-            namespace=doctrine.namespace,
-            name=doctrine.name,
-            version=doctrine.version,
-            type=doctrine.type.value,
-            priority=doctrine.priority.value,
-            statement=doctrine.statement,
-            rationale=doctrine.rationale,
-            links=doctrine.links,
-            applicability=doctrine.applicability.model_dump()
-            if doctrine.applicability
-            else {},
-            tags=doctrine.tags,
-            meta=doctrine.meta,
-            created_at=now,
-            updated_at=now,
+        db_doctrine = _insert_new(
+            self.db,
+            CWOMDoctrineRefModel,
+            self._row_values(doctrine, trace_id),
+            doctrine.id,
         )
+        if db_doctrine is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMDoctrineRefModel, self._row_values(doctrine, trace_id)
+            )
 
-        self.db.add(db_doctrine)
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
+            entity_kind="DoctrineRef",
+            entity_id=db_doctrine.id,
+            after=db_doctrine.to_dict(),
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            trace_id=trace_id,
+        )
         self.db.commit()
-        self.db.refresh(db_doctrine)
 
-        # Audit log
-        self.audit.log_create(
+        return db_doctrine
+
+    def create_if_absent(
+        self,
+        doctrine: DoctrineRefCreate,
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> Optional[CWOMDoctrineRefModel]:
+        """Create a new DoctrineRef, or return None if namespace/name/version exists."""
+        db_doctrine = _insert_unless_exists(
+            self.db,
+            CWOMDoctrineRefModel,
+            self._row_values(doctrine, trace_id),
+            ["namespace", "name", "version"],
+            doctrine.id,
+        )
+        if db_doctrine is None:
+            if doctrine.id is None or self.get(doctrine.id) is None:
+                return None
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMDoctrineRefModel, self._row_values(doctrine, trace_id)
+            )
+
+        # Audit log, committed together with the inserted row
+        self.audit.stage_create(
             entity_kind="DoctrineRef",
             entity_id=db_doctrine.id,
             after=db_doctrine.to_dict(),
@@ -608,32 +1414,79 @@ class DoctrineRefService:
             actor_id=actor_id,
             trace_id=trace_id,
         )
+        self.db.commit()
 
         return db_doctrine
 
+    def bulk_create(
+        self,
+        doctrines: Sequence[DoctrineRefCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many DoctrineRefs with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMDoctrineRefModel,
+            [self._row_values(doctrine, trace_id) for doctrine in doctrines],
+            actor_kind,
+            actor_id,
+            trace_id,
+        )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(
+        doctrine: DoctrineRefCreate, trace_id: Optional[str]
+    ) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": doctrine.id or generate_ulid(),
+            "kind": "DoctrineRef",
+            "trace_id": trace_id,
+            "namespace": doctrine.namespace,
+            "name": doctrine.name,
+            "version": doctrine.version,
+            "type": doctrine.type,
+            "priority": doctrine.priority,
+            "statement": doctrine.statement,
+            "rationale": doctrine.rationale,
+            "links": doctrine.links,
+            "applicability": doctrine.applicability.model_dump()
+            if doctrine.applicability
+            else {},
+            "tags": doctrine.tags,
+            "meta": doctrine.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def get(self, doctrine_id: str) -> Optional[CWOMDoctrineRefModel]:
         """Get a DoctrineRef by ID."""
-        return (
-            self.db.query(CWOMDoctrineRefModel)
-            .filter(CWOMDoctrineRefModel.id == doctrine_id)
-            .first()
-        )
+        return self.db.get(CWOMDoctrineRefModel, doctrine_id)
 
     def get_by_name(
         self, namespace: str, name: str, version: Optional[str] = None
     ) -> Optional[CWOMDoctrineRefModel]:
         """Get a DoctrineRef by namespace, name, and optionally version."""
-        query = self.db.query(CWOMDoctrineRefModel).filter(
+        stmt = select(CWOMDoctrineRefModel).where(
             CWOMDoctrineRefModel.namespace == namespace,
             CWOMDoctrineRefModel.name == name,
         )
         if version:
-            query = query.filter(CWOMDoctrineRefModel.version == version)
+            stmt = stmt.where(CWOMDoctrineRefModel.version == version)
         else:
             # Get latest version
-            query = query.order_by(desc(CWOMDoctrineRefModel.created_at))
+            stmt = stmt.order_by(desc(CWOMDoctrineRefModel.created_at))
 
-        return query.first()
+        return self.db.scalars(stmt.limit(1)).first()
 
     def list(
         self,
@@ -644,6 +1497,42 @@ class DoctrineRefService:
         offset: int = 0,
     ) -> List[CWOMDoctrineRefModel]:
         """List DoctrineRefs with optional filtering."""
+        return self._list_query(
+            namespace=namespace,
+            doctrine_type=doctrine_type,
+            priority=priority,
+            limit=limit,
+            offset=offset,
+        ).all()
+
+    def list_dicts(
+        self,
+        namespace: Optional[str] = None,
+        doctrine_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """List DoctrineRefs as dicts using a column projection."""
+        return _project_dicts(
+            CWOMDoctrineRefModel,
+            self._list_query(
+                namespace=namespace,
+                doctrine_type=doctrine_type,
+                priority=priority,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+
+    def _list_query(
+        self,
+        namespace: Optional[str] = None,
+        doctrine_type: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Query:
         query = self.db.query(CWOMDoctrineRefModel)
 
         if namespace:
@@ -657,13 +1546,14 @@ class DoctrineRefService:
             query.order_by(CWOMDoctrineRefModel.namespace, CWOMDoctrineRefModel.name)
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
 
 class RunService:
     """Service for managing CWOM Run objects."""
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -676,75 +1566,39 @@ class RunService:
         trace_id: Optional[str] = None,
     ) -> CWOMRunModel:
         """Create a new Run."""
-        from .enums import Status
-
-        now = datetime.now(timezone.utc)
-
-        # RunCreate doesn't include status - new runs start as "planned"
-        status = Status.PLANNED
-
-        db_run = CWOMRunModel(
-            id=generate_ulid(),
-            kind="Run",
-            trace_id=trace_id,
-            for_issue_id=run.for_issue.id,
-            for_issue_kind=run.for_issue.kind.value
-            if hasattr(run.for_issue.kind, "value")
-            else str(run.for_issue.kind),
-            for_issue_role=run.for_issue.role,
-            repo_id=run.repo.id,
-            repo_kind=run.repo.kind.value
-            if hasattr(run.repo.kind, "value")
-            else str(run.repo.kind),
-            repo_role=run.repo.role,
-            status=status.value,
-            mode=run.mode.value,
-            executor=run.executor.model_dump(),
-            inputs=run.inputs.model_dump() if run.inputs else {},
-            constraint_snapshot_id=None,  # Set via update if needed
-            plan=run.plan.model_dump() if run.plan else {},
-            telemetry={},  # Set via update
-            cost={},  # Set via update
-            outputs={},  # Set via update
-            failure=None,  # Set via update if failed
-            tags=run.tags,
-            meta=run.meta,
-            created_at=now,
-            updated_at=now,
+        db_run = _insert_new(
+            self.db, CWOMRunModel, self._row_values(run, trace_id), run.id
         )
+        if db_run is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMRunModel, self._row_values(run, trace_id)
+            )
 
-        self.db.add(db_run)
-        self.db.commit()
-        self.db.refresh(db_run)
-
-        # Link context packets if provided in inputs
-        if run.inputs and run.inputs.context_packets:
-            for ref in run.inputs.context_packets:
-                stmt = run_context_packets.insert().values(
-                    run_id=db_run.id,
-                    context_packet_id=ref.id,
-                )
-                try:
-                    self.db.execute(stmt)
-                except Exception:
-                    pass
-            self.db.commit()
-
-        # Link doctrine refs if provided in inputs
-        if run.inputs and run.inputs.doctrine_refs:
-            for ref in run.inputs.doctrine_refs:
-                stmt = run_doctrine_refs.insert().values(
-                    run_id=db_run.id,
-                    doctrine_ref_id=ref.id,
-                )
-                try:
-                    self.db.execute(stmt)
-                except Exception:
-                    pass
-            self.db.commit()
+        # Link context packets and doctrine refs from inputs, one statement
+        # per association table, committed together with the run
+        if run.inputs:
+            _link_all(
+                self.db,
+                run_context_packets,
+                "run_id",
+                db_run.id,
+                "context_packet_id",
+                CWOMContextPacketModel,
+                [ref.id for ref in run.inputs.context_packets],
+            )
+            _link_all(
+                self.db,
+                run_doctrine_refs,
+                "run_id",
+                db_run.id,
+                "doctrine_ref_id",
+                CWOMDoctrineRefModel,
+                [ref.id for ref in run.inputs.doctrine_refs],
+            )
 
-        # Audit log
-        self.audit.log_create(
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
             entity_kind="Run",
             entity_id=db_run.id,
             after=db_run.to_dict(),
@@ -752,12 +1606,95 @@ class RunService:
             actor_id=actor_id,
             trace_id=trace_id,
         )
+        self.db.commit()
 
         return db_run
 
+    def bulk_create(
+        self,
+        runs: Sequence[RunCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many Runs with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMRunModel,
+            [self._row_values(run, trace_id) for run in runs],
+            actor_kind,
+            actor_id,
+            trace_id,
+        )
+
+        # Link context packets and doctrine refs per run; committed with the runs
+        for run, run_id in zip(runs, ids):
+            if not run.inputs:
+                continue
+            _link_all(
+                self.db,
+                run_context_packets,
+                "run_id",
+                run_id,
+                "context_packet_id",
+                CWOMContextPacketModel,
+                [ref.id for ref in run.inputs.context_packets],
+            )
+            _link_all(
+                self.db,
+                run_doctrine_refs,
+                "run_id",
+                run_id,
+                "doctrine_ref_id",
+                CWOMDoctrineRefModel,
+                [ref.id for ref in run.inputs.doctrine_refs],
+            )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(run: RunCreate, trace_id: Optional[str]) -> Dict[str, Any]:
+        from .enums import Status
+
+        now = utc_now()
+
+        # RunCreate doesn't include status - new runs start as "planned"
+        status = Status.PLANNED
+
+        return {
+            "id": run.id or generate_ulid(),
+            "kind": "Run",
+            "trace_id": trace_id,
+            "for_issue_id": run.for_issue.id,
+            "for_issue_kind": _enum_value(run.for_issue.kind),
+            "for_issue_role": run.for_issue.role,
+            "repo_id": run.repo.id,
+            "repo_kind": _enum_value(run.repo.kind),
+            "repo_role": run.repo.role,
+            "status": status.value,
+            "mode": run.mode.value,
+            "executor": run.executor.model_dump(),
+            "inputs": run.inputs.model_dump() if run.inputs else {},
+            "constraint_snapshot_id": None,  # Set via update if needed
+            "plan": run.plan.model_dump() if run.plan else {},
+            "telemetry": {},  # Set via update
+            "cost": {},  # Set via update
+            "outputs": {},  # Set via update
+            "failure": None,  # Set via update if failed
+            "tags": run.tags,
+            "meta": run.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def get(self, run_id: str) -> Optional[CWOMRunModel]:
         """Get a Run by ID."""
-        return self.db.query(CWOMRunModel).filter(CWOMRunModel.id == run_id).first()
+        return self.db.get(CWOMRunModel, run_id)
 
     def list(
         self,
@@ -767,8 +1704,72 @@ class RunService:
         mode: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[CWOMRunModel]:
-        """List Runs with optional filtering."""
+        """List Runs with optional filtering.
+
+        ``fields`` restricts the columns loaded; see ``_only_fields``.
+        """
+        query = self._list_query(
+            issue_id=issue_id,
+            repo_id=repo_id,
+            status=status,
+            mode=mode,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+        return _only_fields(query, CWOMRunModel, fields).all()
+
+    def list_dicts(
+        self,
+        issue_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        status: Optional[str] = None,
+        mode: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List Runs as dicts, served from the denormalized ``cached_json``."""
+        rows = (
+            self._list_query(
+                issue_id=issue_id,
+                repo_id=repo_id,
+                status=status,
+                mode=mode,
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
+            .with_entities(CWOMRunModel.id, CWOMRunModel.cached_json)
+            .all()
+        )
+        stale = [row.id for row in rows if row.cached_json is None]
+        if not stale:
+            return [row.cached_json for row in rows]
+
+        # Rows written before cached_json existed: build those from columns
+        fallback = {
+            d["id"]: d
+            for d in _project_dicts(
+                CWOMRunModel,
+                self.db.query(CWOMRunModel).filter(CWOMRunModel.id.in_(stale)),
+            )
+        }
+        return [row.cached_json or fallback[row.id] for row in rows]
+
+    def _list_query(
+        self,
+        issue_id: Optional[str] = None,
+        repo_id: Optional[str] = None,
+        status: Optional[str] = None,
+        mode: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMRunModel)
 
         if issue_id:
@@ -780,12 +1781,7 @@ class RunService:
         if mode:
             query = query.filter(CWOMRunModel.mode == mode)
 
-        return (
-            query.order_by(desc(CWOMRunModel.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
+        return _newest_first(query, CWOMRunModel, after).offset(offset).limit(limit)
 
     def update(
         self,
@@ -800,58 +1796,74 @@ class RunService:
         if not run:
             return None
 
-        # Capture before state for audit
-        before_state = run.to_dict()
         old_status = run.status
+        status_changed = update.status is not None and old_status != update.status
 
         # Update allowed fields
         # Use mode='json' to serialize datetime objects properly
+        values: Dict[str, Any] = {}
         if update.status is not None:
-            run.status = (
-                update.status.value
-                if hasattr(update.status, "value")
-                else str(update.status)
-            )
+            values["status"] = update.status
 
         if update.telemetry is not None:
-            run.telemetry = update.telemetry.model_dump(mode="json")
+            values["telemetry"] = update.telemetry.model_dump(mode="json")
 
         if update.cost is not None:
-            run.cost = update.cost.model_dump(mode="json")
+            values["cost"] = update.cost.model_dump(mode="json")
 
         if update.outputs is not None:
-            run.outputs = update.outputs.model_dump(mode="json")
+            values["outputs"] = update.outputs.model_dump(mode="json")
 
         if update.failure is not None:
-            run.failure = update.failure.model_dump(mode="json")
+            values["failure"] = update.failure.model_dump(mode="json")
 
-        run.updated_at = datetime.now(timezone.utc)
+        # A general update is audited as a diff of the fields it writes, so
+        # the old values are read before they are overwritten below
+        before_state: Dict[str, Any] = (
+            {} if status_changed else {key: getattr(run, key) for key in values}
+        )
+        values["updated_at"] = utc_now()
+
+        # Apply the new values to the loaded instance as committed state, then
+        # write exactly those columns (plus cached_json) in one Core UPDATE.
+        # This replaces the ORM flush and the refresh SELECT that followed it;
+        # the before_update hook does not fire, so cached_json is set here.
+        for key, value in values.items():
+            set_committed_value(run, key, value)
+        after_state = run.to_dict()
+        set_committed_value(run, "cached_json", after_state)
+        values["cached_json"] = after_state
+        effective_trace_id = trace_id or run.trace_id
 
-        self.db.commit()
-        self.db.refresh(run)
+        self.db.execute(
+            sql_update(CWOMRunModel.__table__)
+            .where(CWOMRunModel.id == run_id)
+            .values(**values)
+        )
 
-        # Audit log - status change or general update
-        effective_trace_id = trace_id or run.trace_id
-        if update.status is not None and old_status != run.status:
-            self.audit.log_status_change(
+        # Audit log - status change or general update, committed with the
+        # UPDATE. Reads only the locals captured above.
+        if status_changed:
+            self.audit.stage_status_change(
                 entity_kind="Run",
-                entity_id=run.id,
+                entity_id=run_id,
                 old_status=old_status,
-                new_status=run.status,
+                new_status=update.status,
                 actor_kind=actor_kind,
                 actor_id=actor_id,
                 trace_id=effective_trace_id,
             )
         else:
-            self.audit.log_update(
+            self.audit.stage_update(
                 entity_kind="Run",
-                entity_id=run.id,
+                entity_id=run_id,
                 before=before_state,
-                after=run.to_dict(),
+                after={key: after_state[key] for key in before_state},
                 actor_kind=actor_kind,
                 actor_id=actor_id,
                 trace_id=effective_trace_id,
             )
+        self.db.commit()
 
         return run
 
@@ -859,6 +1871,8 @@ class RunService:
 class ArtifactService:
     """Service for managing CWOM Artifact objects."""
 
+    __slots__ = ("db", "audit")
+
     def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
         self.audit = audit or AuditService(db)
@@ -871,43 +1885,20 @@ class ArtifactService:
         trace_id: Optional[str] = None,
     ) -> CWOMArtifactModel:
         """Create a new Artifact."""
-        now = datetime.now(timezone.utc)
-        db_artifact = CWOMArtifactModel(
-            id=generate_ulid(),
-            kind="Artifact",
-            trace_id=trace_id,
-            produced_by_id=artifact.produced_by.id,
-            produced_by_kind=artifact.produced_by.kind.value
-            if hasattr(artifact.produced_by.kind, "value")
-            else str(artifact.produced_by.kind),
-            produced_by_role=artifact.produced_by.role,
-            for_issue_id=artifact.for_issue.id,
-            for_issue_kind=artifact.for_issue.kind.value
-            if hasattr(artifact.for_issue.kind, "value")
-            else str(artifact.for_issue.kind),
-            for_issue_role=artifact.for_issue.role,
-            type=artifact.type.value,
-            title=artifact.title,
-            uri=artifact.uri,
-            digest=artifact.digest,
-            media_type=artifact.media_type,
-            size_bytes=artifact.size_bytes,
-            preview=artifact.preview,
-            verification=artifact.verification.model_dump()
-            if artifact.verification
-            else {},
-            tags=artifact.tags,
-            meta=artifact.meta,
-            created_at=now,
-            updated_at=now,
+        db_artifact = _insert_new(
+            self.db,
+            CWOMArtifactModel,
+            self._row_values(artifact, trace_id),
+            artifact.id,
         )
+        if db_artifact is None:
+            # The client id is taken: a retry, or a different object
+            return _stored_for_retry(
+                self.db, CWOMArtifactModel, self._row_values(artifact, trace_id)
+            )
 
-        self.db.add(db_artifact)
-        self.db.commit()
-        self.db.refresh(db_artifact)
-
-        # Audit log
-        self.audit.log_create(
+        # Audit log, committed in the same transaction
+        self.audit.stage_create(
             entity_kind="Artifact",
             entity_id=db_artifact.id,
             after=db_artifact.to_dict(),
@@ -915,16 +1906,68 @@ class ArtifactService:
             actor_id=actor_id,
             trace_id=trace_id,
         )
+        self.db.commit()
 
         return db_artifact
 
+    def bulk_create(
+        self,
+        artifacts: Sequence[ArtifactCreate],
+        actor_kind: str = "system",
+        actor_id: str = "cwom-service",
+        trace_id: Optional[str] = None,
+    ) -> List[str]:
+        """Create many Artifacts with batched INSERTs and a single commit.
+
+        Returns the new ids in input order.
+        """
+        ids = _bulk_insert(
+            self.db,
+            self.audit,
+            CWOMArtifactModel,
+            [self._row_values(artifact, trace_id) for artifact in artifacts],
+            actor_kind,
+            actor_id,
+            trace_id,
+        )
+        self.db.commit()
+
+        return ids
+
+    @staticmethod
+    def _row_values(
+        artifact: ArtifactCreate, trace_id: Optional[str]
+    ) -> Dict[str, Any]:
+        now = utc_now()
+        return {
+            "id": artifact.id or generate_ulid(),
+            "kind": "Artifact",
+            "trace_id": trace_id,
+            "produced_by_id": artifact.produced_by.id,
+            "produced_by_kind": _enum_value(artifact.produced_by.kind),
+            "produced_by_role": artifact.produced_by.role,
+            "for_issue_id": artifact.for_issue.id,
+            "for_issue_kind": _enum_value(artifact.for_issue.kind),
+            "for_issue_role": artifact.for_issue.role,
+            "type": artifact.type,
+            "title": artifact.title,
+            "uri": artifact.uri,
+            "digest": artifact.digest,
+            "media_type": artifact.media_type,
+            "size_bytes": artifact.size_bytes,
+            "preview": artifact.preview,
+            "verification": artifact.verification.model_dump()
+            if artifact.verification
+            else {},
+            "tags": artifact.tags,
+            "meta": artifact.meta,
+            "created_at": now,
+            "updated_at": now,
+        }
+
     def get(self, artifact_id: str) -> Optional[CWOMArtifactModel]:
         """Get an Artifact by ID."""
-        return (
-            self.db.query(CWOMArtifactModel)
-            .filter(CWOMArtifactModel.id == artifact_id)
-            .first()
-        )
+        return self.db.get(CWOMArtifactModel, artifact_id)
 
     def list_for_run(
         self,
@@ -932,8 +1975,68 @@ class ArtifactService:
         artifact_type: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[CWOMArtifactModel]:
-        """List Artifacts produced by a Run."""
+        """List Artifacts produced by a Run.
+
+        ``fields`` restricts the columns loaded; see ``_only_fields``.
+        """
+        query = self._list_for_run_query(
+            run_id=run_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+        return _only_fields(query, CWOMArtifactModel, fields).all()
+
+    def list_for_run_dicts(
+        self,
+        run_id: str,
+        artifact_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List a Run's Artifacts as dicts using a column projection."""
+        return _project_dicts(
+            CWOMArtifactModel,
+            self._list_for_run_query(
+                run_id=run_id,
+                artifact_type=artifact_type,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def stream_for_run(
+        self,
+        run_id: str,
+        artifact_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[CWOMArtifactModel]:
+        """Yield a Run's Artifacts, newest first, ``_STREAM_BATCH`` rows at a time.
+
+        Unbounded unless ``limit`` is given.
+        """
+        return self._list_for_run_query(
+            run_id=run_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            after=after,
+        ).yield_per(_STREAM_BATCH)
+
+    def _list_for_run_query(
+        self,
+        run_id: str,
+        artifact_type: Optional[str] = None,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMArtifactModel).filter(
             CWOMArtifactModel.produced_by_id == run_id
         )
@@ -942,10 +2045,7 @@ class ArtifactService:
             query = query.filter(CWOMArtifactModel.type == artifact_type)
 
         return (
-            query.order_by(desc(CWOMArtifactModel.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+            _newest_first(query, CWOMArtifactModel, after).offset(offset).limit(limit)
         )
 
     def list_for_issue(
@@ -954,8 +2054,68 @@ class ArtifactService:
         artifact_type: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[CWOMArtifactModel]:
-        """List Artifacts for an Issue."""
+        """List Artifacts for an Issue.
+
+        ``fields`` restricts the columns loaded; see ``_only_fields``.
+        """
+        query = self._list_for_issue_query(
+            issue_id=issue_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+        return _only_fields(query, CWOMArtifactModel, fields).all()
+
+    def list_for_issue_dicts(
+        self,
+        issue_id: str,
+        artifact_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List an Issue's Artifacts as dicts using a column projection."""
+        return _project_dicts(
+            CWOMArtifactModel,
+            self._list_for_issue_query(
+                issue_id=issue_id,
+                artifact_type=artifact_type,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def stream_for_issue(
+        self,
+        issue_id: str,
+        artifact_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> Iterator[CWOMArtifactModel]:
+        """Yield an Issue's Artifacts, newest first, ``_STREAM_BATCH`` rows at a time.
+
+        Unbounded unless ``limit`` is given.
+        """
+        return self._list_for_issue_query(
+            issue_id=issue_id,
+            artifact_type=artifact_type,
+            limit=limit,
+            after=after,
+        ).yield_per(_STREAM_BATCH)
+
+    def _list_for_issue_query(
+        self,
+        issue_id: str,
+        artifact_type: Optional[str] = None,
+        limit: Optional[int] = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMArtifactModel).filter(
             CWOMArtifactModel.for_issue_id == issue_id
         )
@@ -964,27 +2124,22 @@ class ArtifactService:
             query = query.filter(CWOMArtifactModel.type == artifact_type)
 
         return (
-            query.order_by(desc(CWOMArtifactModel.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+            _newest_first(query, CWOMArtifactModel, after).offset(offset).limit(limit)
         )
 
 
 class EvidencePackService:
     """Service for EvidencePack CRUD operations."""
 
-    def __init__(self, db: Session):
+    __slots__ = ("db", "audit")
+
+    def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
-        self.audit = AuditService(db)
+        self.audit = audit or AuditService(db)
 
     def get(self, evidence_pack_id: str) -> Optional[CWOMEvidencePackModel]:
         """Get an EvidencePack by ID."""
-        return (
-            self.db.query(CWOMEvidencePackModel)
-            .filter(CWOMEvidencePackModel.id == evidence_pack_id)
-            .first()
-        )
+        return self.db.get(CWOMEvidencePackModel, evidence_pack_id)
 
     def get_for_run(self, run_id: str) -> Optional[CWOMEvidencePackModel]:
         """Get the EvidencePack for a Run."""
@@ -1001,8 +2156,49 @@ class EvidencePackService:
         verdict: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMEvidencePackModel]:
         """List EvidencePacks with optional filtering."""
+        return self._list_query(
+            run_id=run_id,
+            issue_id=issue_id,
+            verdict=verdict,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_dicts(
+        self,
+        run_id: Optional[str] = None,
+        issue_id: Optional[str] = None,
+        verdict: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List EvidencePacks as dicts using a column projection."""
+        return _project_dicts(
+            CWOMEvidencePackModel,
+            self._list_query(
+                run_id=run_id,
+                issue_id=issue_id,
+                verdict=verdict,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_query(
+        self,
+        run_id: Optional[str] = None,
+        issue_id: Optional[str] = None,
+        verdict: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMEvidencePackModel)
 
         if run_id:
@@ -1013,10 +2209,9 @@ class EvidencePackService:
             query = query.filter(CWOMEvidencePackModel.verdict == verdict)
 
         return (
-            query.order_by(desc(CWOMEvidencePackModel.created_at))
+            _newest_first(query, CWOMEvidencePackModel, after)
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
     def list_for_run(self, run_id: str) -> List[CWOMEvidencePackModel]:
@@ -1034,8 +2229,45 @@ class EvidencePackService:
         verdict: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMEvidencePackModel]:
         """List EvidencePacks for an Issue."""
+        return self._list_for_issue_query(
+            issue_id=issue_id,
+            verdict=verdict,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_for_issue_dicts(
+        self,
+        issue_id: str,
+        verdict: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List an Issue's EvidencePacks as dicts using a column projection."""
+        return _project_dicts(
+            CWOMEvidencePackModel,
+            self._list_for_issue_query(
+                issue_id=issue_id,
+                verdict=verdict,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_for_issue_query(
+        self,
+        issue_id: str,
+        verdict: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMEvidencePackModel).filter(
             CWOMEvidencePackModel.for_issue_id == issue_id
         )
@@ -1044,19 +2276,20 @@ class EvidencePackService:
             query = query.filter(CWOMEvidencePackModel.verdict == verdict)
 
         return (
-            query.order_by(desc(CWOMEvidencePackModel.created_at))
+            _newest_first(query, CWOMEvidencePackModel, after)
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
 
 class ReviewDecisionService:
     """Service for ReviewDecision CRUD operations."""
 
-    def __init__(self, db: Session):
+    __slots__ = ("db", "audit")
+
+    def __init__(self, db: Session, audit: Optional[AuditService] = None):
         self.db = db
-        self.audit = AuditService(db)
+        self.audit = audit or AuditService(db)
 
     def create(
         self,
@@ -1070,23 +2303,15 @@ class ReviewDecisionService:
         On approved: Issue/Run -> done
         On rejected/needs_changes: Issue/Run -> failed
         """
-        from .primitives import generate_ulid
-
         # Validate evidence pack exists
         ep_id = review_data["for_evidence_pack"]["id"]
-        evidence_pack = (
-            self.db.query(CWOMEvidencePackModel)
-            .filter(CWOMEvidencePackModel.id == ep_id)
-            .first()
-        )
+        evidence_pack = self.db.get(CWOMEvidencePackModel, ep_id)
         if not evidence_pack:
             raise ValueError(f"EvidencePack '{ep_id}' not found")
 
         # Validate issue exists and is under_review
         issue_id = review_data["for_issue"]["id"]
-        issue = (
-            self.db.query(CWOMIssueModel).filter(CWOMIssueModel.id == issue_id).first()
-        )
+        issue = self.db.get(CWOMIssueModel, issue_id)
         if not issue:
             raise ValueError(f"Issue '{issue_id}' not found")
         if issue.status != "under_review":
@@ -1096,9 +2321,9 @@ class ReviewDecisionService:
 
         # Get run
         run_id = review_data["for_run"]["id"]
-        run = self.db.query(CWOMRunModel).filter(CWOMRunModel.id == run_id).first()
+        run = self.db.get(CWOMRunModel, run_id)
 
-        now = datetime.now(timezone.utc)
+        now = utc_now()
         reviewer = review_data["reviewer"]
         decision = review_data["decision"]
 
@@ -1150,11 +2375,10 @@ class ReviewDecisionService:
         if run:
             run.updated_at = now
 
-        self.db.commit()
-        self.db.refresh(db_review)
+        self.db.flush()
 
-        # Audit logs
-        self.audit.log_create(
+        # Audit logs, committed with the review and the status changes
+        self.audit.stage_create(
             entity_kind="ReviewDecision",
             entity_id=db_review.id,
             after=db_review.to_dict(),
@@ -1163,7 +2387,7 @@ class ReviewDecisionService:
             trace_id=trace_id,
         )
 
-        self.audit.log_status_change(
+        self.audit.stage_status_change(
             entity_kind="Issue",
             entity_id=issue.id,
             old_status=old_issue_status,
@@ -1175,7 +2399,7 @@ class ReviewDecisionService:
         )
 
         if run:
-            self.audit.log_status_change(
+            self.audit.stage_status_change(
                 entity_kind="Run",
                 entity_id=run.id,
                 old_status=old_run_status,
@@ -1186,15 +2410,12 @@ class ReviewDecisionService:
                 note=f"Review decision: {decision}",
             )
 
+        self.db.commit()
         return db_review
 
     def get(self, review_id: str) -> Optional[CWOMReviewDecisionModel]:
         """Get a ReviewDecision by ID."""
-        return (
-            self.db.query(CWOMReviewDecisionModel)
-            .filter(CWOMReviewDecisionModel.id == review_id)
-            .first()
-        )
+        return self.db.get(CWOMReviewDecisionModel, review_id)
 
     def get_for_evidence_pack(
         self, evidence_pack_id: str
@@ -1213,8 +2434,49 @@ class ReviewDecisionService:
         decision: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMReviewDecisionModel]:
         """List ReviewDecisions with optional filtering."""
+        return self._list_query(
+            evidence_pack_id=evidence_pack_id,
+            issue_id=issue_id,
+            decision=decision,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_dicts(
+        self,
+        evidence_pack_id: Optional[str] = None,
+        issue_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List ReviewDecisions as dicts using a column projection."""
+        return _project_dicts(
+            CWOMReviewDecisionModel,
+            self._list_query(
+                evidence_pack_id=evidence_pack_id,
+                issue_id=issue_id,
+                decision=decision,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_query(
+        self,
+        evidence_pack_id: Optional[str] = None,
+        issue_id: Optional[str] = None,
+        decision: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMReviewDecisionModel)
 
         if evidence_pack_id:
@@ -1227,10 +2489,9 @@ class ReviewDecisionService:
             query = query.filter(CWOMReviewDecisionModel.decision == decision)
 
         return (
-            query.order_by(desc(CWOMReviewDecisionModel.created_at))
+            _newest_first(query, CWOMReviewDecisionModel, after)
             .offset(offset)
             .limit(limit)
-            .all()
         )
 
     def list_for_issue(
@@ -1239,8 +2500,45 @@ class ReviewDecisionService:
         decision: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
+        after: Optional[str] = None,
     ) -> List[CWOMReviewDecisionModel]:
         """List ReviewDecisions for an Issue."""
+        return self._list_for_issue_query(
+            issue_id=issue_id,
+            decision=decision,
+            limit=limit,
+            offset=offset,
+            after=after,
+        ).all()
+
+    def list_for_issue_dicts(
+        self,
+        issue_id: str,
+        decision: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """List an Issue's ReviewDecisions as dicts using a column projection."""
+        return _project_dicts(
+            CWOMReviewDecisionModel,
+            self._list_for_issue_query(
+                issue_id=issue_id,
+                decision=decision,
+                limit=limit,
+                offset=offset,
+                after=after,
+            ),
+        )
+
+    def _list_for_issue_query(
+        self,
+        issue_id: str,
+        decision: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        after: Optional[str] = None,
+    ) -> Query:
         query = self.db.query(CWOMReviewDecisionModel).filter(
             CWOMReviewDecisionModel.for_issue_id == issue_id
         )
@@ -1249,8 +2547,58 @@ class ReviewDecisionService:
             query = query.filter(CWOMReviewDecisionModel.decision == decision)
 
         return (
-            query.order_by(desc(CWOMReviewDecisionModel.created_at))
+            _newest_first(query, CWOMReviewDecisionModel, after)
             .offset(offset)
             .limit(limit)
-            .all()
         )
+
+
+class Services:
+    """Request-scoped container of CWOM services.
+
+    Each service is built on first access and reused for the rest of the
+    request, and all of them share one session and one AuditService.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @cached_property
+    def audit(self) -> AuditService:
+        return AuditService(self.db)
+
+    @cached_property
+    def repos(self) -> RepoService:
+        return RepoService(self.db, self.audit)
+
+    @cached_property
+    def issues(self) -> IssueService:
+        return IssueService(self.db, self.audit)
+
+    @cached_property
+    def context_packets(self) -> ContextPacketService:
+        return ContextPacketService(self.db, self.audit)
+
+    @cached_property
+    def constraint_snapshots(self) -> ConstraintSnapshotService:
+        return ConstraintSnapshotService(self.db, self.audit)
+
+    @cached_property
+    def doctrine_refs(self) -> DoctrineRefService:
+        return DoctrineRefService(self.db, self.audit)
+
+    @cached_property
+    def runs(self) -> RunService:
+        return RunService(self.db, self.audit)
+
+    @cached_property
+    def artifacts(self) -> ArtifactService:
+        return ArtifactService(self.db, self.audit)
+
+    @cached_property
+    def evidence_packs(self) -> EvidencePackService:
+        return EvidencePackService(self.db, self.audit)
+
+    @cached_property
+    def reviews(self) -> ReviewDecisionService:
+        return ReviewDecisionService(self.db, self.audit)
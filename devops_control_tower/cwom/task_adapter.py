@@ -11,6 +11,7 @@ Mapping:
 """
 
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import Session
@@ -24,14 +25,12 @@ from ..db.cwom_models import (
 from ..schemas.task_v1 import TaskCreateLegacyV1, TaskCreateV1
 from .constraint_snapshot import ConstraintSnapshotCreate
 from .context_packet import ContextPacketCreate
-from .enums import ConstraintScope, IssueType, Priority, Status
+from .enums import ConstraintScope, IssueType, ObjectKind, Priority, Status
 from .issue import IssueCreate
 from .primitives import (
     Acceptance,
     Actor,
-    ActorKind,
     Constraints,
-    ObjectKind,
     Ref,
     RiskConstraint,
     Source,
@@ -45,27 +44,36 @@ from .services import (
     RepoService,
 )
 
-# Operation to IssueType mapping
-OPERATION_TO_ISSUE_TYPE = {
-    "code_change": IssueType.FEATURE,
-    "docs": IssueType.DOC,
-    "analysis": IssueType.RESEARCH,
-    "ops": IssueType.OPS,
-}
-
-# Reverse mapping for issue_to_task
-ISSUE_TYPE_TO_OPERATION = {
-    IssueType.FEATURE: "code_change",
-    IssueType.BUG: "code_change",  # Bugs are still code changes
-    IssueType.DOC: "docs",
-    IssueType.RESEARCH: "analysis",
-    IssueType.OPS: "ops",
-    IssueType.CHORE: "ops",  # Chores map to ops
-    IssueType.INCIDENT: "ops",  # Incidents map to ops
-}
-
-
-@dataclass
+# Operation to IssueType mapping (read-only; unknown operations are features)
+OPERATION_TO_ISSUE_TYPE = MappingProxyType(
+    {
+        "code_change": IssueType.FEATURE,
+        "docs": IssueType.DOC,
+        "analysis": IssueType.RESEARCH,
+        "ops": IssueType.OPS,
+    }
+)
+_DEFAULT_ISSUE_TYPE = IssueType.FEATURE
+
+# Reverse mapping for issue_to_task (read-only)
+ISSUE_TYPE_TO_OPERATION = MappingProxyType(
+    {
+        IssueType.FEATURE: "code_change",
+        IssueType.BUG: "code_change",  # Bugs are still code changes
+        IssueType.DOC: "docs",
+        IssueType.RESEARCH: "analysis",
+        IssueType.OPS: "ops",
+        IssueType.CHORE: "ops",  # Chores map to ops
+        IssueType.INCIDENT: "ops",  # Incidents map to ops
+    }
+)
+_DEFAULT_OPERATION = "code_change"
+
+# Session.info key for the slug -> Repo id map kept by task_to_cwom
+_REPO_SLUG_IDS = "cwom_repo_slug_ids"
+
+
+@dataclass(frozen=True, slots=True)
 class CWOMObjects:
     """Container for CWOM objects created from a Task."""
 
@@ -88,6 +96,9 @@ def task_to_cwom(
     - ContextPacket (linked to Issue, contains inputs)
     - ConstraintSnapshot (contains task constraints)
 
+    The objects, their links and audit entries are committed together in a
+    single transaction.
+
     Args:
         task: The task specification to convert
         db: Database session for persistence
@@ -95,35 +106,33 @@ def task_to_cwom(
     Returns:
         CWOMObjects containing all created/retrieved objects
     """
-    # Normalize legacy task to canonical format
-    if isinstance(task, TaskCreateLegacyV1):
-        task_data = task.model_dump(exclude_none=True)
-        # Ensure operation is set (legacy uses 'type')
-        if "operation" not in task_data and "type" in task_data:
-            task_data["operation"] = task_data.pop("type")
-        # Ensure inputs is set (legacy uses 'payload')
-        if "inputs" not in task_data and "payload" in task_data:
-            task_data["inputs"] = task_data.pop("payload")
-    else:
-        task_data = task.model_dump()
-
-    # Extract target info
-    target = task_data.get("target", {})
-    repo_slug = target.get("repo", "")
-    repo_ref = target.get("ref", "main")
-    repo_path = target.get("path", "")
-
-    # Create Actor from requested_by
-    requested_by = task_data.get("requested_by", {})
+    # Fields are read straight off the model rather than from a model_dump()
+    # copy. The legacy model's validators already move 'type', 'payload'
+    # and 'target.repository' onto the canonical fields, so both task
+    # models expose the same attributes here.
+    target = task.target
+    repo_slug = target.repo
+    repo_ref = target.ref
+    repo_path = target.path
+    idempotency_key = task.idempotency_key
+
+    # Create Actor from requested_by. kind is already validated against the
+    # same literals as Actor.actor_kind, so it is passed through as is.
+    requested_by = task.requested_by
     actor = Actor(
-        actor_kind=ActorKind(requested_by.get("kind", "human")),
-        actor_id=requested_by.get("id", "unknown"),
-        display=requested_by.get("label"),
+        actor_kind=requested_by.kind,
+        actor_id=requested_by.id,
+        display=requested_by.label,
     )
 
-    # 1. Get or create Repo
+    # 1. Get or create Repo. Slugs already resolved on this session map to
+    # ids, so a repeat conversion finds the Repo in the identity map
+    # instead of querying by slug again.
     repo_service = RepoService(db)
-    repo = repo_service.get_by_slug(repo_slug)
+    repo_ids = db.info.setdefault(_REPO_SLUG_IDS, {})
+    repo = repo_service.get(repo_ids[repo_slug]) if repo_slug in repo_ids else None
+    if not repo:
+        repo = repo_service.get_by_slug(repo_slug)
 
     if not repo:
         # Create new repo
@@ -139,21 +148,22 @@ def task_to_cwom(
             ),
             default_branch=repo_ref,
         )
-        repo = repo_service.create(repo_create)
+        repo = repo_service.stage_create(repo_create)
+    repo_ids[repo_slug] = repo.id
 
     # 2. Create ConstraintSnapshot
-    constraints_data = task_data.get("constraints", {})
+    constraints_data = task.constraints
     constraint_service = ConstraintSnapshotService(db)
 
     # Build properly typed constraint objects
-    time_budget = constraints_data.get("time_budget_seconds", 900)
+    time_budget = constraints_data.time_budget_seconds
     time_constraint = (
         TimeConstraint(available_minutes=time_budget // 60) if time_budget else None
     )
 
     # Map allow_network/allow_secrets to risk tolerance
-    allow_network = constraints_data.get("allow_network", False)
-    allow_secrets = constraints_data.get("allow_secrets", False)
+    allow_network = constraints_data.allow_network
+    allow_secrets = constraints_data.allow_secrets
     # Low tolerance = no network/secrets, high = both allowed
     risk_tolerance = (
         "high"
@@ -167,7 +177,11 @@ def task_to_cwom(
         notes=f"allow_network={allow_network}, allow_secrets={allow_secrets}",
     )
 
-    constraint_create = ConstraintSnapshotCreate(
+    # The snapshot, issue and packet below are built from an already
+    # validated task, with values that fit their schemas, so they skip
+    # Pydantic validation via model_construct(). RepoCreate stays validated
+    # because target.ref may exceed its default_branch limit.
+    constraint_create = ConstraintSnapshotCreate.model_construct(
         scope=ConstraintScope.RUN,
         owner=actor,
         constraints=Constraints(
@@ -176,62 +190,67 @@ def task_to_cwom(
         ),
         meta={
             "source": "jct_task",
-            "idempotency_key": task_data.get("idempotency_key"),
+            "idempotency_key": idempotency_key,
             "time_budget_seconds": time_budget,
             "allow_network": allow_network,
             "allow_secrets": allow_secrets,
         },
     )
-    constraint_snapshot = constraint_service.create(constraint_create)
+    constraint_snapshot = constraint_service.stage_create(constraint_create)
 
     # 3. Create Issue
     issue_service = IssueService(db)
 
-    operation = task_data.get("operation", "code_change")
-    issue_type = OPERATION_TO_ISSUE_TYPE.get(operation, IssueType.FEATURE)
+    operation = task.operation
+    issue_type = OPERATION_TO_ISSUE_TYPE.get(operation, _DEFAULT_ISSUE_TYPE)
 
-    # Build title from objective (first line or truncated)
-    objective = task_data.get("objective", "")
-    title = objective.split("\n")[0][:200] if objective else "Untitled Task"
+    # Build title from objective (first line or truncated). find() instead of
+    # split() so multi-paragraph objectives don't build a list of every line.
+    objective = task.objective
+    if objective:
+        nl = objective.find("\n")
+        title = objective[: nl if 0 <= nl < 200 else 200]
+    else:
+        title = "Untitled Task"
 
     # Build acceptance criteria - use explicit criteria if provided, else use objective
-    acceptance_criteria = task_data.get("acceptance_criteria", [])
+    acceptance_criteria = task.acceptance_criteria
     if not acceptance_criteria and objective:
         acceptance_criteria = [objective]
 
     # Build evidence requirements
-    evidence_requirements = task_data.get("evidence_requirements", [])
+    evidence_requirements = task.evidence_requirements
 
-    issue_create = IssueCreate(
+    issue_create = IssueCreate.model_construct(
         repo=Ref(kind=ObjectKind.REPO, id=repo.id),
         title=title,
         description=objective,
-        type=issue_type,
-        priority=Priority.P2,  # Default priority
-        status=Status.PLANNED,
+        type=issue_type.value,
+        priority=Priority.P2.value,  # Default priority
+        status=Status.PLANNED.value,
         assignees=[actor],
         acceptance=Acceptance(
             criteria=acceptance_criteria,
         ),
         meta={
             "source": "jct_task",
-            "idempotency_key": task_data.get("idempotency_key"),
-            "task_metadata": task_data.get("metadata", {}),
+            "idempotency_key": idempotency_key,
+            "task_metadata": task.metadata,
             "evidence_requirements": evidence_requirements,
         },
     )
-    issue = issue_service.create(issue_create)
+    issue = issue_service.stage_create(issue_create)
 
     # Link constraint snapshot to issue
-    issue_service.link_constraint_snapshot(issue.id, constraint_snapshot.id)
+    issue_service.stage_link(issue.id, "ConstraintSnapshot", constraint_snapshot.id)
 
     # 4. Create ContextPacket
     context_service = ContextPacketService(db)
 
     # Task inputs go to meta, not inputs (ContextInputs only accepts documents/data_blobs/links)
-    inputs_data = task_data.get("inputs", {})
+    inputs_data = task.inputs
 
-    context_create = ContextPacketCreate(
+    context_create = ContextPacketCreate.model_construct(
         for_issue=Ref(kind=ObjectKind.ISSUE, id=issue.id),
         version="1.0",
         summary=f"Initial context from JCT task",
@@ -246,7 +265,7 @@ def task_to_cwom(
         ),
         meta={
             "source": "jct_task",
-            "idempotency_key": task_data.get("idempotency_key"),
+            "idempotency_key": idempotency_key,
             "acceptance_criteria": acceptance_criteria,
             "evidence_requirements": evidence_requirements,
             # Store task target/inputs in meta for round-trip
@@ -255,10 +274,13 @@ def task_to_cwom(
             "task_inputs": inputs_data,
         },
     )
-    context_packet = context_service.create(context_create)
+    context_packet = context_service.stage_create(context_create)
 
     # Link context packet to issue
-    issue_service.link_context_packet(issue.id, context_packet.id)
+    issue_service.stage_link(issue.id, "ContextPacket", context_packet.id)
+
+    # Everything above is staged on the session; commit it all at once
+    db.commit()
 
     return CWOMObjects(
         repo=repo,
@@ -278,6 +300,11 @@ def issue_to_task(
     Convert CWOM Issue (with related objects) back to JCT V1 Task format.
 
     This provides backward compatibility for clients expecting Task format.
+    When converting stored Issues, load them with
+    ``IssueService.list_for_task_view`` (or ``get_for_task_view``) and pass
+    ``issue.repo_obj`` and entries of ``issue.context_packets`` and
+    ``issue.constraint_snapshots``; those are then already loaded and the
+    conversion runs no queries.
 
     Args:
         issue: The CWOM Issue
@@ -288,9 +315,18 @@ def issue_to_task(
     Returns:
         Dictionary in TaskCreateV1 format
     """
-    # Map issue type to operation
-    issue_type = IssueType(issue.type) if isinstance(issue.type, str) else issue.type
-    operation = ISSUE_TYPE_TO_OPERATION.get(issue_type, "code_change")
+    # JSON columns come back as dicts (or None); bind each meta once
+    issue_meta = issue.meta if isinstance(issue.meta, dict) else {}
+    cs_meta = constraint_snapshot.meta if constraint_snapshot else None
+    if not isinstance(cs_meta, dict):
+        cs_meta = {}
+    cp_meta = context_packet.meta if context_packet else None
+    if not isinstance(cp_meta, dict):
+        cp_meta = {}
+
+    # Map issue type to operation. IssueType is a str enum, so the stored
+    # string finds its member's entry without building the enum first.
+    operation = ISSUE_TYPE_TO_OPERATION.get(issue.type, _DEFAULT_OPERATION)
 
     # Build requested_by from issue assignees or meta
     requested_by = {"kind": "system", "id": "cwom", "label": "CWOM System"}
@@ -311,11 +347,8 @@ def issue_to_task(
     }
 
     # Override with context packet meta if available (task inputs stored in meta)
-    if context_packet and context_packet.meta:
-        meta = context_packet.meta
-        if isinstance(meta, dict):
-            target["ref"] = meta.get("task_ref", target["ref"])
-            target["path"] = meta.get("task_path", target["path"])
+    target["ref"] = cp_meta.get("task_ref", target["ref"])
+    target["path"] = cp_meta.get("task_path", target["path"])
 
     # Build constraints from constraint snapshot
     constraints = {
@@ -325,14 +358,13 @@ def issue_to_task(
     }
     if constraint_snapshot:
         # First check meta for original task values (most accurate)
-        if constraint_snapshot.meta and isinstance(constraint_snapshot.meta, dict):
-            meta = constraint_snapshot.meta
-            if "time_budget_seconds" in meta:
-                constraints["time_budget_seconds"] = meta["time_budget_seconds"]
-            if "allow_network" in meta:
-                constraints["allow_network"] = meta["allow_network"]
-            if "allow_secrets" in meta:
-                constraints["allow_secrets"] = meta["allow_secrets"]
+        if cs_meta:
+            if "time_budget_seconds" in cs_meta:
+                constraints["time_budget_seconds"] = cs_meta["time_budget_seconds"]
+            if "allow_network" in cs_meta:
+                constraints["allow_network"] = cs_meta["allow_network"]
+            if "allow_secrets" in cs_meta:
+                constraints["allow_secrets"] = cs_meta["allow_secrets"]
         # Fallback to constraints object if meta not available
         elif constraint_snapshot.constraints and isinstance(
             constraint_snapshot.constraints, dict
@@ -347,22 +379,12 @@ def issue_to_task(
                 constraints["allow_secrets"] = tolerance == "high"
 
     # Build inputs from context packet meta (task_inputs stored there)
-    inputs = {}
-    if context_packet and context_packet.meta:
-        cp_meta = context_packet.meta
-        if isinstance(cp_meta, dict):
-            inputs = cp_meta.get("task_inputs", {})
-
-    # Build metadata from issue meta
-    metadata = {}
+    inputs = cp_meta.get("task_inputs", {})
+
+    # Build metadata from issue meta (task_metadata was stored there)
+    metadata = issue_meta.get("task_metadata", {})
+    evidence_requirements = issue_meta.get("evidence_requirements", [])
     acceptance_criteria = []
-    evidence_requirements = []
-    if issue.meta:
-        meta = issue.meta
-        if isinstance(meta, dict):
-            # Extract task_metadata if it was stored there
-            metadata = meta.get("task_metadata", {})
-            evidence_requirements = meta.get("evidence_requirements", [])
 
     # Extract acceptance criteria from issue.acceptance
     if issue.acceptance:
@@ -372,9 +394,7 @@ def issue_to_task(
 
     return {
         "version": "1.0",
-        "idempotency_key": issue.meta.get("idempotency_key")
-        if isinstance(issue.meta, dict)
-        else None,
+        "idempotency_key": issue_meta.get("idempotency_key"),
         "requested_by": requested_by,
         "objective": issue.description or issue.title,
         "operation": operation,
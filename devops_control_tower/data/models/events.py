@@ -2,11 +2,14 @@
 Event models for the DevOps Control Tower.
 """
 
+import sys
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, Optional
 
+import orjson
+
 
 class EventPriority(Enum):
     """Event priority levels."""
@@ -34,6 +37,21 @@ class Event:
     and trigger automated responses from agents and workflows.
     """
 
+    __slots__ = (
+        "id",
+        "type",
+        "source",
+        "data",
+        "priority",
+        "tags",
+        "status",
+        "created_at",
+        "processed_at",
+        "processed_by",
+        "result",
+        "error",
+    )
+
     def __init__(
         self,
         event_type: str,
@@ -43,11 +61,14 @@ class Event:
         tags: Optional[Dict[str, str]] = None,
     ):
         self.id = str(uuid.uuid4())
-        self.type = event_type
-        self.source = source
+        # Event types, sources and tag keys come from a small vocabulary but
+        # arrive as fresh strings from JSON; interning them dedupes the copies
+        # and lets trigger/handler lookups hit the identity fast path.
+        self.type = sys.intern(event_type)
+        self.source = sys.intern(source)
         self.data = data
         self.priority = priority
-        self.tags = tags or {}
+        self.tags = {sys.intern(k): v for k, v in tags.items()} if tags else {}
         self.status = EventStatus.PENDING
         self.created_at = datetime.now(timezone.utc)
         self.processed_at: Optional[datetime] = None
@@ -90,6 +111,29 @@ class Event:
             "error": self.error,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the event to JSON bytes.
+
+        Same document as ``to_dict()``, but orjson encodes the enums and
+        datetimes itself, so no intermediate isoformat() strings are built.
+        """
+        return orjson.dumps(
+            {
+                "id": self.id,
+                "type": self.type,
+                "source": self.source,
+                "data": self.data,
+                "priority": self.priority,
+                "tags": self.tags,
+                "status": self.status,
+                "created_at": self.created_at,
+                "processed_at": self.processed_at,
+                "processed_by": self.processed_by,
+                "result": self.result,
+                "error": self.error,
+            }
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Event":
         """Create an event from a dictionary."""
@@ -168,3 +212,11 @@ class EventTypes:
     AGENT_STOPPED = "system.agent_stopped"
     WORKFLOW_TRIGGERED = "system.workflow_triggered"
     WORKFLOW_COMPLETED = "system.workflow_completed"
+
+
+# Dotted literals aren't interned by the compiler; intern the constants so
+# they are the same objects as the interned Event.type values
+for _name, _value in list(vars(EventTypes).items()):
+    if _name.isupper():
+        setattr(EventTypes, _name, sys.intern(_value))
+del _name, _value
@@ -3,10 +3,11 @@ Workflow models for the DevOps Control Tower.
 """
 
 import asyncio
+import random
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional
 
 from .events import Event, EventTypes
 
@@ -31,9 +32,75 @@ class StepStatus(Enum):
     SKIPPED = "skipped"
 
 
+# asyncio.timeout() (Python 3.11+) cancels the awaiting task in place;
+# wait_for() wraps every step in an extra task. On 3.11+ asyncio.TimeoutError
+# is the builtin TimeoutError that timeout() raises, so one except clause
+# covers both paths.
+_timeout = getattr(asyncio, "timeout", None)
+
+# Upper bound on the backoff between step retries, in seconds
+_RETRY_MAX_DELAY = 60.0
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff before retrying after failed attempt number ``attempt``.
+
+    Exponential (2s, 4s, 8s, ...) up to _RETRY_MAX_DELAY, then randomized
+    over the upper half of that window so steps that failed together don't
+    all retry at the same instant.
+    """
+    # The exponent is capped too: 2.0**attempt overflows past ~1000 attempts
+    delay = min(2.0 ** min(attempt, 32), _RETRY_MAX_DELAY)
+    return random.uniform(delay / 2, delay)
+
+
+# Entries kept by cached_condition() before its cache is reset
+_CONDITION_CACHE_SIZE = 4096
+
+
+def cached_condition(
+    condition: Callable[[Event], bool], key: Callable[[Event], Hashable]
+) -> Callable[[Event], bool]:
+    """Wrap a trigger condition so it runs once per distinct ``key(event)``.
+
+    Only valid when the condition's outcome depends on nothing but the
+    fields ``key`` picks out (e.g. ``lambda e: (e.source, e.priority)``) and
+    it has no side effects; otherwise pass the plain condition.
+    """
+    results: Dict[Hashable, bool] = {}
+
+    def check(event: Event) -> bool:
+        k = key(event)
+        try:
+            return results[k]
+        except KeyError:
+            if len(results) >= _CONDITION_CACHE_SIZE:
+                results.clear()
+            result = results[k] = condition(event)
+            return result
+
+    return check
+
+
 class WorkflowStep:
     """Represents a single step in a workflow."""
 
+    __slots__ = (
+        "id",
+        "name",
+        "action",
+        "description",
+        "timeout",
+        "retry_count",
+        "dependencies",
+        "status",
+        "started_at",
+        "completed_at",
+        "result",
+        "error",
+        "attempts",
+    )
+
     def __init__(
         self,
         name: str,
@@ -58,36 +125,44 @@ class WorkflowStep:
         self.attempts = 0
 
     async def execute(self, context: Dict[str, Any]) -> Any:
-        """Execute this workflow step."""
+        """Execute this workflow step, retrying failures up to retry_count times.
+
+        Timeouts are not retried.
+        """
         self.status = StepStatus.RUNNING
         self.started_at = datetime.now(timezone.utc)
-        self.attempts += 1
-
-        try:
-            # Execute with timeout
-            self.result = await asyncio.wait_for(
-                self.action(context), timeout=self.timeout
-            )
-
-            self.status = StepStatus.COMPLETED
-            self.completed_at = datetime.now(timezone.utc)
-            return self.result
-
-        except asyncio.TimeoutError:
-            self.status = StepStatus.FAILED
-            self.error = f"Step timed out after {self.timeout} seconds"
-            raise
-
-        except Exception as e:
-            self.status = StepStatus.FAILED
-            self.error = str(e)
-
-            # Retry if attempts remaining
-            if self.attempts <= self.retry_count:
-                await asyncio.sleep(2**self.attempts)  # Exponential backoff
-                return await self.execute(context)
-
-            raise
+        attempt = 0
+
+        while True:
+            attempt += 1
+            self.attempts += 1
+            try:
+                # Execute with timeout
+                if _timeout is not None:
+                    async with _timeout(self.timeout):
+                        self.result = await self.action(context)
+                else:
+                    self.result = await asyncio.wait_for(
+                        self.action(context), timeout=self.timeout
+                    )
+
+                self.status = StepStatus.COMPLETED
+                self.completed_at = datetime.now(timezone.utc)
+                return self.result
+
+            except asyncio.TimeoutError:
+                self.status = StepStatus.FAILED
+                self.error = f"Step timed out after {self.timeout} seconds"
+                raise
+
+            except Exception as e:
+                self.status = StepStatus.FAILED
+                self.error = str(e)
+                if attempt > self.retry_count:
+                    raise
+
+            await asyncio.sleep(_retry_delay(attempt))
+            self.status = StepStatus.RUNNING
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of this step."""
@@ -116,6 +191,24 @@ class Workflow:
     Represents a workflow - a series of automated steps triggered by events.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "trigger_events",
+        "trigger_conditions",
+        "steps",
+        "_steps_by_name",
+        "status",
+        "started_at",
+        "completed_at",
+        "current_step_index",
+        "execution_context",
+        "result",
+        "error",
+        "execution_count",
+    )
+
     def __init__(
         self,
         name: str,
@@ -126,9 +219,11 @@ class Workflow:
         self.id = str(uuid.uuid4())
         self.name = name
         self.description = description
-        self.trigger_events = trigger_events or []
+        # A frozenset so is_triggered_by() is a hash lookup, not a list scan
+        self.trigger_events: FrozenSet[str] = frozenset(trigger_events or ())
         self.trigger_conditions = trigger_conditions
         self.steps: List[WorkflowStep] = []
+        self._steps_by_name: Dict[str, WorkflowStep] = {}
         self.status = WorkflowStatus.IDLE
         self.started_at: Optional[datetime] = None
         self.completed_at: Optional[datetime] = None
@@ -139,8 +234,11 @@ class Workflow:
         self.execution_count = 0
 
     def add_step(self, step: WorkflowStep) -> None:
-        """Add a step to the workflow."""
+        """Add a step to the workflow. Step names must be unique."""
+        if step.name in self._steps_by_name:
+            raise ValueError(f"Duplicate step name '{step.name}' in {self.name}")
         self.steps.append(step)
+        self._steps_by_name[step.name] = step
 
     def is_triggered_by(self, event: Event) -> bool:
         """Check if this workflow should be triggered by the given event."""
@@ -166,20 +264,7 @@ class Workflow:
         self.execution_count += 1
 
         try:
-            # Execute each step in order
-            for i, step in enumerate(self.steps):
-                self.current_step_index = i
-
-                # Check dependencies
-                if not await self._check_dependencies(step):
-                    step.status = StepStatus.SKIPPED
-                    continue
-
-                # Execute the step
-                step_result = await step.execute(self.execution_context)
-
-                # Add step result to context for subsequent steps
-                self.execution_context[f"step_{step.name}_result"] = step_result
+            await self._run_steps()
 
             self.status = WorkflowStatus.COMPLETED
             self.completed_at = datetime.now(timezone.utc)
@@ -200,19 +285,70 @@ class Workflow:
             self.status = WorkflowStatus.CANCELLED
             self.completed_at = datetime.now(timezone.utc)
 
-    async def _check_dependencies(self, step: WorkflowStep) -> bool:
-        """Check if all dependencies for a step are satisfied."""
-        for dep_name in step.dependencies:
-            # Find the dependency step
-            dep_step = next((s for s in self.steps if s.name == dep_name), None)
-            if not dep_step:
-                raise ValueError(f"Dependency step '{dep_name}' not found")
-
-            # Check if dependency completed successfully
-            if dep_step.status != StepStatus.COMPLETED:
-                return False
+    async def _run_steps(self) -> None:
+        """Run the steps, starting each one once its dependencies complete.
+
+        Steps with no dependency path between them run concurrently. A step
+        is skipped when one of its dependencies was skipped or can never
+        complete (a dependency cycle). The first step failure cancels the
+        steps still running, marking them failed and any step not yet started
+        skipped, and is re-raised.
+        """
+        by_name = self._steps_by_name
+        for step in self.steps:
+            for dep_name in step.dependencies:
+                if dep_name not in by_name:
+                    raise ValueError(f"Dependency step '{dep_name}' not found")
+            step.status = StepStatus.PENDING
+
+        pending = list(enumerate(self.steps))
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        try:
+            while pending or running:
+                waiting = []
+                for i, step in pending:
+                    deps = [by_name[name].status for name in step.dependencies]
+                    if any(dep is StepStatus.SKIPPED for dep in deps):
+                        step.status = StepStatus.SKIPPED
+                    elif all(dep is StepStatus.COMPLETED for dep in deps):
+                        self.current_step_index = i
+                        task = asyncio.create_task(step.execute(self.execution_context))
+                        running[task] = step
+                    else:
+                        waiting.append((i, step))
+                progressed = len(waiting) < len(pending)
+                pending = waiting
+
+                if not running:
+                    if not progressed:
+                        # Nothing running and nothing became ready: the rest
+                        # depend on each other and can never start
+                        for _, step in pending:
+                            step.status = StepStatus.SKIPPED
+                        break
+                    continue
 
-        return True
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    step = running.pop(task)
+                    # Add step result to context for subsequent steps
+                    self.execution_context[f"step_{step.name}_result"] = task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            # Leave no step looking like work still in flight: cancelled
+            # steps failed, and steps that never started won't run this time
+            for task, step in running.items():
+                if task.cancelled():
+                    step.status = StepStatus.FAILED
+                    step.error = "Step cancelled"
+                    step.completed_at = datetime.now(timezone.utc)
+            for _, step in pending:
+                step.status = StepStatus.SKIPPED
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the workflow."""
@@ -234,7 +370,7 @@ class Workflow:
             "total_steps": len(self.steps),
             "execution_count": self.execution_count,
             "error": self.error,
-            "trigger_events": self.trigger_events,
+            "trigger_events": sorted(self.trigger_events),
             "steps": [step.get_status() for step in self.steps],
         }
 
@@ -247,11 +383,21 @@ class WorkflowBuilder:
 
     def triggered_by(self, *event_types: str) -> "WorkflowBuilder":
         """Set the event types that trigger this workflow."""
-        self.workflow.trigger_events.extend(event_types)
+        self.workflow.trigger_events = self.workflow.trigger_events.union(event_types)
         return self
 
-    def with_condition(self, condition: Callable[[Event], bool]) -> "WorkflowBuilder":
-        """Add a trigger condition function."""
+    def with_condition(
+        self,
+        condition: Callable[[Event], bool],
+        cache_key: Optional[Callable[[Event], Hashable]] = None,
+    ) -> "WorkflowBuilder":
+        """Add a trigger condition function.
+
+        With ``cache_key``, the condition is evaluated once per distinct key
+        and the outcome reused; see :func:`cached_condition`.
+        """
+        if cache_key is not None:
+            condition = cached_condition(condition, cache_key)
         self.workflow.trigger_conditions = condition
         return self
 
@@ -1,41 +1,54 @@
 """
 Database package for DevOps Control Tower.
+
+Only the engine/session helpers from ``base`` are imported eagerly. The model
+and service names below are resolved on first access (PEP 562), so importing
+a submodule such as ``db.base`` or ``db.audit_partitions`` doesn't also build
+every ORM model class.
 """
 
-# Audit log
-from .audit_models import AuditLogModel
-from .audit_service import AuditService
-from .base import Base, SessionLocal, engine, get_db
-
-# CWOM v0.1 models
-from .cwom_models import (
-    CWOMArtifactModel,
-    CWOMConstraintSnapshotModel,
-    CWOMContextPacketModel,
-    CWOMDoctrineRefModel,
-    CWOMIssueModel,
-    CWOMRepoModel,
-    CWOMRunModel,
-)
-from .models import AgentModel, EventModel, WorkflowModel
+import importlib
+from typing import Any, List
+
+from .base import Base, SessionLocal, engine, get_db, get_scoped_session
+
+# Lazily exported name -> submodule that defines it
+_LAZY = {
+    "EventModel": "models",
+    "WorkflowModel": "models",
+    "AgentModel": "models",
+    # CWOM v0.1 models
+    "CWOMRepoModel": "cwom_models",
+    "CWOMIssueModel": "cwom_models",
+    "CWOMContextPacketModel": "cwom_models",
+    "CWOMConstraintSnapshotModel": "cwom_models",
+    "CWOMDoctrineRefModel": "cwom_models",
+    "CWOMRunModel": "cwom_models",
+    "CWOMArtifactModel": "cwom_models",
+    # Audit log
+    "AuditLogModel": "audit_models",
+    "AuditService": "audit_service",
+}
 
 __all__ = [
     "Base",
     "engine",
     "SessionLocal",
     "get_db",
-    "EventModel",
-    "WorkflowModel",
-    "AgentModel",
-    # CWOM models
-    "CWOMRepoModel",
-    "CWOMIssueModel",
-    "CWOMContextPacketModel",
-    "CWOMConstraintSnapshotModel",
-    "CWOMDoctrineRefModel",
-    "CWOMRunModel",
-    "CWOMArtifactModel",
-    # Audit log
-    "AuditLogModel",
-    "AuditService",
+    "get_scoped_session",
+    *_LAZY,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
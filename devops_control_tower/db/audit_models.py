@@ -86,6 +86,15 @@ class AuditLogModel(Base):
         Index("ix_audit_log_actor", "actor_kind", "actor_id"),
         Index("ix_audit_log_ts_action", "ts", "action"),
         Index("ix_audit_log_entity_ts", "entity_kind", "entity_id", "ts"),
+        # ts grows with insertion order, so a BRIN index (a min/max per block
+        # range) serves time-range scans at a tiny fraction of the btree's
+        # size. PostgreSQL only; the btree on ts still serves ORDER BY ts.
+        Index(
+            "brin_audit_log_ts",
+            "ts",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
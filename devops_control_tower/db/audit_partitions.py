@@ -0,0 +1,79 @@
+"""
+Monthly partitions for the audit_log table on PostgreSQL.
+
+Migration n5b6c7d8e9f0 turns audit_log into a parent table partitioned by
+RANGE (ts), with one child table per calendar month (audit_log_pYYYYMM) and
+a DEFAULT partition for rows outside them. Writes still go through
+audit_log; PostgreSQL routes each row to its month, so inserts touch one
+small, hot partition and queries filtered on ts skip the others.
+
+A month's partition has to exist before its rows arrive, or they land in
+the DEFAULT partition. ensure_audit_partitions() creates the coming months
+ahead of time. It runs at API startup and from
+``devops-tower audit-partitions``, which should be scheduled (e.g. a daily
+cron job) on long-running deployments. On other databases, or before the
+migration has run, it does nothing.
+"""
+
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+
+def month_start(day: date, offset: int = 0) -> date:
+    """First day of the month ``offset`` months after the one containing ``day``."""
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the audit_log partition holding ``month``."""
+    return f"audit_log_p{month:%Y%m}"
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """Whether audit_log is a partitioned table on this connection."""
+    if conn.dialect.name != "postgresql":
+        return False
+    return bool(
+        conn.execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table"
+                " WHERE partrelid = to_regclass('audit_log'))"
+            )
+        ).scalar()
+    )
+
+
+def ensure_audit_partitions(
+    conn: Connection, months_ahead: int = 3, today: Optional[date] = None
+) -> List[str]:
+    """Create the audit_log partitions from this month through ``months_ahead``.
+
+    Existing partitions are left alone. The caller commits.
+
+    Returns:
+        Names of the partitions that were created
+    """
+    if not is_partitioned(conn):
+        return []
+
+    today = today or datetime.now(timezone.utc).date()
+    created = []
+    for offset in range(months_ahead + 1):
+        start = month_start(today, offset)
+        name = partition_name(start)
+        exists = conn.execute(sa.text("SELECT to_regclass(:name)"), {"name": name})
+        if exists.scalar() is not None:
+            continue
+        end = month_start(start, 1)
+        conn.execute(
+            sa.text(
+                f"CREATE TABLE {name} PARTITION OF audit_log"
+                f" FOR VALUES FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')"
+            )
+        )
+        created.append(name)
+    return created
@@ -6,24 +6,27 @@ All CWOM and Task operations should use this service to maintain an audit trail.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
 
 from .audit_models import AuditLogModel
+from .audit_writer import AuditWriter, copy_audit_rows, get_audit_writer
 
+# Same fallback as cwom.primitives, bound at import rather than per call.
+try:
+    from ulid import ULID as _new_id
+except ImportError:  # pragma: no cover - python-ulid is a declared dependency
+    from uuid import uuid4 as _new_id
 
-def generate_ulid() -> str:
-    """Generate a ULID for audit log entries."""
-    try:
-        from ulid import ULID
 
-        return str(ULID())
-    except ImportError:
-        import uuid
+_INSERT = AuditLogModel.__table__.insert()
+
 
-        return str(uuid.uuid4())
+def generate_ulid() -> str:
+    """Generate a ULID for audit log entries."""
+    return str(_new_id())
 
 
 class AuditService:
@@ -32,12 +35,40 @@ class AuditService:
     Usage:
         audit = AuditService(db_session)
         audit.log_create("Issue", issue.id, issue.to_dict(), actor_kind="agent", actor_id="worker-1")
+
+    Each ``log_*`` method commits its entry. The matching ``stage_*`` method
+    only inserts it in the session's open transaction, so a caller can commit
+    the entry together with the change it records.
+
+    With AUDIT_ASYNC enabled, entries go to the background AuditWriter
+    instead of the session (see ``audit_writer`` for the durability
+    tradeoff); ``log_*`` still commits the caller's session.
     """
 
-    def __init__(self, db: Session):
+    __slots__ = ("db", "writer")
+
+    def __init__(self, db: Session, writer: Optional[AuditWriter] = None):
         self.db = db
+        self.writer = writer or get_audit_writer()
 
-    def log_create(
+    def _record(self, **values: Any) -> AuditLogModel:
+        """Insert an entry in the session's transaction, or queue it on the writer.
+
+        The row goes through a Core INSERT rather than ``db.add()``, so it
+        skips the unit-of-work flush and identity map. The returned model is
+        transient: every column is already set, so it is never read back.
+        """
+        if self.writer is not None:
+            self.writer.put(values)
+        else:
+            self.db.execute(_INSERT, values)
+        return AuditLogModel(**values)
+
+    def _commit(self, entry: AuditLogModel) -> AuditLogModel:
+        self.db.commit()
+        return entry
+
+    def stage_create(
         self,
         entity_kind: str,
         entity_id: str,
@@ -47,7 +78,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log the creation of an entity.
+        """Stage an entry for the creation of an entity without committing.
 
         Args:
             entity_kind: Type of entity (e.g., "Repo", "Issue", "Task")
@@ -59,9 +90,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -75,12 +106,32 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_create(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        after: Dict[str, Any],
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log the creation of an entity and commit.
 
-    def log_update(
+        See :meth:`stage_create` for the arguments.
+        """
+        entry = self.stage_create(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            after=after,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def stage_update(
         self,
         entity_kind: str,
         entity_id: str,
@@ -91,7 +142,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log an update to an entity.
+        """Stage an entry for an update to an entity without committing.
 
         Args:
             entity_kind: Type of entity (e.g., "Repo", "Issue", "Task")
@@ -104,9 +155,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -120,12 +171,34 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_update(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        before: Dict[str, Any],
+        after: Dict[str, Any],
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log an update to an entity and commit.
 
-    def log_status_change(
+        See :meth:`stage_update` for the arguments.
+        """
+        entry = self.stage_update(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            before=before,
+            after=after,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def stage_status_change(
         self,
         entity_kind: str,
         entity_id: str,
@@ -136,7 +209,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log a status change on an entity.
+        """Stage an entry for a status change on an entity without committing.
 
         Args:
             entity_kind: Type of entity (e.g., "Issue", "Run", "Task")
@@ -149,9 +222,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -165,12 +238,34 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_status_change(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        old_status: str,
+        new_status: str,
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log a status change on an entity and commit.
 
-    def log_delete(
+        See :meth:`stage_status_change` for the arguments.
+        """
+        entry = self.stage_status_change(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            old_status=old_status,
+            new_status=new_status,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def stage_delete(
         self,
         entity_kind: str,
         entity_id: str,
@@ -180,7 +275,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log the deletion of an entity.
+        """Stage an entry for the deletion of an entity without committing.
 
         Args:
             entity_kind: Type of entity (e.g., "Repo", "Issue", "Task")
@@ -192,9 +287,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -208,12 +303,32 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_delete(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        before: Dict[str, Any],
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log the deletion of an entity and commit.
 
-    def log_link(
+        See :meth:`stage_delete` for the arguments.
+        """
+        entry = self.stage_delete(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            before=before,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def stage_link(
         self,
         entity_kind: str,
         entity_id: str,
@@ -224,7 +339,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log linking two entities together.
+        """Stage an entry for linking two entities together without committing.
 
         Args:
             entity_kind: Type of primary entity
@@ -237,9 +352,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -253,12 +368,34 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_link(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        linked_kind: str,
+        linked_id: str,
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log linking two entities together and commit.
 
-    def log_unlink(
+        See :meth:`stage_link` for the arguments.
+        """
+        entry = self.stage_link(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            linked_kind=linked_kind,
+            linked_id=linked_id,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def stage_unlink(
         self,
         entity_kind: str,
         entity_id: str,
@@ -269,7 +406,7 @@ class AuditService:
         note: Optional[str] = None,
         trace_id: Optional[str] = None,
     ) -> AuditLogModel:
-        """Log unlinking two entities.
+        """Stage an entry for unlinking two entities without committing.
 
         Args:
             entity_kind: Type of primary entity
@@ -282,9 +419,9 @@ class AuditService:
             trace_id: Optional trace ID for correlation
 
         Returns:
-            The created AuditLogModel
+            The pending AuditLogModel
         """
-        entry = AuditLogModel(
+        return self._record(
             id=generate_ulid(),
             ts=datetime.now(timezone.utc),
             actor_kind=actor_kind,
@@ -298,10 +435,43 @@ class AuditService:
             trace_id=trace_id,
         )
 
-        self.db.add(entry)
-        self.db.commit()
-        self.db.refresh(entry)
-        return entry
+    def log_unlink(
+        self,
+        entity_kind: str,
+        entity_id: str,
+        unlinked_kind: str,
+        unlinked_id: str,
+        actor_kind: str = "system",
+        actor_id: str = "unknown",
+        note: Optional[str] = None,
+        trace_id: Optional[str] = None,
+    ) -> AuditLogModel:
+        """Log unlinking two entities and commit.
+
+        See :meth:`stage_unlink` for the arguments.
+        """
+        entry = self.stage_unlink(
+            entity_kind=entity_kind,
+            entity_id=entity_id,
+            unlinked_kind=unlinked_kind,
+            unlinked_id=unlinked_id,
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            note=note,
+            trace_id=trace_id,
+        )
+        return self._commit(entry)
+
+    def bulk_copy(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Write many audit rows at once, for backfills and replays.
+
+        Uses COPY on PostgreSQL (see :func:`audit_writer.copy_audit_rows`).
+        The caller commits.
+
+        Returns:
+            Number of rows written
+        """
+        return copy_audit_rows(self.db.connection(), rows)
 
     # Query methods
 
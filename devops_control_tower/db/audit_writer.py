@@ -0,0 +1,219 @@
+"""
+Background writer for audit log entries.
+
+With AUDIT_ASYNC enabled, AuditService hands each finished entry to a
+process-wide AuditWriter instead of writing it in the caller's transaction.
+A daemon thread drains the queue and inserts every batch with one multi-row
+INSERT on its own session, flushing when the batch reaches
+AUDIT_BATCH_SIZE entries or AUDIT_FLUSH_INTERVAL seconds after its first
+entry, whichever comes first. On PostgreSQL, batches of 1000 or more rows
+are streamed with COPY instead (copy_audit_rows, also used for backfills).
+
+Durability tradeoff: entries still queued when the process dies are lost,
+an entry may land after the change it records, and it is written even if
+that change later rolls back. Leave AUDIT_ASYNC off (the default) wherever
+the audit log must be transactionally consistent with the data.
+"""
+
+import atexit
+import io
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import orjson
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from .audit_models import AuditLogModel
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+# Batches at least this large are written with COPY on PostgreSQL
+_COPY_MIN_ROWS = 1000
+
+_COPY_COLUMNS = tuple(column.name for column in AuditLogModel.__table__.columns)
+_JSON_COLUMNS = frozenset({"before", "after"})
+# COPY text format: backslash first, so the escapes it adds aren't re-escaped
+_COPY_ESCAPES = (("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r"))
+
+
+def _copy_field(name: str, value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if name in _JSON_COLUMNS:
+        value = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    for char, escaped in _COPY_ESCAPES:
+        if char in value:
+            value = value.replace(char, escaped)
+    return value
+
+
+def _copy_line(row: Dict[str, Any]) -> str:
+    """One audit row as a line of PostgreSQL COPY text format."""
+    get = row.get
+    return "\t".join([_copy_field(name, get(name)) for name in _COPY_COLUMNS]) + "\n"
+
+
+def copy_audit_rows(connection: Connection, rows: Iterable[Dict[str, Any]]) -> int:
+    """Write audit rows (dicts of AuditLogModel column values) in one go.
+
+    On PostgreSQL the rows are streamed with ``COPY audit_log FROM STDIN``,
+    which skips per-row statement parsing and planning; elsewhere they go
+    through one executemany INSERT. Every row needs its id and ts. The
+    caller commits.
+
+    Returns:
+        Number of rows written
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    if connection.dialect.name != "postgresql":
+        connection.execute(AuditLogModel.__table__.insert(), rows)
+        return len(rows)
+
+    buffer = io.StringIO("".join([_copy_line(row) for row in rows]))
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY audit_log ({', '.join(_COPY_COLUMNS)}) FROM STDIN", buffer
+        )
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+class AuditWriter:
+    """Queue of audit rows written in batches by a daemon thread."""
+
+    __slots__ = (
+        "batch_size",
+        "flush_interval",
+        "_session_factory",
+        "_queue",
+        "_thread",
+    )
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-writer", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, values: Dict[str, Any]) -> None:
+        """Queue one audit row (a dict of AuditLogModel column values)."""
+        self._queue.put(values)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is written.
+
+        Returns False if the writer did not finish within ``timeout``.
+        """
+        if not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write what is queued and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+
+            # Batch full, interval elapsed, or a flush/stop marker
+            if batch:
+                self._write(batch)
+                batch = []
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        session = self._session_factory()
+        try:
+            if len(batch) >= _COPY_MIN_ROWS:
+                copy_audit_rows(session.connection(), batch)
+            else:
+                session.execute(AuditLogModel.__table__.insert(), batch)
+            session.commit()
+        except Exception:
+            session.rollback()
+            logger.exception("Dropped %d audit log entries", len(batch))
+        finally:
+            session.close()
+
+
+_writer: Optional[AuditWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> Optional[AuditWriter]:
+    """Return the process-wide AuditWriter, or None unless AUDIT_ASYNC is set."""
+    global _writer
+    if _writer is not None:
+        return _writer
+
+    from ..config import get_settings
+
+    settings = get_settings()
+    if not settings.audit_async:
+        return None
+
+    with _writer_lock:
+        if _writer is None:
+            from .base import get_session_local
+
+            _writer = AuditWriter(
+                get_session_local(),
+                batch_size=settings.audit_batch_size,
+                flush_interval=settings.audit_flush_interval,
+            )
+            atexit.register(close_audit_writer)
+    return _writer
+
+
+def close_audit_writer() -> None:
+    """Drain and stop the process-wide AuditWriter, if one was started."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
@@ -1,12 +1,13 @@
 """Database configuration and base setup for DevOps Control Tower."""
 
 import os
-from typing import Generator, Optional
+from typing import Any, Dict, Generator, Optional
 
+import orjson
 import sqlalchemy as sa
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.engine.url import URL, make_url
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.orm import DeclarativeBase, Session, scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 
@@ -53,6 +54,18 @@ def get_database_url(raw_url: Optional[str] = None) -> str:
     return _ensure_sync_driver(url).render_as_string(hide_password=False)
 
 
+def _json_dumps(value: Any) -> str:
+    # OPT_NON_STR_KEYS keeps json.dumps' handling of int/enum dict keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON column (de)serialization through orjson instead of the json module
+JSON_ENGINE_OPTIONS: Dict[str, Any] = {
+    "json_serializer": _json_dumps,
+    "json_deserializer": orjson.loads,
+}
+
+
 _engine: Optional[Engine] = None
 
 
@@ -75,15 +88,23 @@ def get_engine() -> Engine:
             database_url,
             connect_args={"check_same_thread": False},
             poolclass=StaticPool,
+            **JSON_ENGINE_OPTIONS,
         )
     else:
-        # PostgreSQL configuration for production
+        # PostgreSQL configuration for production. Size the pool from settings
+        # so it can track API_THREADPOOL_SIZE, or shrink when fronted by
+        # PgBouncer.
+        from ..config import get_settings
+
+        settings = get_settings()
         _engine = create_engine(
             database_url,
-            pool_size=20,
-            max_overflow=30,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
             pool_pre_ping=True,
-            pool_recycle=3600,
+            pool_recycle=settings.db_pool_recycle,
+            **JSON_ENGINE_OPTIONS,
         )
 
     return _engine
@@ -101,15 +122,45 @@ class _EngineProxy:
 engine = _EngineProxy()
 
 
+_session_factory: Optional[sessionmaker] = None
+_scoped_session: Optional[scoped_session] = None
+
+
 def get_session_local() -> sessionmaker:
-    """Get a sessionmaker bound to the current engine."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+    """Get the sessionmaker bound to the current engine, built once."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(
+            autocommit=False, autoflush=False, bind=get_engine()
+        )
+    return _session_factory
+
+
+def get_scoped_session() -> scoped_session:
+    """Get the thread-local session registry for background workers.
+
+    A worker thread gets the same Session back on every call, so a polling
+    loop reuses one Session instead of building a new one per cycle. Call
+    ``close()`` after each unit of work to release the connection and
+    ``remove()`` on shutdown.
+
+    Request handlers keep using :func:`get_db`: FastAPI may enter and exit a
+    sync dependency on different threadpool threads, so a thread-scoped
+    session is not safe there.
+    """
+    global _scoped_session
+    if _scoped_session is None:
+        _scoped_session = scoped_session(get_session_local())
+    return _scoped_session
 
 
 def get_db() -> Generator[Session, None, None]:
-    """Dependency to get database session."""
-    session_local = get_session_local()
-    db = session_local()
+    """Dependency to get database session.
+
+    The session lives for one request, so objects are not expired on commit:
+    a freshly created row can be serialized without reloading it.
+    """
+    db = get_session_local()(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -135,6 +186,12 @@ async def init_database() -> None:
     with engine.connect() as conn:
         conn.execute(sa.text("SELECT 1"))
 
+    # Provision upcoming audit_log partitions (PostgreSQL only)
+    from .audit_partitions import ensure_audit_partitions
+
+    with engine.begin() as conn:
+        ensure_audit_partitions(conn)
+
     print(
         "Database connection verified. Run 'alembic upgrade head' to ensure schema is up to date."
     )
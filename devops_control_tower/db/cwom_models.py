@@ -10,7 +10,8 @@ Following the CWOM spec guidelines:
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional
 
 from sqlalchemy import (
     JSON,
@@ -26,8 +27,10 @@ from sqlalchemy import (
     Table,
     Text,
     UniqueConstraint,
+    event,
+    inspect,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import ORMExecuteState, Session, relationship
 from sqlalchemy.sql import func
 
 from .base import Base
@@ -373,6 +376,8 @@ class CWOMIssueModel(Base):
         Index("ix_cwom_issues_type_status", "type", "status"),
         Index("ix_cwom_issues_priority_status", "priority", "status"),
         Index("ix_cwom_issues_created_at", "created_at"),
+        Index("ix_cwom_issues_repo_status_created", "repo_id", "status", "created_at"),
+        Index("ix_cwom_issues_type_priority_created", "type", "priority", "created_at"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -493,6 +498,7 @@ class CWOMContextPacketModel(Base):
     __table_args__ = (
         Index("ix_cwom_context_packets_version", "version"),
         Index("ix_cwom_context_packets_created_at", "created_at"),
+        Index("ix_cwom_context_packets_issue_created", "for_issue_id", "created_at"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -745,6 +751,10 @@ class CWOMRunModel(Base):
     # Example: file:///var/lib/jct/runs/{run_id}/
     artifact_root_uri = Column(String(2000), nullable=True)
 
+    # Denormalized to_dict() output, refreshed on every ORM insert/update so
+    # read endpoints can return it without rebuilding the nested dict
+    cached_json = Column(JSON, nullable=True)
+
     # Metadata
     tags = Column(JSON, nullable=False, default=list)
     meta = Column(JSON, nullable=False, default=dict)
@@ -781,6 +791,11 @@ class CWOMRunModel(Base):
     __table_args__ = (
         Index("ix_cwom_runs_status_mode", "status", "mode"),
         Index("ix_cwom_runs_created_at", "created_at"),
+        Index(
+            "ix_cwom_runs_issue_status_created", "for_issue_id", "status", "created_at"
+        ),
+        Index("ix_cwom_runs_issue_created", "for_issue_id", "created_at"),
+        Index("ix_cwom_runs_repo_status_created", "repo_id", "status", "created_at"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -816,6 +831,39 @@ class CWOMRunModel(Base):
         }
 
 
+def _fill_python_defaults(target: Any) -> None:
+    """Apply column defaults to unset attributes ahead of the INSERT.
+
+    ``to_dict`` runs before the row is written, so values the INSERT would
+    supply (scalar/callable defaults, ``now()`` timestamps) are filled in
+    Python first to keep the cached JSON complete.
+    """
+    now = datetime.now(timezone.utc)
+    for column in target.__table__.columns:
+        if getattr(target, column.key) is not None or column.default is None:
+            continue
+        default = column.default
+        if default.is_scalar:
+            setattr(target, column.key, default.arg)
+        elif default.is_callable:
+            setattr(target, column.key, default.arg(None))
+        elif isinstance(column.type, DateTime):
+            setattr(target, column.key, now)
+
+
+@event.listens_for(CWOMRunModel, "before_insert")
+def _run_cache_json_on_insert(mapper: Any, connection: Any, target: Any) -> None:
+    _fill_python_defaults(target)
+    target.cached_json = target.to_dict()
+
+
+@event.listens_for(CWOMRunModel, "before_update")
+def _run_cache_json_on_update(mapper: Any, connection: Any, target: Any) -> None:
+    if not inspect(target).attrs.updated_at.history.has_changes():
+        target.updated_at = datetime.now(timezone.utc)
+    target.cached_json = target.to_dict()
+
+
 class CWOMArtifactModel(Base):
     """SQLAlchemy model for CWOM Artifact objects."""
 
@@ -877,6 +925,12 @@ class CWOMArtifactModel(Base):
         Index("ix_cwom_artifacts_type", "type"),
         Index("ix_cwom_artifacts_created_at", "created_at"),
         Index("ix_cwom_artifacts_digest", "digest"),
+        Index(
+            "ix_cwom_artifacts_run_type_created", "produced_by_id", "type", "created_at"
+        ),
+        Index(
+            "ix_cwom_artifacts_issue_type_created", "for_issue_id", "type", "created_at"
+        ),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -984,6 +1038,12 @@ class CWOMEvidencePackModel(Base):
         Index("ix_cwom_evidence_packs_verdict", "verdict"),
         Index("ix_cwom_evidence_packs_evaluated_at", "evaluated_at"),
         Index("ix_cwom_evidence_packs_created_at", "created_at"),
+        Index(
+            "ix_cwom_evidence_packs_issue_verdict_created",
+            "for_issue_id",
+            "verdict",
+            "created_at",
+        ),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1105,6 +1165,12 @@ class CWOMReviewDecisionModel(Base):
         Index("ix_cwom_review_decisions_decision", "decision"),
         Index("ix_cwom_review_decisions_reviewed_at", "reviewed_at"),
         Index("ix_cwom_review_decisions_created_at", "created_at"),
+        Index(
+            "ix_cwom_review_decisions_issue_decision_created",
+            "for_issue_id",
+            "decision",
+            "created_at",
+        ),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -1142,3 +1208,77 @@ class CWOMReviewDecisionModel(Base):
             "created_at": (self.created_at.isoformat() if self.created_at else None),
             "updated_at": (self.updated_at.isoformat() if self.updated_at else None),
         }
+
+
+# =============================================================================
+# List cache invalidation
+# =============================================================================
+
+# Cached list (see cwom.list_cache) that a committed write to each table makes
+# stale. The association tables feed the link refs in Issue and Run pages.
+_LIST_CACHE_ENTITY_BY_TABLE = {
+    CWOMRepoModel.__tablename__: "repos",
+    CWOMIssueModel.__tablename__: "issues",
+    issue_context_packets.name: "issues",
+    issue_doctrine_refs.name: "issues",
+    issue_constraint_snapshots.name: "issues",
+    CWOMRunModel.__tablename__: "runs",
+    run_context_packets.name: "runs",
+    run_doctrine_refs.name: "runs",
+    CWOMDoctrineRefModel.__tablename__: "doctrine_refs",
+}
+_STALE_LISTS = "cwom_stale_lists"
+
+
+def _list_cache_enabled() -> bool:
+    from ..cwom.list_cache import get_list_cache
+
+    return get_list_cache().enabled
+
+
+def _mark_stale(session: Session, tables: Iterable[Optional[str]]) -> None:
+    entities = {
+        _LIST_CACHE_ENTITY_BY_TABLE[table]
+        for table in tables
+        if table in _LIST_CACHE_ENTITY_BY_TABLE
+    }
+    if entities:
+        session.info.setdefault(_STALE_LISTS, set()).update(entities)
+
+
+# Invalidation hangs off the session rather than the CWOM services because
+# the task adapter, MCP tools and worker also write these tables, some of
+# them straight through the ORM.
+@event.listens_for(Session, "after_flush")
+def _note_flushed_writes(session: Session, flush_context: Any) -> None:
+    if _list_cache_enabled():
+        _mark_stale(
+            session,
+            (
+                getattr(obj, "__tablename__", None)
+                for obj in chain(session.new, session.dirty, session.deleted)
+            ),
+        )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_statement_writes(state: ORMExecuteState) -> None:
+    # Core INSERT/UPDATE/DELETE (bulk creates, link rows) bypass the flush
+    if (state.is_insert or state.is_update or state.is_delete) and (
+        _list_cache_enabled()
+    ):
+        _mark_stale(state.session, (getattr(state.statement.table, "name", None),))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_lists(session: Session) -> None:
+    entities = session.info.pop(_STALE_LISTS, None)
+    if entities:
+        from ..cwom.list_cache import get_list_cache
+
+        get_list_cache().invalidate(*sorted(entities))
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_stale_lists(session: Session) -> None:
+    session.info.pop(_STALE_LISTS, None)
@@ -0,0 +1,74 @@
+"""Add composite indexes for CWOM list filters
+
+Revision ID: k2f3a4b5c6d7
+Revises: j1e2f3a4b5c6
+Create Date: 2026-10-16
+
+The CWOM list endpoints filter on a parent reference plus a status-like
+column and order by created_at. These composite indexes match that
+(filter, filter, sort) prefix so the planner can range-scan one index
+instead of combining single-column indexes and sorting.
+
+On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "k2f3a4b5c6d7"
+down_revision = "j1e2f3a4b5c6"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+_INDEXES = [
+    (
+        "ix_cwom_issues_repo_status_created",
+        "cwom_issues",
+        ["repo_id", "status", "created_at"],
+    ),
+    (
+        "ix_cwom_runs_issue_status_created",
+        "cwom_runs",
+        ["for_issue_id", "status", "created_at"],
+    ),
+    (
+        "ix_cwom_artifacts_run_type_created",
+        "cwom_artifacts",
+        ["produced_by_id", "type", "created_at"],
+    ),
+    (
+        "ix_cwom_evidence_packs_issue_verdict_created",
+        "cwom_evidence_packs",
+        ["for_issue_id", "verdict", "created_at"],
+    ),
+    (
+        "ix_cwom_review_decisions_issue_decision_created",
+        "cwom_review_decisions",
+        ["for_issue_id", "decision", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in _INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,29 @@
+"""Add cached_json to cwom_runs
+
+Revision ID: l3a4b5c6d7e8
+Revises: k2f3a4b5c6d7
+Create Date: 2026-10-16
+
+Stores the denormalized Run.to_dict() output so Run reads can return the
+stored document instead of rebuilding it from ~30 columns. The column is
+maintained by ORM before_insert/before_update hooks; existing rows stay NULL
+and are served from their columns until they are next written.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "l3a4b5c6d7e8"
+down_revision = "k2f3a4b5c6d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("cwom_runs", sa.Column("cached_json", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("cwom_runs", "cached_json")
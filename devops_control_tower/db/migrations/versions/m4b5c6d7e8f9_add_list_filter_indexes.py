@@ -0,0 +1,77 @@
+"""Add composite indexes for the remaining CWOM list access paths
+
+Revision ID: m4b5c6d7e8f9
+Revises: l3a4b5c6d7e8
+Create Date: 2026-10-16
+
+Completes the (filter, ..., created_at) indexes from k2f3a4b5c6d7 for the
+list queries it did not cover: issues by type and priority, runs by issue
+alone and by repo and status, artifacts by issue and type, and context
+packets by issue (also used by get_latest_for_issue).
+
+created_at is stored ascending; the planner walks the index backwards for
+ORDER BY created_at DESC, so no descending variant is needed.
+
+On PostgreSQL the indexes are built CONCURRENTLY to avoid locking writes.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "m4b5c6d7e8f9"
+down_revision = "l3a4b5c6d7e8"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+_INDEXES = [
+    (
+        "ix_cwom_issues_type_priority_created",
+        "cwom_issues",
+        ["type", "priority", "created_at"],
+    ),
+    (
+        "ix_cwom_context_packets_issue_created",
+        "cwom_context_packets",
+        ["for_issue_id", "created_at"],
+    ),
+    (
+        "ix_cwom_runs_issue_created",
+        "cwom_runs",
+        ["for_issue_id", "created_at"],
+    ),
+    (
+        "ix_cwom_runs_repo_status_created",
+        "cwom_runs",
+        ["repo_id", "status", "created_at"],
+    ),
+    (
+        "ix_cwom_artifacts_issue_type_created",
+        "cwom_artifacts",
+        ["for_issue_id", "type", "created_at"],
+    ),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+        with op.get_context().autocommit_block():
+            for name, table, columns in _INDEXES:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=False,
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+    else:
+        for name, table, columns in _INDEXES:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,110 @@
+"""Partition audit_log by month on PostgreSQL
+
+Revision ID: n5b6c7d8e9f0
+Revises: m4b5c6d7e8f9
+Create Date: 2026-10-16
+
+Rebuilds audit_log as a table partitioned by RANGE (ts) with one child
+table per calendar month (audit_log_pYYYYMM) plus a DEFAULT partition, so
+appends go to a small current partition and old months can be detached or
+dropped without a bulk DELETE. Existing rows are copied across.
+
+Partition bounds use ts, so it has to be part of the primary key, which
+becomes (id, ts). The ORM model still maps id alone as the primary key;
+ids are unique on their own and nothing looks rows up by ts.
+
+Partitions for this month and the next three are created here; later
+months come from devops_control_tower.db.audit_partitions, run at startup
+and by ``devops-tower audit-partitions``.
+
+SQLite has no table partitioning, so this revision does nothing there.
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "n5b6c7d8e9f0"
+down_revision = "m4b5c6d7e8f9"
+branch_labels = None
+depends_on = None
+
+_MONTHS_AHEAD = 3
+
+# (index name, columns) as created by f7a8b9c0d1e2
+_INDEXES = [
+    ("ix_audit_log_ts", ["ts"]),
+    ("ix_audit_log_actor_id", ["actor_id"]),
+    ("ix_audit_log_action", ["action"]),
+    ("ix_audit_log_entity_kind", ["entity_kind"]),
+    ("ix_audit_log_entity_id", ["entity_id"]),
+    ("ix_audit_log_trace_id", ["trace_id"]),
+    ("ix_audit_log_entity", ["entity_kind", "entity_id"]),
+    ("ix_audit_log_actor", ["actor_kind", "actor_id"]),
+    ("ix_audit_log_ts_action", ["ts", "action"]),
+    ("ix_audit_log_entity_ts", ["entity_kind", "entity_id", "ts"]),
+]
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def _create_indexes() -> None:
+    for name, columns in _INDEXES:
+        op.create_index(name, "audit_log", columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE TABLE audit_log_partitioned"
+        " (LIKE audit_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        " PARTITION BY RANGE (ts)"
+    )
+    op.execute(
+        "CREATE TABLE audit_log_default PARTITION OF audit_log_partitioned DEFAULT"
+    )
+
+    # Monthly partitions from the oldest existing entry up to _MONTHS_AHEAD
+    today = datetime.now(timezone.utc).date()
+    oldest = bind.execute(sa.text("SELECT min(ts) FROM audit_log")).scalar()
+    month = _month_start(oldest.astimezone(timezone.utc).date() if oldest else today)
+    last = _month_start(today, _MONTHS_AHEAD)
+    while month <= last:
+        end = _month_start(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_log_p{month:%Y%m}"
+            " PARTITION OF audit_log_partitioned"
+            f" FOR VALUES FROM ('{month} 00:00:00+00') TO ('{end} 00:00:00+00')"
+        )
+        month = end
+
+    op.execute("INSERT INTO audit_log_partitioned SELECT * FROM audit_log")
+    op.drop_table("audit_log")
+    op.rename_table("audit_log_partitioned", "audit_log")
+    op.create_primary_key("audit_log_pkey", "audit_log", ["id", "ts"])
+    _create_indexes()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "CREATE TABLE audit_log_plain"
+        " (LIKE audit_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    op.execute("INSERT INTO audit_log_plain SELECT * FROM audit_log")
+    # Dropping the parent drops every partition with it
+    op.drop_table("audit_log")
+    op.rename_table("audit_log_plain", "audit_log")
+    op.create_primary_key("audit_log_pkey", "audit_log", ["id"])
+    _create_indexes()
@@ -0,0 +1,44 @@
+"""Add a BRIN index on audit_log.ts (PostgreSQL)
+
+Revision ID: o6c7d8e9f0a1
+Revises: n5b6c7d8e9f0
+Create Date: 2026-10-16
+
+audit_log is append-only and ts follows insertion order, so a BRIN index
+(min/max ts per 32-page block range) narrows time-range scans to the
+matching blocks while staying a few pages in size. It supplements the
+btree on ts, which is still needed for ORDER BY ts ... LIMIT.
+
+Created on the partitioned parent, so every partition (including ones
+added later by audit_partitions) gets its own copy. Partitioned tables
+don't support CREATE INDEX CONCURRENTLY, so this is a plain build.
+
+SQLite has no BRIN; this revision does nothing there.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "o6c7d8e9f0a1"
+down_revision = "n5b6c7d8e9f0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "brin_audit_log_ts",
+        "audit_log",
+        ["ts"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("brin_audit_log_ts", table_name="audit_log")
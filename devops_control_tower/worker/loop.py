@@ -26,7 +26,7 @@ from sqlalchemy.orm import Session
 
 from ..config import get_settings
 from ..db.audit_service import AuditService
-from ..db.base import SessionLocal
+from ..db.base import get_scoped_session
 from ..db.cwom_models import (
     CWOMArtifactModel,
     CWOMConstraintSnapshotModel,
@@ -65,6 +65,7 @@ class WorkerLoop:
         self.claim_limit = claim_limit or self.settings.worker_claim_limit
         self.running = False
         self.worker_id = f"worker-{uuid.uuid4().hex[:8]}"
+        self._sessions = get_scoped_session()
 
         logger.info(
             f"Worker initialized: id={self.worker_id}, "
@@ -94,6 +95,7 @@ class WorkerLoop:
                     # Sleep on error to avoid tight loop
                     time.sleep(self.poll_interval)
         finally:
+            self._sessions.remove()
             logger.info(f"Worker {self.worker_id} stopped")
 
     def stop(self) -> None:
@@ -112,7 +114,9 @@ class WorkerLoop:
         Returns:
             Number of tasks processed
         """
-        db = SessionLocal()
+        # Same Session every cycle on this thread; close() just releases the
+        # connection and identity map until the next poll.
+        db = self._sessions()
         try:
             # Find and claim queued tasks
             task = self._claim_task(db)
@@ -7,12 +7,12 @@ Extracted from loop.py to avoid duplication.
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
 from sqlalchemy.orm import Session
 
 from ..config import get_settings
+from ..cwom.primitives import utc_now
 from ..db.audit_service import AuditService
 from ..db.cwom_models import CWOMEvidencePackModel, CWOMIssueModel, CWOMRunModel
 from ..db.models import TaskModel
@@ -150,9 +150,10 @@ def apply_review_policy(
             .first()
         )
 
+        now = utc_now()
         old_run_status = run.status
         run.status = "under_review"
-        run.updated_at = datetime.now(timezone.utc)
+        run.updated_at = now
 
         audit = AuditService(db)
         audit.log_status_change(
@@ -169,7 +170,7 @@ def apply_review_policy(
         if issue:
             old_issue_status = issue.status
             issue.status = "under_review"
-            issue.updated_at = datetime.now(timezone.utc)
+            issue.updated_at = now
 
             audit.log_status_change(
                 entity_kind="Issue",
@@ -21,7 +21,7 @@ os.environ["JCT_ALLOWED_REPO_PREFIXES"] = "testorg/"
 from devops_control_tower.core.orchestrator import Orchestrator
 from devops_control_tower.data.models.events import Event, EventPriority, EventTypes
 from devops_control_tower.db import base as db_base
-from devops_control_tower.db.base import Base, get_db
+from devops_control_tower.db.base import JSON_ENGINE_OPTIONS, Base, get_db
 
 # =============================================================================
 # Shared Test Database Setup
@@ -34,13 +34,14 @@ test_engine = create_engine(
     TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
+    **JSON_ENGINE_OPTIONS,
 )
 TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
 
 
 def override_get_db() -> Generator[Session, None, None]:
     """Override the get_db dependency for testing."""
-    db = TestSessionLocal()
+    db = TestSessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
@@ -7,14 +7,22 @@ Verifies:
 - AuditService query methods (by entity, trace, actor, action)
 """
 
-from datetime import datetime, timezone
+import time
+from datetime import date, datetime, timezone
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from devops_control_tower.db.audit_models import AuditLogModel
+from devops_control_tower.db.audit_partitions import (
+    ensure_audit_partitions,
+    month_start,
+    partition_name,
+)
 from devops_control_tower.db.audit_service import AuditService
+from devops_control_tower.db.audit_writer import AuditWriter, _copy_line
 from devops_control_tower.db.base import Base
 
 
@@ -134,6 +142,44 @@ class TestAuditServiceCreate:
         assert found.entity_kind == "Run"
         assert found.action == "created"
 
+    def test_log_create_does_not_reload_entry(self, db_session):
+        """Logging commits the INSERT without reading the row back."""
+        statements = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            AuditService(db_session).log_create("Run", "run-quiet", {"a": 1})
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert [s.split()[0] for s in statements] == ["INSERT"]
+
+    def test_staged_entry_bypasses_unit_of_work(self, db_session):
+        """Staged entries are inserted directly, not tracked by the session."""
+        entry = AuditService(db_session).stage_create("Run", "run-core", after={})
+
+        assert inspect(entry).transient
+        assert not db_session.new
+        found = db_session.get(AuditLogModel, entry.id)
+        assert found is not entry
+        assert found.entity_id == "run-core"
+
+    def test_stage_create_waits_for_caller_commit(self, db_session):
+        """A staged entry is written only when the caller's transaction commits."""
+        audit = AuditService(db_session)
+
+        audit.stage_create(entity_kind="Run", entity_id="run-rolled-back", after={})
+        db_session.rollback()
+        audit.stage_create(entity_kind="Run", entity_id="run-committed", after={})
+        db_session.commit()
+
+        ids = {e.entity_id for e in db_session.query(AuditLogModel).all()}
+        assert ids == {"run-committed"}
+
 
 class TestAuditServiceUpdate:
     """Tests for AuditService.log_update()."""
@@ -231,6 +277,117 @@ class TestAuditServiceLink:
         assert entry.after is None
 
 
+class TestAuditWriter:
+    """Tests for the background AuditWriter used when AUDIT_ASYNC is on."""
+
+    @pytest.fixture
+    def session_factory(self):
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(engine)
+        return sessionmaker(bind=engine)
+
+    def test_log_queues_until_flush(self, session_factory):
+        writer = AuditWriter(session_factory, batch_size=100, flush_interval=60)
+        db = session_factory()
+        try:
+            audit = AuditService(db, writer=writer)
+            entry = audit.log_create(entity_kind="Run", entity_id="run-1", after={})
+            audit.log_link(
+                entity_kind="Issue",
+                entity_id="issue-1",
+                linked_kind="Run",
+                linked_id="run-1",
+            )
+            assert entry.id
+            assert db.query(AuditLogModel).count() == 0
+
+            assert writer.flush(timeout=5)
+            rows = db.query(AuditLogModel).all()
+            assert {(r.action, r.entity_id) for r in rows} == {
+                ("created", "run-1"),
+                ("linked", "issue-1"),
+            }
+        finally:
+            writer.close(timeout=5)
+            db.close()
+
+    def test_batch_size_triggers_write(self, session_factory):
+        writer = AuditWriter(session_factory, batch_size=2, flush_interval=60)
+        db = session_factory()
+        try:
+            audit = AuditService(db, writer=writer)
+            for i in range(2):
+                audit.stage_create(entity_kind="Run", entity_id=f"run-{i}", after={})
+            for _ in range(50):
+                if db.query(AuditLogModel).count() == 2:
+                    break
+                time.sleep(0.05)
+            assert db.query(AuditLogModel).count() == 2
+        finally:
+            writer.close(timeout=5)
+            db.close()
+
+    def test_close_drains_queue(self, session_factory):
+        writer = AuditWriter(session_factory, batch_size=100, flush_interval=60)
+        AuditService(session_factory(), writer=writer).stage_create(
+            entity_kind="Run", entity_id="run-1", after={}
+        )
+        writer.close(timeout=5)
+
+        db = session_factory()
+        assert db.query(AuditLogModel).count() == 1
+        db.close()
+
+
+class TestAuditBulkCopy:
+    """Tests for AuditService.bulk_copy and the COPY row encoding."""
+
+    def _row(self, entity_id, **overrides):
+        row = {
+            "id": f"id-{entity_id}",
+            "ts": datetime(2026, 1, 26, 12, 0, 0, tzinfo=timezone.utc),
+            "actor_kind": "system",
+            "actor_id": "backfill",
+            "action": "created",
+            "entity_kind": "Run",
+            "entity_id": entity_id,
+            "before": None,
+            "after": {"status": "done"},
+            "note": None,
+            "trace_id": None,
+        }
+        row.update(overrides)
+        return row
+
+    def test_bulk_copy_inserts_rows(self, db_session):
+        """Off PostgreSQL, bulk_copy falls back to one executemany INSERT."""
+        audit = AuditService(db_session)
+
+        written = audit.bulk_copy(self._row(f"run-{i}") for i in range(3))
+        db_session.commit()
+
+        assert written == 3
+        rows = db_session.query(AuditLogModel).order_by(AuditLogModel.id).all()
+        assert [r.entity_id for r in rows] == ["run-0", "run-1", "run-2"]
+        assert rows[0].after == {"status": "done"}
+
+    def test_copy_line_escapes_text_format(self):
+        """NULLs, JSON and control characters are encoded for COPY text."""
+        row = self._row("run-1", note="line one\nline\ttwo \\ end")
+
+        fields = _copy_line(row).rstrip("\n").split("\t")
+
+        assert len(fields) == len(AuditLogModel.__table__.columns)
+        assert fields[1] == "2026-01-26T12:00:00+00:00"
+        assert fields[7] == "\\N"
+        assert fields[8] == '{"status":"done"}'
+        assert fields[9] == "line one\\nline\\ttwo \\\\ end"
+
+
 class TestAuditServiceQueries:
     """Tests for AuditService query methods."""
 
@@ -323,3 +480,28 @@ class TestAuditLogIndexes:
         assert "ix_audit_log_actor" in indexes
         assert "ix_audit_log_ts_action" in indexes
         assert "ix_audit_log_entity_ts" in indexes
+
+    def test_ts_brin_index_postgresql_only(self, db_session):
+        """The BRIN index on ts is declared but only built on PostgreSQL."""
+        brin = next(
+            idx
+            for idx in AuditLogModel.__table__.indexes
+            if idx.name == "brin_audit_log_ts"
+        )
+        assert brin.dialect_options["postgresql"]["using"] == "brin"
+
+        inspector = inspect(db_session.get_bind())
+        built = {idx["name"] for idx in inspector.get_indexes("audit_log")}
+        assert "brin_audit_log_ts" not in built
+        assert "ix_audit_log_ts" in built
+
+
+class TestAuditPartitions:
+    """Tests for the monthly audit_log partition helpers."""
+
+    def test_month_start_rolls_over_year(self):
+        assert month_start(date(2026, 11, 17), 2) == date(2027, 1, 1)
+        assert partition_name(month_start(date(2026, 11, 17))) == "audit_log_p202611"
+
+    def test_ensure_partitions_noop_on_sqlite(self, db_session):
+        assert ensure_audit_partitions(db_session.connection()) == []
@@ -10,6 +10,8 @@ Tests verify:
 Database setup is handled by the shared fixtures in conftest.py.
 """
 
+import inspect
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -63,6 +65,24 @@ class TestRepoEndpoints:
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
+    def test_create_repo_reused_id_conflicts(self):
+        """Test that a client id naming a different Repo is rejected."""
+        repo = {
+            "id": f"client-repo-{id(self)}",
+            "name": "Client Id Repo",
+            "slug": f"client-id-repo-{id(self)}",
+            "source": {"system": "github", "external_id": "org/client-id"},
+        }
+        first = client.post("/cwom/repos", json=repo)
+        again = client.post("/cwom/repos", json=repo)
+        assert again.json()["repo"]["id"] == first.json()["repo"]["id"]
+
+        response = client.post(
+            "/cwom/repos", json={**repo, "slug": f"client-id-other-{id(self)}"}
+        )
+        assert response.status_code == 409
+        assert "already exists" in response.json()["detail"]
+
     def test_get_repo(self):
         """Test getting a Repo by ID."""
         # Create repo first
@@ -103,6 +123,36 @@ class TestRepoEndpoints:
         assert response.status_code == 200
         assert len(response.json()) >= 3
 
+    def test_list_repos_keyset_pagination(self):
+        """Test walking Repos page by page with the X-Next-Cursor header."""
+        for i in range(3):
+            client.post(
+                "/cwom/repos",
+                json={
+                    "name": f"Keyset Test {i}",
+                    "slug": f"keyset-test-{i}",
+                    "source": {"system": "github", "external_id": f"org/ks-{i}"},
+                },
+            )
+
+        seen = []
+        response = client.get("/cwom/repos", params={"limit": 2})
+        while True:
+            assert response.status_code == 200
+            seen.extend(r["id"] for r in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = client.get("/cwom/repos", params={"limit": 2, "after": cursor})
+
+        assert len(seen) == len(set(seen))
+        assert set(seen) == {r["id"] for r in client.get("/cwom/repos").json()}
+
+    def test_list_repos_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/cwom/repos", params={"after": "not-a-cursor"})
+        assert response.status_code == 422
+
 
 class TestIssueEndpoints:
     """Tests for /cwom/issues endpoints."""
@@ -152,6 +202,21 @@ class TestIssueEndpoints:
         assert response.status_code == 422
         assert "does not exist" in response.json()["detail"]
 
+    def test_create_issue_reused_id_conflicts(self, repo_id):
+        """Test that a client id naming a different Issue is rejected."""
+        issue = {
+            "id": f"client-issue-{id(self)}",
+            "repo": {"kind": "Repo", "id": repo_id},
+            "title": "Original",
+            "type": "bug",
+        }
+        assert client.post("/cwom/issues", json=issue).status_code == 201
+        assert client.post("/cwom/issues", json=issue).status_code == 201
+
+        response = client.post("/cwom/issues", json={**issue, "title": "Other"})
+        assert response.status_code == 409
+        assert "already exists" in response.json()["detail"]
+
     def test_get_issue(self, repo_id):
         """Test getting an Issue by ID."""
         # Create issue
@@ -239,6 +304,28 @@ class TestContextPacketEndpoints:
         assert data["context_packet"]["version"] == "1.0"
         assert data["context_packet"]["kind"] == "ContextPacket"
 
+    def test_get_context_packet_is_cached(self, issue_id):
+        """Test that repeat GETs of an immutable ContextPacket hit the cache."""
+        from devops_control_tower.cwom.response_cache import context_packet_cache
+
+        create_response = client.post(
+            "/cwom/context-packets",
+            json={
+                "for_issue": {"kind": "Issue", "id": issue_id},
+                "version": "1.0",
+                "summary": "Cache test",
+            },
+        )
+        packet_id = create_response.json()["context_packet"]["id"]
+
+        first = client.get(f"/cwom/context-packets/{packet_id}")
+        assert first.status_code == 200
+        assert context_packet_cache.get(packet_id) == first.content
+
+        second = client.get(f"/cwom/context-packets/{packet_id}")
+        assert second.json() == first.json()
+        assert second.json()["summary"] == "Cache test"
+
     def test_context_packet_immutability_patch(self, issue_id):
         """Test that ContextPackets cannot be modified via PATCH."""
         # Create context packet
@@ -272,6 +359,13 @@ class TestContextPacketEndpoints:
 
         response = client.put(f"/cwom/context-packets/{packet_id}")
         assert response.status_code == 405
+        assert response.json() == {
+            "detail": {
+                "error": "IMMUTABILITY_VIOLATION",
+                "message": "ContextPackets are immutable. Create a new ContextPacket with an incremented version instead.",
+                "object_id": packet_id,
+            }
+        }
 
     def test_list_context_packets_for_issue(self, issue_id):
         """Test listing ContextPackets for an Issue."""
@@ -335,6 +429,36 @@ class TestConstraintSnapshotEndpoints:
         assert response.status_code == 405
         assert response.json()["detail"]["error"] == "IMMUTABILITY_VIOLATION"
 
+    def test_immutability_handlers_skip_threadpool(self):
+        """Test that the I/O-free 405 handlers stay async, off the threadpool."""
+        from devops_control_tower.cwom import routes
+
+        assert inspect.iscoroutinefunction(routes.update_context_packet_blocked)
+        assert inspect.iscoroutinefunction(routes.update_constraint_snapshot_blocked)
+
+    def test_list_constraint_snapshots_keyset_pagination(self):
+        """Test that snapshot pages are keyed on captured_at."""
+        for i in range(3):
+            client.post(
+                "/cwom/constraint-snapshots",
+                json={
+                    "scope": "run",
+                    "owner": {"actor_kind": "agent", "actor_id": "keyset-owner"},
+                },
+            )
+
+        params = {"owner_id": "keyset-owner", "limit": 2}
+        first = client.get("/cwom/constraint-snapshots", params=params)
+        assert first.status_code == 200
+        cursor = first.headers["X-Next-Cursor"]
+
+        second = client.get(
+            "/cwom/constraint-snapshots", params={**params, "after": cursor}
+        )
+        assert second.status_code == 200
+        ids = [s["id"] for s in first.json() + second.json()]
+        assert len(ids) == len(set(ids)) == 3
+
 
 class TestDoctrineRefEndpoints:
     """Tests for /cwom/doctrine-refs endpoints."""
@@ -430,6 +554,36 @@ class TestRunEndpoints:
         assert data["run"]["mode"] == "agent"
         assert data["run"]["kind"] == "Run"
 
+    def test_create_run_invalid_repo(self, issue_and_repo):
+        """Test that a run with a valid issue but unknown repo is rejected."""
+        response = client.post(
+            "/cwom/runs",
+            json={
+                "for_issue": {"kind": "Issue", "id": issue_and_repo["issue_id"]},
+                "repo": {"kind": "Repo", "id": "nonexistent-repo"},
+                "mode": "agent",
+                "executor": {
+                    "actor": {"actor_kind": "agent", "actor_id": "claude"},
+                    "runtime": "container",
+                },
+            },
+        )
+        assert response.status_code == 422
+        assert (
+            response.json()["detail"]
+            == "Referenced Repo 'nonexistent-repo' does not exist"
+        )
+
+    def test_create_run_malformed_json(self):
+        """A body that is not valid JSON is a 422, not a server error."""
+        response = client.post(
+            "/cwom/runs",
+            content=b'{"mode": "agent",',
+            headers={"content-type": "application/json"},
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+
     def test_update_run(self, issue_and_repo):
         """Test updating a Run."""
         # Create run (starts as "planned" by default)
@@ -458,6 +612,32 @@ class TestRunEndpoints:
         assert response.status_code == 200
         assert response.json()["run"]["status"] == "running"
 
+    def test_list_runs_omits_none_fields(self, issue_and_repo):
+        """List items drop None fields; GET-by-id still returns them."""
+        create_response = client.post(
+            "/cwom/runs",
+            json={
+                "for_issue": {"kind": "Issue", "id": issue_and_repo["issue_id"]},
+                "repo": {"kind": "Repo", "id": issue_and_repo["repo_id"]},
+                "mode": "agent",
+                "executor": {
+                    "actor": {"actor_kind": "agent", "actor_id": "claude"},
+                    "runtime": "local",
+                },
+            },
+        )
+        run = create_response.json()["run"]
+        none_fields = {k for k, v in run.items() if v is None}
+        assert none_fields
+
+        response = client.get(
+            "/cwom/runs", params={"issue_id": issue_and_repo["issue_id"]}
+        )
+        assert response.status_code == 200
+        (listed,) = response.json()
+        assert none_fields.isdisjoint(listed)
+        assert listed["id"] == run["id"]
+
 
 class TestArtifactEndpoints:
     """Tests for /cwom/artifacts endpoints."""
@@ -541,3 +721,269 @@ class TestArtifactEndpoints:
         response = client.get(f"/cwom/runs/{run_id['run_id']}/artifacts")
         assert response.status_code == 200
         assert len(response.json()) >= 3
+
+    def test_list_artifacts_for_run_keyset_pagination(self, run_id):
+        """Test walking a Run's Artifacts with the X-Next-Cursor header."""
+        url = f"/cwom/runs/{run_id['run_id']}/artifacts"
+        for i in range(3):
+            client.post(
+                "/cwom/artifacts",
+                json={
+                    "produced_by": {"kind": "Run", "id": run_id["run_id"]},
+                    "for_issue": {"kind": "Issue", "id": run_id["issue_id"]},
+                    "type": "log",
+                    "title": f"Log {i}",
+                    "uri": f"https://logs.example.com/{i}",
+                },
+            )
+
+        seen = []
+        response = client.get(url, params={"limit": 2})
+        while True:
+            assert response.status_code == 200
+            seen.extend(a["id"] for a in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            response = client.get(url, params={"limit": 2, "after": cursor})
+
+        assert len(seen) == len(set(seen))
+        assert set(seen) == {a["id"] for a in client.get(url).json()}
+
+
+class TestBatchEndpoint:
+    """Tests for POST /cwom/batch."""
+
+    def test_batch_mixed_results_in_order(self):
+        """Test that each op gets its own status and body, in op order."""
+        repo_response = client.post(
+            "/cwom/repos",
+            json={
+                "name": "Batch Repo",
+                "slug": f"batch-repo-{id(self)}",
+                "source": {"system": "github", "external_id": "org/batch"},
+            },
+        )
+        repo_id = repo_response.json()["repo"]["id"]
+
+        response = client.post(
+            "/cwom/batch",
+            json={
+                "ops": [
+                    {"path": f"/cwom/repos/{repo_id}"},
+                    {"path": "/cwom/issues/nonexistent-issue"},
+                    {"path": "/cwom/repos?limit=0"},
+                    {"path": "/health"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert results[0]["status"] == 200
+        assert results[0]["body"]["id"] == repo_id
+        assert results[1] == {"status": 404, "body": {"detail": "Issue not found"}}
+        assert results[2]["status"] == 422
+        assert results[3]["status"] == 404
+
+    def test_batch_collects_streamed_list_pages(self, monkeypatch):
+        """Test that list pages large enough to stream come back whole."""
+        from devops_control_tower.cwom import routes
+
+        for i in range(3):
+            client.post(
+                "/cwom/repos",
+                json={
+                    "name": f"Streamed Repo {i}",
+                    "slug": f"streamed-repo-{id(self)}-{i}",
+                    "source": {"system": "github", "external_id": f"org/s{i}"},
+                },
+            )
+        monkeypatch.setattr(routes, "_STREAM_CHUNK", 1)
+
+        response = client.post(
+            "/cwom/batch", json={"ops": [{"path": "/cwom/repos?limit=3"}] * 6}
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 6
+        for result in results:
+            assert result["status"] == 200
+            assert len(result["body"]) == 3
+        assert results[0] == results[-1]
+
+    def test_batch_returns_list_cursor(self):
+        """Test that batched list ops carry the page's X-Next-Cursor."""
+        for i in range(2):
+            client.post(
+                "/cwom/repos",
+                json={
+                    "name": f"Batch Page Repo {i}",
+                    "slug": f"batch-page-repo-{id(self)}-{i}",
+                    "source": {"system": "github", "external_id": f"org/bp{i}"},
+                },
+            )
+        direct = client.get("/cwom/repos", params={"limit": 1})
+
+        first = client.post(
+            "/cwom/batch",
+            json={"ops": [{"path": "/cwom/repos?limit=1"}, {"path": "/cwom/repos"}]},
+        ).json()["results"]
+        cursor = first[0]["next_cursor"]
+        assert cursor == direct.headers["X-Next-Cursor"]
+        assert first[1]["next_cursor"] is None
+
+        (second,) = client.post(
+            "/cwom/batch",
+            json={"ops": [{"path": f"/cwom/repos?limit=1&after={cursor}"}]},
+        ).json()["results"]
+        following = client.get("/cwom/repos", params={"limit": 1, "after": cursor})
+        assert second["body"] == following.json()
+        assert second["next_cursor"] == following.headers.get("X-Next-Cursor")
+
+    def test_batch_isolates_unexpected_errors(self, monkeypatch):
+        """Test that an op raising unexpectedly fails alone with a 500."""
+        from devops_control_tower.cwom.services import IssueService
+
+        def explode(self, issue_id):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(IssueService, "get", explode)
+
+        response = client.post(
+            "/cwom/batch",
+            json={"ops": [{"path": "/cwom/issues/any"}, {"path": "/cwom/repos"}]},
+        )
+
+        assert response.status_code == 200
+        failed, ok = response.json()["results"]
+        assert failed == {"status": 500, "body": {"detail": "Internal Server Error"}}
+        assert ok["status"] == 200
+
+    def test_batch_rejects_non_get(self):
+        """Test that only GET ops are accepted."""
+        response = client.post(
+            "/cwom/batch",
+            json={"ops": [{"method": "POST", "path": "/cwom/repos"}]},
+        )
+        assert response.status_code == 422
+
+
+class TestListStreaming:
+    """Tests for chunked encoding of large list pages."""
+
+    def test_streamed_body_matches_single_encode(self):
+        import orjson
+
+        from devops_control_tower.cwom.routes import _iter_json_array
+
+        for n in (1, 200, 201, 450):
+            items = [{"id": str(i), "n": i} for i in range(n)]
+            assert b"".join(_iter_json_array(items)) == orjson.dumps(items)
+
+
+class _FakeRedis:
+    """Minimal in-memory stand-in for the redis client calls ListCache makes."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def expire(self, key, ttl):
+        pass
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        pass
+
+
+class TestListCache:
+    """Tests for the Redis-backed CWOM list cache."""
+
+    def test_disabled_cache_passes_through(self):
+        from devops_control_tower.cwom.list_cache import ListCache
+
+        cache = ListCache("redis://unused", ttl=0)
+        assert cache.get("repos", {"limit": 10}) is None
+        assert cache.put("repos", {"limit": 10}, [{"id": "r1"}]) == b'[{"id":"r1"}]'
+
+    def test_put_get_and_invalidate(self):
+        from devops_control_tower.cwom.list_cache import ListCache
+
+        cache = ListCache("redis://unused", ttl=30)
+        cache._client = _FakeRedis()
+        params = {"status": "planned", "limit": 100, "offset": 0}
+
+        body = cache.put("issues", params, [{"id": "i1"}], "cursor-1")
+        assert cache.get("issues", dict(reversed(params.items()))) == (
+            body,
+            "cursor-1",
+        )
+
+        cache.invalidate("runs")
+        assert cache.get("issues", params) == (body, "cursor-1")
+
+        cache.invalidate("issues")
+        assert cache.get("issues", params) is None
+
+    def test_committed_writes_invalidate_cached_lists(self, monkeypatch):
+        from devops_control_tower.cwom import list_cache
+        from devops_control_tower.cwom.repo import RepoCreate
+        from devops_control_tower.cwom.services import RepoService
+        from devops_control_tower.db.cwom_models import CWOMRepoModel
+        from tests.conftest import TestSessionLocal
+
+        cache = list_cache.ListCache("redis://unused", ttl=30)
+        cache._client = _FakeRedis()
+        monkeypatch.setattr(list_cache, "_list_cache", cache)
+        params = {"limit": 10}
+
+        def cached(entity):
+            return cache.get(entity, params) is not None
+
+        db = TestSessionLocal()
+        try:
+            for entity in ("repos", "runs"):
+                cache.put(entity, params, [])
+            repo_id = (
+                RepoService(db)
+                .create(
+                    RepoCreate(
+                        name="Cached",
+                        slug=f"cached-lists-{id(self)}",
+                        source={"system": "github", "external_id": "org/cached"},
+                    )
+                )
+                .id
+            )
+            assert not cached("repos")
+            assert cached("runs")
+
+            # Direct ORM writes, as the worker makes, count too; rollbacks don't
+            cache.put("repos", params, [])
+            db.get(CWOMRepoModel, repo_id).name = "Discarded"
+            db.flush()
+            db.rollback()
+            assert cached("repos")
+            db.get(CWOMRepoModel, repo_id).name = "Renamed"
+            db.commit()
+            assert not cached("repos")
+        finally:
+            db.close()
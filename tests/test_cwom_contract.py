@@ -5,9 +5,12 @@ These tests ensure the CWOM schemas don't accidentally change in breaking ways.
 If these tests fail, it means the schema has changed - verify the change is intentional.
 """
 
+from typing import get_args
+
 import pytest
 from pydantic import ValidationError
 
+from devops_control_tower import cwom
 from devops_control_tower.cwom import (  # Enums; Primitives; Object types; Version
     Actor,
     ActorKind,
@@ -130,6 +133,41 @@ class TestArtifactTypeEnum:
         assert artifact_type in [t.value for t in ArtifactType]
 
 
+class TestLiteralValueSets:
+    """Literal value sets used on model fields must match their enums."""
+
+    @pytest.mark.parametrize(
+        "enum_name",
+        [
+            "Status",
+            "IssueType",
+            "Priority",
+            "ArtifactType",
+            "DoctrineType",
+            "DoctrinePriority",
+            "Visibility",
+            "ActorKind",
+            "Verdict",
+            "CriterionStatus",
+            "ReviewDecisionStatus",
+        ],
+    )
+    def test_literal_matches_enum(self, enum_name: str):
+        """Each <Enum>Value Literal lists exactly the enum's values."""
+        enum_cls = getattr(cwom, enum_name)
+        literal = getattr(cwom, f"{enum_name}Value")
+        assert set(get_args(literal)) == {e.value for e in enum_cls}
+
+    def test_enum_input_is_accepted(self):
+        """Enum members are still accepted and stored as plain strings."""
+        source = Source(system="github")
+        repo = Repo(
+            name="Test", slug="test", source=source, visibility=Visibility.PUBLIC
+        )
+        assert repo.visibility == "public"
+        assert type(repo.visibility) is str
+
+
 class TestActorSchema:
     """Test Actor primitive schema."""
 
@@ -228,6 +266,29 @@ class TestRunSchema:
         assert run.mode == RunMode.AGENT
         assert run.status == Status.PLANNED
 
+    def test_run_timestamps_use_request_clock(self):
+        """Inside a request, default timestamps share the pinned request time."""
+        from datetime import datetime, timezone
+
+        from devops_control_tower.cwom import Executor
+        from devops_control_tower.cwom.primitives import request_now
+
+        pinned = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        token = request_now.set(pinned)
+        try:
+            run = Run(
+                for_issue=Ref(kind=ObjectKind.ISSUE, id="issue123"),
+                repo=Ref(kind=ObjectKind.REPO, id="repo123"),
+                mode=RunMode.AGENT,
+                executor=Executor(
+                    actor=Actor(actor_kind="agent", actor_id="agent1"),
+                    runtime="local",
+                ),
+            )
+        finally:
+            request_now.reset(token)
+        assert run.created_at == run.updated_at == pinned
+
 
 class TestArtifactSchema:
     """Test Artifact object schema."""
@@ -5,10 +5,15 @@ causality chain, immutability enforcement, status transitions, audit trails,
 and edge cases — all through the CWOM service layer against a real database.
 """
 
+import os
+import threading
 import time
 from datetime import datetime, timezone
 
 import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy import update as sql_update
+from sqlalchemy.orm import sessionmaker
 
 from devops_control_tower.cwom import (
     Actor,
@@ -46,13 +51,19 @@ from devops_control_tower.cwom.services import (
     ContextPacketService,
     DoctrineRefService,
     EvidencePackService,
+    IdConflictError,
     IssueService,
     RepoService,
     ReviewDecisionService,
     RunService,
 )
 from devops_control_tower.db.audit_service import AuditService
-from devops_control_tower.db.cwom_models import CWOMEvidencePackModel, CWOMRepoModel
+from devops_control_tower.db.base import JSON_ENGINE_OPTIONS, Base, get_database_url
+from devops_control_tower.db.cwom_models import (
+    CWOMEvidencePackModel,
+    CWOMIssueModel,
+    CWOMRepoModel,
+)
 
 # =============================================================================
 # Factory helpers — return Pydantic *Create schemas with unique identifiers
@@ -237,6 +248,12 @@ class TestRepoRoundTrip:
         for rid in ids:
             assert rid in repo_ids
 
+    def test_list_dicts_matches_to_dict(self, db_session):
+        svc = RepoService(db_session)
+        svc.create(make_repo_create())
+
+        assert svc.list_dicts() == [r.to_dict() for r in svc.list()]
+
     def test_to_dict_after_round_trip(self, db_session):
         svc = RepoService(db_session)
         repo = svc.create(make_repo_create())
@@ -290,6 +307,36 @@ class TestIssueRoundTrip:
         issues = svc.list(status="planned")
         assert len(issues) >= 1
 
+    def test_list_fields_defers_other_columns(self, db_session):
+        repo = self._make_repo(db_session)
+        svc = IssueService(db_session)
+        issue_id = svc.create(make_issue_create(repo.id)).id
+        repo_id = repo.id
+        db_session.expunge_all()
+
+        (issue,) = svc.list(repo_id=repo_id, fields=["title", "status"])
+        unloaded = inspect(issue).unloaded
+        assert issue.id == issue_id
+        assert {"title", "status"}.isdisjoint(unloaded)
+        assert {"description", "acceptance", "meta"} <= unloaded
+
+        with pytest.raises(ValueError):
+            svc.list(fields=["no_such_column"])
+
+    def test_get_include_related_loads_runs_and_repo(self, db_session):
+        repo = self._make_repo(db_session)
+        svc = IssueService(db_session)
+        issue_id = svc.create(make_issue_create(repo.id)).id
+        run_id = RunService(db_session).create(make_run_create(issue_id, repo.id)).id
+        db_session.expunge_all()
+
+        assert {"runs_rel", "repo_obj"} <= inspect(svc.get(issue_id)).unloaded
+        db_session.expunge_all()
+
+        issue = svc.get(issue_id, include_related=True)
+        assert not {"runs_rel", "repo_obj"} & inspect(issue).unloaded
+        assert [r.id for r in issue.runs_rel] == [run_id]
+
     def test_to_dict_includes_empty_relations(self, db_session):
         repo = self._make_repo(db_session)
         svc = IssueService(db_session)
@@ -336,6 +383,17 @@ class TestRelationshipLoading:
         cp_ids = [cp.id for cp in fetched.context_packets]
         assert packet.id in cp_ids
 
+    def test_issue_get_eager_loads_to_dict_collections(self, db_session):
+        repo, issue = self._seed(db_session)
+        issue_id = issue.id
+        db_session.expunge_all()
+
+        fetched = IssueService(db_session).get(issue_id)
+        unloaded = inspect(fetched).unloaded
+        assert "doctrine_refs_rel" not in unloaded
+        assert "constraint_snapshots" not in unloaded
+        assert "context_packets" not in unloaded
+
     def test_issue_doctrine_ref_link_and_load(self, db_session):
         repo, issue = self._seed(db_session)
         doctrine = DoctrineRefService(db_session).create(make_doctrine_ref_create())
@@ -421,6 +479,25 @@ class TestRelationshipLoading:
         cp_ids = [cp.id for cp in fetched.context_packets]
         assert packet.id in cp_ids
 
+    def test_run_link_skips_duplicate_and_missing_refs(self, db_session):
+        repo, issue = self._seed(db_session)
+        packet = ContextPacketService(db_session).create(
+            make_context_packet_create(issue.id)
+        )
+        ref = Ref(kind=ObjectKind.CONTEXT_PACKET, id=packet.id)
+        missing = Ref(kind=ObjectKind.CONTEXT_PACKET, id="no-such-packet")
+        run = RunService(db_session).create(
+            make_run_create(
+                issue.id,
+                repo.id,
+                inputs=RunInputs(context_packets=[ref, ref, missing]),
+            )
+        )
+
+        fetched = RunService(db_session).get(run.id)
+        db_session.refresh(fetched)
+        assert [cp.id for cp in fetched.context_packets] == [packet.id]
+
     def test_run_doctrine_ref_auto_link(self, db_session):
         repo, issue = self._seed(db_session)
         doctrine = DoctrineRefService(db_session).create(make_doctrine_ref_create())
@@ -447,6 +524,23 @@ class TestRelationshipLoading:
         assert fetched.issue_obj is not None
         assert fetched.issue_obj.id == issue.id
 
+    def test_run_cached_json_tracks_writes(self, db_session):
+        repo, issue = self._seed(db_session)
+        svc = RunService(db_session)
+        stamps = ("created_at", "updated_at")
+
+        def without_stamps(d):
+            # SQLite drops tzinfo on reload; the cached copy keeps +00:00
+            return {k: v for k, v in d.items() if k not in stamps}
+
+        run = svc.create(make_run_create(issue.id, repo.id))
+        assert without_stamps(run.cached_json) == without_stamps(run.to_dict())
+
+        run = svc.update(run.id, RunUpdate(status=Status.RUNNING))
+        assert run.cached_json["status"] == "running"
+        assert without_stamps(run.cached_json) == without_stamps(run.to_dict())
+        assert svc.list_dicts(issue_id=issue.id) == [run.cached_json]
+
     def test_run_artifacts_relationship(self, db_session):
         repo, issue = self._seed(db_session)
         run = RunService(db_session).create(make_run_create(issue.id, repo.id))
@@ -591,6 +685,17 @@ class TestJoinTableQueries:
         assert latest.id == p2.id
         assert latest.version == "2.0"
 
+    def test_doctrine_ref_get_by_name_latest_version(self, db_session):
+        svc = DoctrineRefService(db_session)
+        v1 = make_doctrine_ref_create()
+        svc.create(v1)
+        time.sleep(0.01)
+        v2 = svc.create(v1.model_copy(update={"version": "2.0"}))
+
+        assert svc.get_by_name(v1.namespace, v1.name).id == v2.id
+        assert svc.get_by_name(v1.namespace, v1.name, "1.0").version == "1.0"
+        assert svc.get_by_name(v1.namespace, "missing") is None
+
     def test_artifacts_for_run_service(self, db_session):
         repo, issue = self._seed(db_session)
         run = RunService(db_session).create(make_run_create(issue.id, repo.id))
@@ -603,6 +708,24 @@ class TestJoinTableQueries:
         assert a1.id in ids
         assert a2.id in ids
 
+    def test_stream_matches_list(self, db_session):
+        repo, issue = self._seed(db_session)
+        run = RunService(db_session).create(make_run_create(issue.id, repo.id))
+        art_svc = ArtifactService(db_session)
+        for _ in range(3):
+            art_svc.create(make_artifact_create(run.id, issue.id))
+        cp_svc = ContextPacketService(db_session)
+        cp_svc.create(make_context_packet_create(issue.id, version="1.0"))
+        cp_svc.create(make_context_packet_create(issue.id, version="2.0"))
+
+        listed = [a.id for a in art_svc.list_for_run(run.id)]
+        assert [a.id for a in art_svc.stream_for_run(run.id)] == listed
+        assert [a.id for a in art_svc.stream_for_issue(issue.id)] == listed
+        assert [a.id for a in art_svc.stream_for_run(run.id, limit=2)] == listed[:2]
+        assert [p.id for p in cp_svc.stream_for_issue(issue.id)] == [
+            p.id for p in cp_svc.list_for_issue(issue.id)
+        ]
+
 
 # =============================================================================
 # Class 5: Full Causality Chain
@@ -904,6 +1027,20 @@ class TestStatusTransitions:
         assert fetched.telemetry is not None
         assert fetched.telemetry["duration_s"] == 42.5
 
+    def test_run_update_audits_only_written_fields(self, db_session):
+        repo, issue = self._seed(db_session)
+        run = RunService(db_session).create(make_run_create(issue.id, repo.id))
+
+        RunService(db_session).update(
+            run.id, RunUpdate(telemetry=Telemetry(duration_s=1.5))
+        )
+
+        entries = AuditService(db_session).query_by_entity("Run", run.id)
+        update = [e for e in entries if e.action == "updated"][-1]
+        assert update.before == {"telemetry": {}}
+        assert list(update.after) == ["telemetry"]
+        assert update.after["telemetry"]["duration_s"] == 1.5
+
     def test_review_approved_transitions_to_done(self, db_session):
         repo, issue = self._seed(db_session)
         run = RunService(db_session).create(make_run_create(issue.id, repo.id))
@@ -984,6 +1121,19 @@ class TestAuditTrailAndEdgeCases:
         link_entries = [e for e in entries if e.action == "linked"]
         assert len(link_entries) >= 1
 
+    def test_duplicate_link_returns_false_without_audit(self, db_session):
+        repo, issue = self._seed(db_session)
+        doctrine = DoctrineRefService(db_session).create(make_doctrine_ref_create())
+        svc = IssueService(db_session)
+
+        assert svc.link_doctrine_ref(issue.id, doctrine.id) is True
+        assert svc.link_doctrine_ref(issue.id, doctrine.id) is False
+
+        entries = AuditService(db_session).query_by_entity("Issue", issue.id)
+        assert len([e for e in entries if e.action == "linked"]) == 1
+        db_session.refresh(issue)
+        assert [d.id for d in issue.doctrine_refs_rel] == [doctrine.id]
+
     def test_review_decision_creates_multiple_audit_entries(self, db_session):
         repo, issue = self._seed(db_session)
         run = RunService(db_session).create(make_run_create(issue.id, repo.id))
@@ -1071,3 +1221,186 @@ class TestAuditTrailAndEdgeCases:
         # Same namespace/name/version should fail
         with pytest.raises(Exception):
             svc.create(create)
+
+    def test_create_if_absent_conflict_keeps_staged_work(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        staged = AuditService(db_session).stage_create(
+            entity_kind="Repo", entity_id=repo.id, after={}, actor_id="staged"
+        )
+
+        duplicate = make_repo_create().model_copy(update={"slug": repo.slug})
+        assert RepoService(db_session).create_if_absent(duplicate) is None
+        db_session.commit()
+
+        entries = AuditService(db_session).query_by_entity("Repo", repo.id)
+        assert staged.id in [e.id for e in entries]
+
+
+# =============================================================================
+# Class 9: Bulk Create
+# =============================================================================
+
+
+class TestBulkCreate:
+    def test_repo_bulk_create_with_audit(self, db_session):
+        svc = RepoService(db_session)
+        ids = svc.bulk_create([make_repo_create() for _ in range(3)], actor_id="bulk")
+
+        assert len(ids) == 3
+        assert [svc.get(i).id for i in ids] == ids
+        audit = AuditService(db_session)
+        for repo_id in ids:
+            (entry,) = audit.query_by_entity("Repo", repo_id)
+            assert entry.action == "created"
+            assert entry.actor_id == "bulk"
+
+    def test_run_bulk_create_links_and_caches(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        issue = IssueService(db_session).create(make_issue_create(repo.id))
+        packet = ContextPacketService(db_session).create(
+            make_context_packet_create(issue.id)
+        )
+        inputs = RunInputs(
+            context_packets=[Ref(kind=ObjectKind.CONTEXT_PACKET, id=packet.id)]
+        )
+        ids = RunService(db_session).bulk_create(
+            [
+                make_run_create(issue.id, repo.id, inputs=inputs),
+                make_run_create(issue.id, repo.id),
+            ]
+        )
+
+        linked, unlinked = (RunService(db_session).get(i) for i in ids)
+        assert [cp.id for cp in linked.context_packets] == [packet.id]
+        assert unlinked.context_packets == []
+        assert linked.cached_json["id"] == linked.id
+        assert linked.cached_json["status"] == "planned"
+
+    def test_bulk_create_empty(self, db_session):
+        assert IssueService(db_session).bulk_create([]) == []
+
+
+# =============================================================================
+# Class 10: Client-Supplied IDs
+# =============================================================================
+
+
+class TestClientSuppliedIds:
+    def test_create_uses_client_id(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        create = make_issue_create(repo.id).model_copy(update={"id": "client-issue-1"})
+        issue = IssueService(db_session).create(create)
+
+        assert issue.id == "client-issue-1"
+        run_create = make_run_create(issue.id, repo.id).model_copy(
+            update={"id": "client-run-1"}
+        )
+        run = RunService(db_session).create(run_create)
+        assert run.cached_json["id"] == "client-run-1"
+
+    def test_retried_create_returns_stored_row(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        create = make_issue_create(repo.id).model_copy(update={"id": "client-issue-2"})
+        svc = IssueService(db_session)
+        first = svc.create(create)
+        again = svc.create(create)
+
+        assert again.id == first.id
+        (entry,) = AuditService(db_session).query_by_entity("Issue", first.id)
+        assert entry.action == "created"
+
+    def test_retried_run_create_returns_stored_row(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        issue = IssueService(db_session).create(make_issue_create(repo.id))
+        create = make_run_create(issue.id, repo.id).model_copy(
+            update={"id": "client-run-2"}
+        )
+        svc = RunService(db_session)
+
+        assert svc.create(create).id == svc.create(create).id
+
+    def test_reused_id_for_different_object_conflicts(self, db_session):
+        repo = RepoService(db_session).create(make_repo_create())
+        svc = IssueService(db_session)
+        svc.create(
+            make_issue_create(repo.id).model_copy(update={"id": "client-issue-3"})
+        )
+
+        other = make_issue_create(repo.id).model_copy(update={"id": "client-issue-3"})
+        with pytest.raises(IdConflictError, match="client-issue-3"):
+            svc.create(other)
+        assert svc.get("client-issue-3").title != other.title
+
+
+# =============================================================================
+# Class 11: PostgreSQL-only paths (run when DATABASE_URL is PostgreSQL, as in CI)
+# =============================================================================
+
+_DATABASE_URL = os.getenv("DATABASE_URL", "")
+
+
+@pytest.mark.skipif(
+    not _DATABASE_URL.startswith("postgresql"),
+    reason="needs DATABASE_URL pointing at PostgreSQL",
+)
+class TestPostgresStatusUpdate:
+    @pytest.fixture
+    def pg_session_factory(self):
+        engine = create_engine(get_database_url(_DATABASE_URL), **JSON_ENGINE_OPTIONS)
+        Base.metadata.create_all(bind=engine)
+        yield sessionmaker(bind=engine, expire_on_commit=False)
+        engine.dispose()
+
+    def test_update_status_audits_old_status(self, pg_session_factory):
+        with pg_session_factory() as db:
+            repo = RepoService(db).create(make_repo_create(generate_ulid()))
+            issue = IssueService(db).create(make_issue_create(repo.id))
+            result = IssueService(db).update_status(issue.id, "running")
+            assert result.status == "running"
+            assert IssueService(db).update_status("no-such-issue", "done") is None
+
+            (entry,) = [
+                e
+                for e in AuditService(db).query_by_entity("Issue", issue.id)
+                if e.action == "status_changed"
+            ]
+            assert entry.before == {"status": "planned"}
+            assert entry.after == {"status": "running"}
+
+    def test_concurrent_update_audits_committed_status(self, pg_session_factory):
+        with pg_session_factory() as db:
+            repo = RepoService(db).create(make_repo_create(generate_ulid()))
+            issue = IssueService(db).create(make_issue_create(repo.id))
+
+        # Hold the row lock with an uncommitted status change
+        blocker = pg_session_factory()
+        blocker.execute(
+            sql_update(CWOMIssueModel)
+            .where(CWOMIssueModel.id == issue.id)
+            .values(status="running")
+        )
+
+        results = {}
+
+        def update_status():
+            with pg_session_factory() as db:
+                results["issue"] = IssueService(db).update_status(issue.id, "done")
+
+        worker = threading.Thread(target=update_status)
+        worker.start()
+        worker.join(0.5)
+        assert worker.is_alive(), "update_status should wait for the row lock"
+
+        blocker.commit()
+        blocker.close()
+        worker.join(10)
+        assert results["issue"].status == "done"
+
+        with pg_session_factory() as db:
+            (entry,) = [
+                e
+                for e in AuditService(db).query_by_entity("Issue", issue.id)
+                if e.action == "status_changed"
+            ]
+        assert entry.before == {"status": "running"}
+        assert entry.after == {"status": "done"}
@@ -1,7 +1,10 @@
 """Tests for event models."""
 
+import sys
 from datetime import datetime
 
+import orjson
+
 from devops_control_tower.data.models.events import (
     Event,
     EventPriority,
@@ -89,6 +92,13 @@ class TestEvent:
         assert "id" in event_dict
         assert "created_at" in event_dict
 
+    def test_to_json_matches_to_dict(self):
+        """to_json encodes the same document as to_dict."""
+        event = Event("test.event", "test", {"key": "value"}, tags={"env": "test"})
+        event.mark_processing("test_processor")
+
+        assert orjson.loads(event.to_json()) == event.to_dict()
+
     def test_from_dict(self):
         """Test creating event from dictionary."""
         event_data = {
@@ -160,6 +170,14 @@ class TestEventTypes:
         assert EventTypes.CODE_COMMIT == "development.code_commit"
         assert EventTypes.SYSTEM_STARTUP == "system.startup"
 
+    def test_event_type_interned(self):
+        """Event types built at runtime are the interned constant objects."""
+        event_type = "".join(["system.", "startup"])
+        event = Event(event_type, "test", {}, tags={"".join(["e", "nv"]): "test"})
+
+        assert event.type is EventTypes.SYSTEM_STARTUP
+        assert next(iter(event.tags)) is sys.intern("env")
+
 
 class TestEventPriority:
     """Test cases for EventPriority enum."""
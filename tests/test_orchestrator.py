@@ -8,7 +8,7 @@ import pytest
 from devops_control_tower.agents.base import BaseAgent
 from devops_control_tower.core.orchestrator import Orchestrator
 from devops_control_tower.data.models.events import Event, EventTypes
-from devops_control_tower.data.models.workflows import Workflow
+from devops_control_tower.data.models.workflows import Workflow, WorkflowBuilder
 
 
 class TestAgent(BaseAgent):
@@ -63,6 +63,39 @@ class TestOrchestrator:
         assert "test" in orch.workflows
         assert orch.workflows["test"] == workflow
 
+    @pytest.mark.asyncio
+    async def test_event_triggers_only_matching_workflows(self, orchestrator):
+        """Only workflows listening for the event type are started."""
+        triggered: List[str] = []
+
+        def workflow_for(name: str, *event_types: str) -> Workflow:
+            async def record(context: Dict[str, Any]) -> None:
+                triggered.append(name)
+
+            return (
+                WorkflowBuilder(name)
+                .triggered_by(*event_types)
+                .add_step("record", record)
+                .build()
+            )
+
+        orchestrator.register_workflow(
+            "deploy", workflow_for("deploy", EventTypes.CODE_COMMIT)
+        )
+        orchestrator.register_workflow(
+            "startup", workflow_for("startup", EventTypes.SYSTEM_STARTUP)
+        )
+        # Re-registering a name replaces the old workflow's triggers too
+        orchestrator.register_workflow(
+            "startup", workflow_for("startup-v2", EventTypes.SYSTEM_SHUTDOWN)
+        )
+
+        for event_type in (EventTypes.CODE_COMMIT, EventTypes.SYSTEM_STARTUP):
+            await orchestrator._handle_event(Event(event_type, "test", {}))
+        await asyncio.gather(*orchestrator.running_tasks.values())
+
+        assert triggered == ["deploy"]
+
     @pytest.mark.asyncio
     async def test_start_stop_orchestrator(self, orchestrator):
         """Test starting and stopping the orchestrator."""
@@ -109,6 +142,25 @@ class TestOrchestrator:
 
         await orchestrator.stop()
 
+    @pytest.mark.asyncio
+    async def test_queued_events_handled_in_order(self, orchestrator):
+        """Events queued before the processor wakes are all handled, in order."""
+        agent = TestAgent()
+        orchestrator.register_agent("test", agent)
+        events = [
+            Event(event_type=EventTypes.SYSTEM_STARTUP, source="test", data={"n": n})
+            for n in range(5)
+        ]
+        for event in events:
+            await orchestrator.emit_event(event)
+
+        await orchestrator.start()
+        await asyncio.sleep(0.1)
+        await orchestrator.stop()
+
+        assert agent.events_handled == events
+        assert orchestrator.event_queue.empty()
+
     def test_get_status(self, orchestrator):
         """Test status reporting."""
         status = orchestrator.get_status()
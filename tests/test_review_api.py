@@ -100,7 +100,7 @@ def _seed_review_data(suffix: str = ""):
 
 def _create_evidence_pack_direct(run_id: str, issue_id: str) -> str:
     """Create an evidence pack directly via DB since there's no POST endpoint."""
-    from devops_control_tower.cwom.primitives import generate_ulid
+    from devops_control_tower.cwom.primitives import generate_ulid, utc_now
     from tests.conftest import TestSessionLocal
 
     # Use the test session (same DB as TestClient)
@@ -123,6 +123,7 @@ def _create_evidence_pack_direct(run_id: str, issue_id: str) -> str:
             checks_passed=3,
             checks_failed=0,
             checks_skipped=0,
+            created_at=utc_now(),
         )
         db.add(ep)
         db.commit()
@@ -359,3 +360,30 @@ class TestReviewConvenienceEndpoints:
         reviews = resp.json()
         assert len(reviews) >= 1
         assert reviews[0]["for_issue"]["id"] == ids["issue_id"]
+
+    def test_list_evidence_packs_for_issue_keyset_pagination(self):
+        """GET /cwom/issues/{id}/evidence-packs walks pages via X-Next-Cursor."""
+        ids = _seed_review_data("epkeyset")
+        created = {
+            _create_evidence_pack_direct(ids["run_id"], ids["issue_id"])
+            for _ in range(3)
+        }
+        url = f"/cwom/issues/{ids['issue_id']}/evidence-packs"
+
+        seen = []
+        resp = client.get(url, params={"limit": 2})
+        while True:
+            assert resp.status_code == 200
+            seen.extend(ep["id"] for ep in resp.json())
+            cursor = resp.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+            resp = client.get(url, params={"limit": 2, "after": cursor})
+
+        assert len(seen) == len(set(seen))
+        assert set(seen) == created
+
+    def test_list_reviews_for_issue_invalid_cursor(self):
+        """GET /cwom/issues/{id}/reviews rejects a malformed cursor."""
+        resp = client.get("/cwom/issues/any/reviews", params={"after": "bogus"})
+        assert resp.status_code == 422
@@ -5,8 +5,11 @@ Tests the bidirectional mapping between JCT V1 Tasks and CWOM objects.
 """
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
 
 from devops_control_tower.cwom.enums import IssueType, Status
+from devops_control_tower.cwom.services import IssueService
 from devops_control_tower.cwom.task_adapter import (
     ISSUE_TYPE_TO_OPERATION,
     OPERATION_TO_ISSUE_TYPE,
@@ -108,6 +111,17 @@ class TestOperationMapping:
         """DOC maps back to docs."""
         assert ISSUE_TYPE_TO_OPERATION[IssueType.DOC] == "docs"
 
+    def test_issue_type_to_operation_by_stored_value(self):
+        """Plain stored strings look up the same entries as the members."""
+        assert ISSUE_TYPE_TO_OPERATION["incident"] == "ops"
+
+    def test_mappings_are_read_only(self):
+        """The module-level mappings cannot be modified."""
+        with pytest.raises(TypeError):
+            OPERATION_TO_ISSUE_TYPE["deploy"] = IssueType.OPS
+        with pytest.raises(TypeError):
+            ISSUE_TYPE_TO_OPERATION[IssueType.OPS] = "deploy"
+
 
 class TestTaskToCWOM:
     """Tests for task_to_cwom conversion."""
@@ -130,6 +144,23 @@ class TestTaskToCWOM:
         assert result.issue.type == IssueType.FEATURE.value
         assert result.issue.status == Status.PLANNED.value
 
+    @pytest.mark.parametrize(
+        "objective",
+        [
+            "Fix the login flow\n\nUsers are logged out after refresh.",
+            "x" * 250,
+            "y" * 250 + "\nsecond line",
+        ],
+    )
+    def test_task_to_cwom_title_from_first_line(
+        self, db_session, sample_task_v1, objective
+    ):
+        """The issue title is the objective's first line, capped at 200 chars."""
+        task = sample_task_v1.model_copy(update={"objective": objective})
+        result = task_to_cwom(task, db_session)
+
+        assert result.issue.title == objective.split("\n")[0][:200]
+
     def test_task_to_cwom_creates_context_packet(self, db_session, sample_task_v1):
         """task_to_cwom creates a ContextPacket with task data in meta."""
         result = task_to_cwom(sample_task_v1, db_session)
@@ -154,6 +185,48 @@ class TestTaskToCWOM:
         assert meta.get("allow_network") is False
         assert meta.get("allow_secrets") is False
 
+    def test_task_to_cwom_reuses_repo_without_slug_query(
+        self, db_session, sample_task_v1
+    ):
+        """A second task for the same repo skips the lookup by slug."""
+        first = task_to_cwom(sample_task_v1, db_session)
+
+        statements = []
+
+        def listen(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_session.get_bind(), "before_cursor_execute", listen)
+        try:
+            second = task_to_cwom(sample_task_v1, db_session)
+        finally:
+            event.remove(db_session.get_bind(), "before_cursor_execute", listen)
+
+        assert second.repo.id == first.repo.id
+        assert not [s for s in statements if "cwom_repos.slug =" in s]
+
+    def test_task_to_cwom_commits_once(self, db_session, sample_task_v1):
+        """All objects, links and audit entries land in one commit."""
+        commits = []
+
+        def count(session):
+            commits.append(session)
+
+        event.listen(db_session, "after_commit", count)
+        try:
+            result = task_to_cwom(sample_task_v1, db_session)
+        finally:
+            event.remove(db_session, "after_commit", count)
+
+        assert len(commits) == 1
+        db_session.refresh(result.issue)
+        assert [c.id for c in result.issue.context_packets] == [
+            result.context_packet.id
+        ]
+        assert [c.id for c in result.issue.constraint_snapshots] == [
+            result.constraint_snapshot.id
+        ]
+
     def test_task_to_cwom_legacy_task(self, db_session, sample_legacy_task):
         """task_to_cwom handles legacy tasks with type/payload aliases."""
         result = task_to_cwom(sample_legacy_task, db_session)
@@ -203,6 +276,44 @@ class TestIssueToTask:
         assert task_dict["constraints"]["allow_network"] is False
         assert task_dict["constraints"]["allow_secrets"] is False
 
+    def test_issue_to_task_from_task_view_runs_no_queries(
+        self, db_session, sample_task_v1, sample_legacy_task
+    ):
+        """Issues from list_for_task_view convert without lazy loads."""
+        ids = [
+            task_to_cwom(task, db_session).issue.id
+            for task in (sample_task_v1, sample_legacy_task)
+        ]
+        db_session.expunge_all()
+        issues = IssueService(db_session).list_for_task_view(ids)
+
+        statements = []
+
+        def listen(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_session.get_bind(), "before_cursor_execute", listen)
+        try:
+            tasks = [
+                issue_to_task(
+                    issue,
+                    context_packet=issue.context_packets[0],
+                    constraint_snapshot=issue.constraint_snapshots[0],
+                    repo=issue.repo_obj,
+                )
+                for issue in issues
+            ]
+        finally:
+            event.remove(db_session.get_bind(), "before_cursor_execute", listen)
+
+        assert statements == []
+        assert sorted(t["target"]["repo"] for t in tasks) == [
+            "testorg/docs-repo",
+            "testorg/test-repo",
+        ]
+        with pytest.raises(InvalidRequestError):
+            issues[0].runs_rel
+
 
 class TestEnqueueWithCWOM:
     """Tests for /tasks/enqueue with create_cwom flag."""
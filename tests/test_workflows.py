@@ -0,0 +1,258 @@
+"""Tests for workflow models."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from devops_control_tower.data.models import workflows
+from devops_control_tower.data.models.events import Event, EventPriority, EventTypes
+from devops_control_tower.data.models.workflows import (
+    StepStatus,
+    WorkflowBuilder,
+    WorkflowStatus,
+)
+
+
+def _recording_step(name: str, log: List[str], delay: float = 0.01):
+    """Step action that logs its start and end around a short sleep."""
+
+    async def action(context: Dict[str, Any]) -> str:
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+        return name
+
+    return action
+
+
+class TestWorkflowExecution:
+    """Test cases for Workflow.execute scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        """Steps with no dependency between them overlap."""
+        log: List[str] = []
+        workflow = (
+            WorkflowBuilder("scan")
+            .add_step("a", _recording_step("a", log))
+            .add_step("b", _recording_step("b", log))
+            .add_step("c", _recording_step("c", log))
+            .add_step(
+                "report", _recording_step("report", log), dependencies=["a", "b", "c"]
+            )
+            .build()
+        )
+
+        result = await workflow.execute({})
+
+        assert log[:3] == ["start:a", "start:b", "start:c"]
+        assert log[-2:] == ["start:report", "end:report"]
+        assert result["step_report_result"] == "report"
+        assert workflow.status == WorkflowStatus.COMPLETED
+        assert all(step.status == StepStatus.COMPLETED for step in workflow.steps)
+
+    @pytest.mark.asyncio
+    async def test_dependent_step_waits_for_dependency(self):
+        """A step starts only after the steps it depends on have finished."""
+        log: List[str] = []
+        workflow = (
+            WorkflowBuilder("chain")
+            .add_step("second", _recording_step("second", log), dependencies=["first"])
+            .add_step("first", _recording_step("first", log))
+            .build()
+        )
+
+        await workflow.execute({})
+
+        assert log == ["start:first", "end:first", "start:second", "end:second"]
+
+    @pytest.mark.asyncio
+    async def test_dependency_cycle_is_skipped(self):
+        """Steps that depend on each other are skipped, the rest still run."""
+        log: List[str] = []
+        workflow = (
+            WorkflowBuilder("cycle")
+            .add_step("x", _recording_step("x", log), dependencies=["y"])
+            .add_step("y", _recording_step("y", log), dependencies=["x"])
+            .add_step("z", _recording_step("z", log))
+            .build()
+        )
+
+        await workflow.execute({})
+
+        assert [step.status for step in workflow.steps] == [
+            StepStatus.SKIPPED,
+            StepStatus.SKIPPED,
+            StepStatus.COMPLETED,
+        ]
+        assert workflow.status == WorkflowStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency_fails_workflow(self):
+        """A dependency naming no step fails the workflow."""
+        workflow = (
+            WorkflowBuilder("broken")
+            .add_step("a", _recording_step("a", []), dependencies=["nope"])
+            .build()
+        )
+
+        with pytest.raises(ValueError, match="nope"):
+            await workflow.execute({})
+
+        assert workflow.status == WorkflowStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_step_failure_cancels_running_steps(self):
+        """The first failing step fails the workflow and cancels the others."""
+        log: List[str] = []
+
+        async def fail(context: Dict[str, Any]) -> None:
+            raise RuntimeError("boom")
+
+        workflow = (
+            WorkflowBuilder("failing")
+            .add_step("slow", _recording_step("slow", log, delay=5))
+            .add_step("fail", fail)
+            .add_step("after", _recording_step("after", log), dependencies=["slow"])
+            .build()
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await workflow.execute({})
+
+        assert workflow.status == WorkflowStatus.FAILED
+        assert workflow.error == "boom"
+        assert log == ["start:slow"]
+        slow, failed, after = workflow.steps
+        assert (slow.status, slow.error) == (StepStatus.FAILED, "Step cancelled")
+        assert failed.status == StepStatus.FAILED
+        assert after.status == StepStatus.SKIPPED
+        assert StepStatus.RUNNING.value not in {
+            s["status"] for s in workflow.get_status()["steps"]
+        }
+
+    @pytest.mark.asyncio
+    async def test_rerun_waits_for_dependencies_again(self):
+        """Step statuses from a previous run don't satisfy dependencies."""
+        log: List[str] = []
+        workflow = (
+            WorkflowBuilder("rerun")
+            .add_step("second", _recording_step("second", log), dependencies=["first"])
+            .add_step("first", _recording_step("first", log))
+            .build()
+        )
+
+        await workflow.execute({})
+        log.clear()
+        await workflow.execute({})
+
+        assert log == ["start:first", "end:first", "start:second", "end:second"]
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_fails_step(self):
+        """A step running past its timeout fails with a timeout error."""
+        workflow = (
+            WorkflowBuilder("slow")
+            .add_step("sleepy", _recording_step("sleepy", [], delay=5), timeout=0.01)
+            .build()
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await workflow.execute({})
+
+        step = workflow.steps[0]
+        assert step.status == StepStatus.FAILED
+        assert step.error == "Step timed out after 0.01 seconds"
+
+    @pytest.mark.asyncio
+    async def test_failed_step_retried_until_success(self, monkeypatch):
+        """A failing step is retried up to retry_count times."""
+        monkeypatch.setattr(workflows, "_retry_delay", lambda attempt: 0)
+        calls: List[int] = []
+
+        async def flaky(context: Dict[str, Any]) -> str:
+            calls.append(len(calls))
+            if len(calls) < 3:
+                raise RuntimeError("transient")
+            return "ok"
+
+        workflow = WorkflowBuilder("flaky").add_step("f", flaky, retry_count=2).build()
+
+        result = await workflow.execute({})
+
+        assert result["step_f_result"] == "ok"
+        assert workflow.steps[0].attempts == 3
+        assert workflow.steps[0].status == StepStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_failed_step_raises_after_retries(self, monkeypatch):
+        """Once retries are exhausted the last error is raised."""
+        monkeypatch.setattr(workflows, "_retry_delay", lambda attempt: 0)
+
+        async def broken(context: Dict[str, Any]) -> None:
+            raise RuntimeError("still broken")
+
+        workflow = (
+            WorkflowBuilder("broken").add_step("b", broken, retry_count=1000).build()
+        )
+
+        with pytest.raises(RuntimeError, match="still broken"):
+            await workflow.execute({})
+
+        assert workflow.steps[0].attempts == 1001
+
+    def test_retry_delay_backs_off_with_cap(self):
+        """Retry delays double per attempt, are jittered and capped."""
+        for attempt, upper in [(1, 2.0), (3, 8.0), (10, 60.0), (5000, 60.0)]:
+            delay = workflows._retry_delay(attempt)
+            assert upper / 2 <= delay <= upper
+
+    def test_duplicate_step_name_rejected(self):
+        """Two steps with the same name can't be added to one workflow."""
+        builder = WorkflowBuilder("dupes").add_step("a", _recording_step("a", []))
+
+        with pytest.raises(ValueError, match="Duplicate step name 'a'"):
+            builder.add_step("a", _recording_step("a", []))
+
+
+class TestTriggerConditions:
+    """Test cases for workflow trigger conditions."""
+
+    def test_cached_condition_runs_once_per_key(self):
+        """With a cache key, the condition runs once per distinct key."""
+        calls: List[str] = []
+
+        def high_priority(event: Event) -> bool:
+            calls.append(event.source)
+            return event.priority is EventPriority.HIGH
+
+        workflow = (
+            WorkflowBuilder("alerts")
+            .triggered_by(EventTypes.INFRASTRUCTURE_ALERT)
+            .with_condition(high_priority, cache_key=lambda e: e.priority)
+            .build()
+        )
+        high = Event(EventTypes.INFRASTRUCTURE_ALERT, "a", {}, EventPriority.HIGH)
+        low = Event(EventTypes.INFRASTRUCTURE_ALERT, "b", {}, EventPriority.LOW)
+
+        assert workflow.is_triggered_by(high)
+        assert not workflow.is_triggered_by(low)
+        assert workflow.is_triggered_by(
+            Event(EventTypes.INFRASTRUCTURE_ALERT, "c", {}, EventPriority.HIGH)
+        )
+        assert calls == ["a", "b"]
+
+    def test_condition_without_cache_key_runs_every_time(self):
+        """Plain conditions are evaluated for every event."""
+        calls: List[Event] = []
+        workflow = (
+            WorkflowBuilder("all")
+            .triggered_by(EventTypes.CODE_COMMIT)
+            .with_condition(lambda e: calls.append(e) is None)
+            .build()
+        )
+
+        for _ in range(3):
+            assert workflow.is_triggered_by(Event(EventTypes.CODE_COMMIT, "t", {}))
+        assert len(calls) == 3